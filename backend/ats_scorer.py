@@ -0,0 +1,158 @@
+import re
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from skills import default_skill_matcher
+
+# Words that never make useful ATS keywords on their own
+STOPWORDS = frozenset("""
+a about above after again all also an and any are as at be been being below between both but by can
+could did do does doing down during each etc few for from further had has have having he her here
+his how i if in into is it its itself just may me more most must my no nor not of off on once only
+or other our ours out over own per same she should so some such than that the their them then there
+these they this those through to too under until up upon us very via was we were what when where
+which while who whom why will with within without would you your yours
+""".split())
+
+# Generic job-posting vocabulary that carries little signal for matching
+FILLER_WORDS = frozenset("""
+ability able background candidate candidates company demonstrated environment excellent experience
+experienced familiarity good great hands-on help hiring ideal including job join knowledge looking need
+needs new opportunity plus position preferred proficiency proficient proven required requirements
+responsibilities role seeking skills solid strong team teams understanding use using work working year years
+""".split())
+
+# Tokens keep characters used in tech names such as c++, c#, node.js and ci/cd
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+# Phrases never span punctuation or list separators
+CLAUSE_SPLIT_PATTERN = re.compile(r"[\n,;:!?()\[\]|•·]+|\.(?:\s+|$)|\s-\s")
+EMAIL_PATTERN = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+SECTION_PATTERN = re.compile(r"^\s*(experience|work history|employment|education|skills|technical skills)\b", re.IGNORECASE | re.MULTILINE)
+
+MAX_PHRASE_WORDS = 3
+MAX_KEYWORDS = 25
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+def _is_break(token: str) -> bool:
+    return token in STOPWORDS or token in FILLER_WORDS or token.isdigit()
+
+def extract_phrases(text: str, max_words: int = MAX_PHRASE_WORDS) -> List[str]:
+    """
+    Split text into candidate keyword phrases.
+
+    Phrases are runs of content words between punctuation, stopwords and generic
+    job-posting words. Runs longer than max_words are broken into single words.
+    """
+    phrases = []
+    for clause in CLAUSE_SPLIT_PATTERN.split(text):
+        run: List[str] = []
+        for token in tokenize(clause) + [""]:
+            if token and not _is_break(token):
+                run.append(token)
+                continue
+            if 0 < len(run) <= max_words:
+                phrases.append(" ".join(run))
+            elif run:
+                phrases.extend(run)
+            run = []
+    return phrases
+
+def _clauses(text: str) -> List[List[str]]:
+    return [tokenize(clause) for clause in CLAUSE_SPLIT_PATTERN.split(text) if clause.strip()]
+
+def score_resume(resume_text: str, job_description: str, max_keywords: int = MAX_KEYWORDS) -> Dict[str, Any]:
+    """
+    Score a resume against a job description without calling the model.
+
+    Keywords are the job description's candidate phrases weighted by frequency
+    and IDF, with document frequency taken over the clauses of both texts so
+    boilerplate that appears everywhere is down-weighted. The score blends
+    weighted keyword coverage with the TF-IDF cosine similarity of the two texts.
+
+    Args:
+        resume_text: The resume text
+        job_description: The job description text
+        max_keywords: How many job description keywords to check
+
+    Returns:
+        A dict with score (0-100), matching_keywords, missing_keywords and similarity
+    """
+    resume_clauses = _clauses(resume_text)
+    jd_clauses = _clauses(job_description)
+    resume_tokens = [t for clause in resume_clauses for t in clause if not _is_break(t)]
+    jd_tokens = [t for clause in jd_clauses for t in clause if not _is_break(t)]
+    phrases = extract_phrases(job_description)
+    if not jd_tokens or not phrases:
+        return {"score": 0, "matching_keywords": [], "missing_keywords": [], "similarity": 0.0}
+
+    vocabulary = sorted(set(resume_tokens) | set(jd_tokens))
+    index = {token: i for i, token in enumerate(vocabulary)}
+
+    resume_tf = np.bincount([index[t] for t in resume_tokens], minlength=len(vocabulary)).astype(float)
+    jd_tf = np.bincount([index[t] for t in jd_tokens], minlength=len(vocabulary)).astype(float)
+
+    clauses = resume_clauses + jd_clauses
+    doc_freq = np.zeros(len(vocabulary))
+    for clause in clauses:
+        doc_freq[[index[t] for t in set(clause) if t in index]] += 1
+    idf = np.log((1 + len(clauses)) / (1 + doc_freq)) + 1
+
+    # Sublinear term frequency so one repeated word doesn't dominate
+    resume_vec = np.log1p(resume_tf) * idf
+    jd_vec = np.log1p(jd_tf) * idf
+    norms = np.linalg.norm(resume_vec) * np.linalg.norm(jd_vec)
+    similarity = float(resume_vec @ jd_vec / norms) if norms else 0.0
+
+    # Rank unique phrases by how often they occur times the mean IDF of their words
+    counts = Counter(phrases)
+    unique_phrases = list(counts)
+    phrase_counts = np.array([counts[p] for p in unique_phrases], dtype=float)
+    phrase_idf = np.array([idf[[index[w] for w in p.split()]].mean() for p in unique_phrases])
+    phrase_weights = np.log1p(phrase_counts) * phrase_idf
+    top = np.argsort(-phrase_weights, kind="stable")[:max_keywords]
+    keywords = [unique_phrases[i] for i in top]
+    weights = phrase_weights[top]
+
+    # A phrase matches if it appears verbatim or names a skill the resume lists under
+    # another synonym (nodejs / Node.js); partially present phrases earn partial credit
+    resume_joined = " " + " | ".join(" ".join(clause) for clause in resume_clauses) + " "
+    resume_vocab = set(resume_tokens)
+    skills = default_skill_matcher()
+    resume_skills = set(skills.find(resume_text))
+    full = np.array([f" {k} " in resume_joined or skills.canonical(k) in resume_skills for k in keywords])
+    partial = np.array([sum(w in resume_vocab for w in k.split()) / len(k.split()) for k in keywords])
+    credit = np.where(full, 1.0, 0.5 * partial)
+    coverage = float(weights @ credit / weights.sum())
+
+    score = int(round(100 * np.clip(0.75 * coverage + 0.25 * similarity, 0, 1)))
+    return {
+        "score": score,
+        "matching_keywords": [k for k, matched in zip(keywords, full) if matched],
+        "missing_keywords": [k for k, matched in zip(keywords, full) if not matched],
+        "similarity": round(similarity, 4)
+    }
+
+def local_feedback(resume_text: str, missing_keywords: List[str]) -> Tuple[str, str]:
+    """Return rule-based formatting issues and recommendations for local mode"""
+    issues = []
+    if not EMAIL_PATTERN.search(resume_text):
+        issues.append("No email address was found.")
+    if not SECTION_PATTERN.search(resume_text):
+        issues.append("Standard section headings (Experience, Education, Skills) were not detected.")
+    if len(resume_text.split()) < 150:
+        issues.append("The resume is very short, so ATS systems have little content to match.")
+
+    if missing_keywords:
+        recommendations = (
+            "Add these job description keywords where they accurately describe your experience: "
+            + ", ".join(missing_keywords[:10]) + "."
+        )
+    else:
+        recommendations = "The resume covers the main keywords of the job description."
+
+    return " ".join(issues) or "No specific issues detected", recommendations
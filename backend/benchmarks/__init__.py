@@ -0,0 +1,6 @@
+"""
+Benchmarks for the backend.
+
+Run from the backend directory with ``python -m benchmarks``; see
+docs/benchmarks.md for the options.
+"""
@@ -0,0 +1,67 @@
+import argparse
+import logging
+import shutil
+import sys
+
+from benchmarks.endpoints import configure_offline_environment
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the backend offline")
+    parser.add_argument("suite", nargs="?", choices=["micro", "endpoints", "database", "all"], default="all")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per benchmark")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent requests in endpoint benchmarks")
+    parser.add_argument("--corpus-size", type=int, default=20, help="Synthetic resumes per micro-benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    parser.add_argument("--fake-latency", type=float, default=0.0, help="Seconds the fake model takes per call")
+    parser.add_argument("--only", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--save", metavar="PATH", help="Write the results as JSON, e.g. as a new baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown against the baseline, as a fraction")
+    args = parser.parse_args()
+
+    resume_store_dir = configure_offline_environment(args.fake_latency)
+    # Request and extraction logging would swamp the results
+    logging.disable(logging.INFO)
+    try:
+        return _run(args)
+    finally:
+        shutil.rmtree(resume_store_dir, ignore_errors=True)
+
+def _run(args: argparse.Namespace) -> int:
+    # Imported after the environment is set, since they load the backend configuration
+    from benchmarks.harness import compare, format_table, load_results, run_metadata, save_results
+    from benchmarks.micro import run_micro
+    from benchmarks.endpoints import run_endpoints
+    from benchmarks.database import run_database
+
+    results = {}
+    if args.suite in ("micro", "all"):
+        results.update(run_micro(args.iterations, args.corpus_size, args.seed, args.only))
+    if args.suite in ("endpoints", "all"):
+        results.update(run_endpoints(args.iterations, args.concurrency, args.seed, args.only))
+    if args.suite in ("database", "all"):
+        results.update(run_database(args.iterations, args.concurrency, args.seed, args.only))
+
+    baseline = load_results(args.compare) if args.compare else None
+    print(format_table(results, baseline))
+
+    if args.save:
+        metadata = run_metadata(
+            suite=args.suite, iterations=args.iterations, concurrency=args.concurrency,
+            corpus_size=args.corpus_size, seed=args.seed, fake_latency=args.fake_latency
+        )
+        save_results(args.save, metadata, results)
+        print(f"\nSaved results to {args.save}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+import random
+import textwrap
+from typing import Dict, List, NamedTuple
+
+FIRST_NAMES = ["Jane", "John", "Priya", "Wei", "Carlos", "Amara", "Lukas", "Sofia", "Kenji", "Fatima"]
+LAST_NAMES = ["Doe", "Smith", "Sharma", "Chen", "Garcia", "Okafor", "Muller", "Rossi", "Tanaka", "Haddad"]
+CITIES = ["Austin, TX 78701", "Seattle, WA 98101", "Denver, CO 80202", "Boston, MA 02108", "Chicago, IL 60601"]
+TITLES = [
+    "Software Engineer", "Senior Software Engineer", "Backend Developer", "Data Engineer",
+    "Frontend Developer", "DevOps Engineer", "Machine Learning Engineer", "Product Manager"
+]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Tech", "Hooli", "Pied Piper"]
+SCHOOLS = ["University of Texas", "University of Washington", "Institute of Technology", "College of Engineering"]
+DEGREES = ["Bachelor of Science in Computer Science", "Master of Science in Data Science", "B.Tech in Information Technology"]
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "SQL", "React", "Node.js", "Django", "Flask", "FastAPI",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "PostgreSQL", "MongoDB", "Redis", "Kafka",
+    "Spark", "Airflow", "Pandas", "TensorFlow", "PyTorch", "Machine Learning", "CI/CD", "Git", "Agile", "Scrum"
+]
+VERBS = ["Built", "Designed", "Led", "Migrated", "Optimized", "Automated", "Maintained", "Scaled", "Shipped", "Refactored"]
+DUTIES = ["build", "design", "own", "migrate", "optimize", "automate", "maintain", "scale"]
+OBJECTS = [
+    "a payments service", "the data pipeline", "internal dashboards", "a recommendation engine",
+    "the CI pipeline", "customer-facing APIs", "a search backend", "the monitoring stack"
+]
+OUTCOMES = [
+    "reducing latency by 40%", "serving 2M requests per day", "cutting cloud costs by 25%",
+    "improving test coverage to 90%", "halving deployment time", "supporting 50k daily users"
+]
+
+class Sample(NamedTuple):
+    """One synthetic resume with a job description to score it against"""
+    resume: str
+    job_description: str
+
+def generate_resume(seed: int, target_chars: int = 3000) -> str:
+    """
+    Return a synthetic plain-text resume of roughly target_chars characters.
+
+    The same seed always produces the same resume. Experience entries are added
+    until the target size is reached, so larger targets give longer histories.
+    """
+    rng = random.Random(seed)
+    graduated = 2004 + rng.randint(0, 15)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    email = name.lower().replace(" ", ".") + "@example.com"
+    lines = [
+        name,
+        f"{email} | (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)} | {rng.choice(CITIES)}",
+        "",
+        "SUMMARY",
+        f"{rng.choice(TITLES)} with {rng.randint(2, 15)} years of experience in "
+        + ", ".join(rng.sample(SKILLS, 4)) + ".",
+        "",
+        "SKILLS",
+        " • ".join(rng.sample(SKILLS, rng.randint(8, 14))),
+        "",
+        "EDUCATION",
+        f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)} {graduated - 4} - {graduated}",
+        "",
+        "EXPERIENCE"
+    ]
+    experience: List[str] = []
+    year = 2024
+    length = sum(len(line) + 1 for line in lines)
+    while length < target_chars:
+        start = year - rng.randint(1, 4)
+        entry = [f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)} ({start} - {year})"]
+        for _ in range(rng.randint(2, 5)):
+            entry.append(
+                f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} with {rng.choice(SKILLS)} and "
+                f"{rng.choice(SKILLS)}, {rng.choice(OUTCOMES)}"
+            )
+        experience.extend(entry)
+        length += sum(len(line) + 1 for line in entry)
+        year = start if start > 1980 else 2024
+    return "\n".join(lines + experience)
+
+def generate_job_description(seed: int, target_chars: int = 1500) -> str:
+    """Return a synthetic job description of roughly target_chars characters"""
+    rng = random.Random(seed)
+    required = rng.sample(SKILLS, 6)
+    lines = [
+        f"{rng.choice(TITLES)} - {rng.choice(COMPANIES)}",
+        f"Location: {rng.choice(CITIES)}",
+        "",
+        f"We are looking for an engineer with strong {required[0]} and {required[1]} experience.",
+        "Requirements:",
+        *(f"- {rng.randint(1, 5)}+ years of {skill}" for skill in required[2:])
+    ]
+    length = sum(len(line) + 1 for line in lines)
+    while length < target_chars:
+        line = (
+            f"You will {rng.choice(DUTIES)} {rng.choice(OBJECTS)} using {rng.choice(SKILLS)}, "
+            f"{rng.choice(OUTCOMES)}."
+        )
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+def generate_corpus(count: int, seed: int = 0, resume_chars: int = 3000, job_description_chars: int = 1500) -> List[Sample]:
+    """Return count deterministic resume / job description pairs"""
+    return [
+        Sample(
+            generate_resume(seed * 100003 + i, resume_chars),
+            generate_job_description(seed * 100003 + i, job_description_chars)
+        )
+        for i in range(count)
+    ]
+
+def generate_job_listings(seed: int, count: int = 10) -> List[Dict[str, str]]:
+    """Return count synthetic job_finder results, shaped like the model's JSON output"""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        title, company = rng.choice(TITLES), rng.choice(COMPANIES)
+        jobs.append({
+            "job_title": title,
+            "company_name": company,
+            "location": rng.choice(CITIES) + (" (Remote)" if rng.random() < 0.3 else ""),
+            "job_description": generate_job_description(seed * 1009 + i, 300),
+            "required_qualifications": f"Bachelor's degree and {rng.randint(1, 8)}+ years of experience",
+            "experience_required": f"{rng.randint(1, 4)}-{rng.randint(5, 10)}",
+            "skills_required": ", ".join(rng.sample(SKILLS, 5)),
+            "estimated_salary_range": f"${rng.randint(80, 140)}k - ${rng.randint(150, 220)}k",
+            "application_link": f"https://www.linkedin.com/jobs/view/{rng.randint(10 ** 9, 10 ** 10)}"
+        })
+    return jobs
+
+def _pdf_string(line: str) -> str:
+    line = line.encode("cp1252", "replace").decode("cp1252")
+    return "(" + line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+def text_to_pdf(text: str, lines_per_page: int = 50, chars_per_line: int = 95) -> bytes:
+    """
+    Render plain text as a minimal PDF, one Helvetica text line per line.
+
+    Written by hand so benchmarks need nothing beyond the backend's own
+    dependencies; PyPDF2 extracts the lines back as text.
+    """
+    lines: List[str] = []
+    for line in text.split("\n"):
+        lines.extend(textwrap.wrap(line, chars_per_line) or [""])
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    font_id = 3 + 2 * len(pages)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        (
+            "<< /Type /Pages /Kids [" + " ".join(f"{3 + 2 * i} 0 R" for i in range(len(pages)))
+            + f"] /Count {len(pages)} >>"
+        ).encode("latin-1")
+    ]
+    for i, page in enumerate(pages):
+        objects.append((
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>"
+        ).encode("latin-1"))
+        content = "BT /F1 10 Tf 14 TL 40 760 Td " + " ".join(f"{_pdf_string(line)} Tj T*" for line in page) + " ET"
+        stream = content.encode("cp1252")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(output)
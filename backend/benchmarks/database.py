@@ -0,0 +1,88 @@
+import asyncio
+import itertools
+import os
+import shutil
+import sqlite3
+import tempfile
+from typing import Any, Awaitable, Callable, Dict
+
+from storage import ApplicationStore, INSERT_APPLICATION, INSERT_RESUME, compact_json, parsed_resume_key, serialize_resume
+
+from benchmarks.corpus import generate_job_listings
+from benchmarks.harness import measure_async
+
+def _record_per_connection(db_path: str) -> Callable[[Dict[str, Any], Dict[str, Any]], None]:
+    """
+    The write path before the application store: a new connection, one insert
+    and one commit per application, run on the event loop in the default
+    rollback-journal mode.
+    """
+    def record(job_data: Dict[str, Any], resume_data: Dict[str, Any]):
+        resume_json = serialize_resume(resume_data)
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute('PRAGMA foreign_keys = ON')
+            conn.execute(INSERT_RESUME, (parsed_resume_key(resume_json), resume_json, "2024-01-01T00:00:00"))
+            conn.execute(INSERT_APPLICATION, (
+                job_data["job_title"], job_data["company_name"], job_data["application_link"],
+                "2024-01-01T00:00:00", "initiated", parsed_resume_key(resume_json), compact_json(job_data)
+            ))
+            conn.commit()
+        finally:
+            conn.close()
+
+    return record
+
+def _insert_benchmark(record: Callable[[Dict[str, Any], Dict[str, Any]], Awaitable[Any]], seed: int) -> Callable[[int], Awaitable[Any]]:
+    jobs = generate_job_listings(seed, 50)
+    resumes = [{"skills": job["skills_required"], "summary": job["job_description"]} for job in jobs[:5]]
+    # Every application needs a new URL, including the warmup calls
+    urls = itertools.count()
+
+    async def insert(i: int):
+        job = dict(jobs[i % len(jobs)], application_link=f"https://jobs.example.com/{next(urls)}")
+        await record(job, resumes[i % len(resumes)])
+
+    return insert
+
+async def _run(iterations: int, concurrency: int, seed: int, only: str) -> Dict[str, Dict[str, float]]:
+    directory = tempfile.mkdtemp(prefix="applications_bench_")
+    results = {}
+    try:
+        def store_path(name: str) -> str:
+            return os.path.join(directory, f"{name}.db")
+
+        # One row per call, so throughput_per_s is rows per second
+        name = "applications_insert_per_connection"
+        if only in name:
+            path = store_path(name)
+            # Creates the schema; the benchmark itself doesn't use the store
+            ApplicationStore(path).close()
+            conn = sqlite3.connect(path)
+            conn.execute('PRAGMA journal_mode = DELETE')
+            conn.close()
+            record = _record_per_connection(path)
+
+            async def record_blocking(job_data, resume_data):
+                record(job_data, resume_data)
+
+            results[name] = await measure_async(_insert_benchmark(record_blocking, seed), iterations, concurrency)
+
+        for synchronous in ("NORMAL", "FULL"):
+            for label, batch_size in (("commit_per_row", 1), ("group_commit", 100)):
+                name = f"applications_insert_{label}_{synchronous.lower()}"
+                if only not in name:
+                    continue
+                store = ApplicationStore(store_path(name), synchronous=synchronous, batch_size=batch_size)
+                try:
+                    results[name] = await measure_async(_insert_benchmark(store.add_application, seed), iterations, concurrency)
+                    results[name]["rows_per_batch"] = store.stats()["rows_per_batch"]
+                finally:
+                    store.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return results
+
+def run_database(iterations: int = 200, concurrency: int = 8, seed: int = 0, only: str = "") -> Dict[str, Dict[str, float]]:
+    """Run the application write benchmarks against temporary databases"""
+    return asyncio.run(_run(iterations, concurrency, seed, only))
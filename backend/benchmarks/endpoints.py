@@ -0,0 +1,85 @@
+import asyncio
+import itertools
+import os
+import tempfile
+from typing import Any, Awaitable, Callable, Dict
+
+from benchmarks.corpus import generate_corpus, generate_resume, text_to_pdf
+from benchmarks.harness import measure_async
+
+def configure_offline_environment(fake_latency: float = 0.0) -> str:
+    """
+    Point the app at the fake model backend with no quota, cache or saved state.
+
+    Must run before the backend modules are imported, as config reads the
+    environment at import time. Returns the temporary directory holding the
+    resume store and the applications database.
+    """
+    resume_store_dir = tempfile.mkdtemp(prefix="resume_store_bench_")
+    os.environ.update({
+        "LLM_BACKEND": "fake",
+        "LLM_FAKE_LATENCY_SECONDS": str(fake_latency),
+        "LLM_CACHE_ENABLED": "false",
+        "LLM_REQUESTS_PER_MINUTE": "0",
+        "LLM_TOKENS_PER_MINUTE": "0",
+        "RESUME_STORE_DIR": resume_store_dir,
+        "APPLICATIONS_DB_PATH": os.path.join(resume_store_dir, "applications.db")
+    })
+    return resume_store_dir
+
+def endpoint_benchmarks(client, resume_id: str, job_description: str) -> Dict[str, Callable[[int], Awaitable[Any]]]:
+    """Return the endpoint benchmarks by name; each makes one request"""
+    # Every upload is a resume the store hasn't seen, so each one is extracted and parsed
+    upload_seeds = itertools.count(10 ** 6)
+
+    async def post(path: str, data: Dict[str, Any], stream: bool = False):
+        if stream:
+            async with client.stream("POST", path, data=data) as response:
+                async for _ in response.aiter_bytes():
+                    pass
+        else:
+            response = await client.post(path, data=data)
+        response.raise_for_status()
+
+    async def upload_resume(i: int):
+        pdf = text_to_pdf(generate_resume(next(upload_seeds)))
+        response = await client.post("/resumes", files={"resume": ("resume.pdf", pdf, "application/pdf")})
+        response.raise_for_status()
+
+    ats = {"resume_id": resume_id, "job_description": job_description, "use_cache": "false"}
+    jobs = {"resume_id": resume_id, "experience_years": "5", "location": "Remote", "use_cache": "false"}
+    return {
+        "upload_resume_pdf": upload_resume,
+        "ats_score_local": lambda i: post("/tools/ats_score_checker", {**ats, "mode": "local"}),
+        "ats_score_llm": lambda i: post("/tools/ats_score_checker", {**ats, "mode": "llm"}),
+        "job_finder": lambda i: post("/tools/job_finder", jobs),
+        "job_finder_stream": lambda i: post("/tools/job_finder/stream", jobs, stream=True),
+        "cover_letter_generator": lambda i: post("/tools/cover_letter_generator", {**ats})
+    }
+
+async def _run(iterations: int, concurrency: int, seed: int, only: str) -> Dict[str, Dict[str, float]]:
+    import httpx
+    import main
+
+    sample = generate_corpus(1, seed)[0]
+    transport = httpx.ASGITransport(app=main.app)
+    results = {}
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=60) as client:
+            response = await client.post(
+                "/resumes",
+                files={"resume": ("resume.pdf", text_to_pdf(sample.resume), "application/pdf")}
+            )
+            response.raise_for_status()
+            resume_id = response.json()["resume_id"]
+
+            for name, func in endpoint_benchmarks(client, resume_id, sample.job_description).items():
+                if only in name:
+                    results[f"endpoint_{name}"] = await measure_async(func, iterations, concurrency)
+    finally:
+        main.pdf_extractor.shutdown()
+    return results
+
+def run_endpoints(iterations: int = 100, concurrency: int = 8, seed: int = 0, only: str = "") -> Dict[str, Dict[str, float]]:
+    """Run the endpoint benchmarks in-process against the fake model backend"""
+    return asyncio.run(_run(iterations, concurrency, seed, only))
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import platform
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+
+def summarize(latencies: List[float], wall_seconds: float) -> Dict[str, float]:
+    """Return latency percentiles in milliseconds and throughput per second"""
+    samples = np.array(latencies) * 1000
+    return {
+        "iterations": len(latencies),
+        "p50_ms": round(float(np.percentile(samples, 50)), 4),
+        "p95_ms": round(float(np.percentile(samples, 95)), 4),
+        "p99_ms": round(float(np.percentile(samples, 99)), 4),
+        "mean_ms": round(float(samples.mean()), 4),
+        "throughput_per_s": round(len(latencies) / wall_seconds, 2) if wall_seconds else 0.0
+    }
+
+def measure(func: Callable[[int], Any], iterations: int, warmup: int = 3) -> Dict[str, float]:
+    """
+    Time func(i) for i in range(iterations) after a few untimed warmup calls.
+
+    The iteration number lets benchmarks cycle through a corpus.
+    """
+    for i in range(min(warmup, iterations)):
+        func(i)
+
+    latencies = []
+    started = time.perf_counter()
+    for i in range(iterations):
+        call_started = time.perf_counter()
+        func(i)
+        latencies.append(time.perf_counter() - call_started)
+    return summarize(latencies, time.perf_counter() - started)
+
+async def measure_async(
+    func: Callable[[int], Awaitable[Any]],
+    iterations: int,
+    concurrency: int = 1,
+    warmup: int = 3
+) -> Dict[str, float]:
+    """Time iterations calls of func(i), at most concurrency of them at once"""
+    for i in range(min(warmup, iterations)):
+        await func(i)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def timed(i: int):
+        async with semaphore:
+            call_started = time.perf_counter()
+            await func(i)
+            latencies.append(time.perf_counter() - call_started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(iterations)))
+    result = summarize(latencies, time.perf_counter() - started)
+    result["concurrency"] = concurrency
+    return result
+
+def run_metadata(**settings: Any) -> Dict[str, Any]:
+    """Describe the machine and settings a run was made with"""
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "settings": settings
+    }
+
+def save_results(path: str, metadata: Dict[str, Any], results: Dict[str, Dict[str, float]]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"metadata": metadata, "results": results}, f, indent=2)
+        f.write("\n")
+
+def load_results(path: str) -> Dict[str, Dict[str, float]]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float = 0.2,
+    metrics: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Return a description of every benchmark metric that regressed.
+
+    A metric regresses when it is more than threshold (a fraction) slower than
+    in the baseline. Benchmarks missing from either side are skipped.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in metrics or ["p50_ms", "p95_ms"]:
+            before, after = previous.get(metric), current.get(metric)
+            if before and after and after > before * (1 + threshold):
+                regressions.append(f"{name} {metric}: {before:.3f} -> {after:.3f} ({(after / before - 1) * 100:+.0f}%)")
+    return regressions
+
+def format_table(results: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+    """Format results as a text table, with the p50 change against a baseline if given"""
+    width = max([34] + [len(name) for name in results])
+    header = f"{'benchmark':<{width}} {'n':>6} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'ops/s':>10}"
+    if baseline is not None:
+        header += f" {'p50 vs base':>12}"
+    rows = [header, "-" * len(header)]
+    for name, result in results.items():
+        row = (
+            f"{name:<{width}} {result['iterations']:>6} {result['p50_ms']:>10.3f} {result['p95_ms']:>10.3f} "
+            f"{result['p99_ms']:>10.3f} {result['throughput_per_s']:>10.1f}"
+        )
+        if baseline is not None:
+            previous = baseline.get(name, {}).get("p50_ms")
+            row += f" {(result['p50_ms'] / previous - 1) * 100:>+11.0f}%" if previous else f" {'-':>12}"
+        rows.append(row)
+    return "\n".join(rows)
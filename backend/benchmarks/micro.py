@@ -0,0 +1,63 @@
+import json
+from typing import Any, Callable, Dict
+
+from ats_scorer import score_resume
+from resume_parser import ResumeParser
+from json_stream import JSONArrayStreamParser
+from schemas import JobListing
+from skills import default_skill_matcher
+from structured_output import StructuredOutputParser
+from utils import extract_text_from_pdf
+
+from benchmarks.corpus import generate_corpus, generate_job_listings, text_to_pdf
+from benchmarks.harness import measure
+
+# Streamed model output arrives in pieces of roughly this many characters
+STREAM_CHUNK_CHARS = 64
+
+def _chunks(text: str, size: int = STREAM_CHUNK_CHARS):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+def micro_benchmarks(corpus_size: int = 20, seed: int = 0) -> Dict[str, Callable[[int], Any]]:
+    """Return the micro-benchmarks by name; each takes an iteration number"""
+    corpus = generate_corpus(corpus_size, seed)
+    long_corpus = generate_corpus(max(2, corpus_size // 4), seed + 1, resume_chars=30000)
+    small_pdfs = [text_to_pdf(sample.resume) for sample in corpus]
+    large_pdfs = [text_to_pdf(sample.resume) for sample in long_corpus]
+    resume_texts = [extract_text_from_pdf(pdf) for pdf in small_pdfs]
+
+    parser = ResumeParser()
+    matcher = default_skill_matcher()
+    structured_output = StructuredOutputParser()
+
+    jobs = generate_job_listings(seed, 10)
+    strict_json = json.dumps(jobs)
+    # Fenced, with a trailing comma and cut off mid-element: exercises the repair pass
+    broken_json = "```json\n" + json.dumps(jobs, indent=2)[:-200].replace("}", "},", 1) + "\n```"
+    stream_chunks = _chunks(json.dumps(jobs, indent=2))
+
+    def stream_parse(i: int):
+        stream = JSONArrayStreamParser()
+        items = []
+        for chunk in stream_chunks:
+            items.extend(stream.feed(chunk))
+        return items
+
+    return {
+        "pdf_extract_small": lambda i: extract_text_from_pdf(small_pdfs[i % len(small_pdfs)]),
+        "pdf_extract_large": lambda i: extract_text_from_pdf(large_pdfs[i % len(large_pdfs)]),
+        "parse_resume": lambda i: parser.parse_resume(resume_texts[i % len(resume_texts)]),
+        "skills_match": lambda i: matcher.find(resume_texts[i % len(resume_texts)]),
+        "ats_local_score": lambda i: score_resume(corpus[i % len(corpus)].resume, corpus[i % len(corpus)].job_description),
+        "job_finder_parse": lambda i: structured_output.parse(strict_json, JobListing, "job_finder", many=True),
+        "job_finder_parse_repair": lambda i: structured_output.parse(broken_json, JobListing, "job_finder", many=True),
+        "job_finder_stream_parse": stream_parse
+    }
+
+def run_micro(iterations: int = 200, corpus_size: int = 20, seed: int = 0, only: str = "") -> Dict[str, Dict[str, float]]:
+    """Run every micro-benchmark whose name contains only"""
+    results = {}
+    for name, func in micro_benchmarks(corpus_size, seed).items():
+        if only in name:
+            results[name] = measure(func, iterations)
+    return results
@@ -0,0 +1,140 @@
+"""
+Parse a directory of resumes in parallel.
+
+    python bulk_parse.py resumes/ --output parsed.ndjson
+
+Every result is appended to the output as one JSON line as soon as it is
+ready, and the output doubles as the checkpoint: running the same command
+again skips the files already in it, so an interrupted run continues where it
+stopped.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import zipfile
+from typing import Iterable, Iterator, List, Set, Tuple
+
+from config import BULK_PARSE_WORKERS, PDF_MAX_CHARS
+from resume_parser import ResumeParser
+
+logger = logging.getLogger(__name__)
+
+# Files in a directory or archive that are parsed as resumes
+RESUME_EXTENSIONS = (".pdf", ".txt")
+
+class ArchiveError(Exception):
+    """Raised when an uploaded archive can't be processed"""
+
+def _is_resume_file(name: str) -> bool:
+    base = os.path.basename(name)
+    # Skips macOS metadata such as __MACOSX/ entries and ._ resource forks
+    return base.lower().endswith(RESUME_EXTENSIONS) and not base.startswith(".") and "__MACOSX" not in name
+
+def archive_entries(zip_file: zipfile.ZipFile, max_files: int, max_file_bytes: int) -> Tuple[List[zipfile.ZipInfo], List[zipfile.ZipInfo]]:
+    """
+    Return the resume files in a zip archive, split into those to parse and those that are too large.
+
+    Raises:
+        ArchiveError: If the archive has no resumes or more than max_files of them
+    """
+    entries = [info for info in zip_file.infolist() if not info.is_dir() and _is_resume_file(info.filename)]
+    if not entries:
+        raise ArchiveError("The archive contains no PDF or text resumes")
+    if len(entries) > max_files:
+        raise ArchiveError(f"The archive contains {len(entries)} resumes; the maximum is {max_files}")
+    # The uncompressed size is checked before anything is decompressed
+    return (
+        [info for info in entries if info.file_size <= max_file_bytes],
+        [info for info in entries if info.file_size > max_file_bytes]
+    )
+
+def read_archive(zip_file: zipfile.ZipFile, entries: Iterable[zipfile.ZipInfo]) -> Iterator[Tuple[str, bytes]]:
+    """Yield (filename, content) for archive entries, reading each one only when it is needed"""
+    for info in entries:
+        yield info.filename, zip_file.read(info)
+
+def find_resumes(directory: str) -> List[str]:
+    """Return the paths of the resume files under a directory, relative to it and sorted"""
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.relpath(os.path.join(root, name), directory)
+            if _is_resume_file(path):
+                paths.append(path)
+    return paths
+
+def read_directory(directory: str, paths: Iterable[str]) -> Iterator[Tuple[str, bytes]]:
+    """Yield (relative path, content) for files under a directory"""
+    for path in paths:
+        with open(os.path.join(directory, path), "rb") as f:
+            yield path, f.read()
+
+def load_checkpoint(output_path: str) -> Set[str]:
+    """
+    Return the files already recorded in an output file.
+
+    A last line cut off by an interruption is removed so the run can append
+    after it.
+    """
+    done: Set[str] = set()
+    if not os.path.exists(output_path):
+        return done
+
+    valid_bytes = 0
+    with open(output_path, "rb") as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)["filename"])
+            except (ValueError, KeyError):
+                break
+            valid_bytes += len(line)
+    if valid_bytes < os.path.getsize(output_path):
+        logger.warning(f"Discarding an incomplete last line in {output_path}")
+        with open(output_path, "rb+") as f:
+            f.truncate(valid_bytes)
+    return done
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Extract and parse every resume in a directory in parallel")
+    parser.add_argument("directory", help="Directory searched recursively for .pdf and .txt resumes")
+    parser.add_argument("--output", "-o", default="parsed_resumes.ndjson", help="NDJSON results file, also used as the checkpoint")
+    parser.add_argument("--workers", type=int, default=BULK_PARSE_WORKERS, help="Worker processes (0 parses in this process)")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and parse every file again")
+    parser.add_argument("--include-text", action="store_true", help="Include the extracted text in each result")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if not os.path.isdir(args.directory):
+        logger.error(f"Not a directory: {args.directory}")
+        return 2
+
+    if args.restart and os.path.exists(args.output):
+        os.remove(args.output)
+    done = load_checkpoint(args.output)
+    paths = find_resumes(args.directory)
+    remaining = [path for path in paths if path not in done]
+    logger.info(f"Found {len(paths)} resumes, {len(paths) - len(remaining)} already in {args.output}")
+
+    failed = 0
+    results = ResumeParser().parse_many(read_directory(args.directory, remaining), workers=args.workers, max_chars=PDF_MAX_CHARS)
+    with open(args.output, "a", encoding="utf-8") as output:
+        for count, result in enumerate(results, start=1):
+            if "error" in result:
+                failed += 1
+                logger.warning(f"Could not parse {result['filename']}: {result['error']}")
+            if not args.include_text:
+                result.pop("text", None)
+            output.write(json.dumps(result) + "\n")
+            # Flushed per result so an interrupted run loses at most the line being written
+            output.flush()
+            if count % 50 == 0 or count == len(remaining):
+                logger.info(f"Parsed {count} of {len(remaining)} resumes")
+
+    logger.info(f"Done: {len(remaining) - failed} parsed, {failed} failed, results in {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 import os
+from typing import Dict
 from dotenv import load_dotenv
 import logging
 
@@ -13,7 +14,16 @@ load_dotenv()
 # Try to get from environment variable first, then fallback to the direct value
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
-if not GEMINI_API_KEY:
+# Model backend: "gemini", "fake" (canned offline responses), "record" (call Gemini
+# and save responses) or "replay" (answer from saved responses only)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini").lower()
+LLM_RECORDINGS_DIR = os.getenv("LLM_RECORDINGS_DIR", os.path.join(os.path.dirname(__file__), "llm_recordings"))
+LLM_FAKE_LATENCY_SECONDS = float(os.getenv("LLM_FAKE_LATENCY_SECONDS", "0.5"))
+LLM_FAKE_RESPONSES_PATH = os.getenv("LLM_FAKE_RESPONSES_PATH")
+
+if LLM_BACKEND in ("fake", "replay"):
+    logger.info(f"Using the offline {LLM_BACKEND} model backend; GEMINI_API_KEY is not required.")
+elif not GEMINI_API_KEY:
     logger.error("GEMINI_API_KEY environment variable not set.")
     logger.error("Please create a .env file in the backend directory with your API key.")
     logger.error("Example: GEMINI_API_KEY=your-api-key-here")
@@ -21,6 +31,114 @@ elif GEMINI_API_KEY == "your-api-key-here":
     logger.error("GEMINI_API_KEY is set to the default placeholder value.")
     logger.error("Please replace it with a valid API key from https://makersuite.google.com/app/apikey")
 
+def api_key_missing() -> bool:
+    """Whether the selected backend needs a Gemini API key that isn't configured"""
+    # The record backend calls Gemini too; fake and replay never do
+    return LLM_BACKEND in ("gemini", "record") and (not GEMINI_API_KEY or GEMINI_API_KEY == "your-api-key-here")
+
 # Additional configuration variables can be added here
 MAX_TOKENS = int(os.getenv("MAX_TOKENS", "1024"))
 TEMPERATURE = float(os.getenv("TEMPERATURE", "0.7"))
+
+# Response cache for model calls
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(os.path.dirname(__file__), "llm_cache.db"))
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+
+def _parse_tool_settings(value: str) -> Dict[str, float]:
+    """Parse a "tool=value,tool=value" setting into a dict"""
+    settings = {}
+    for item in value.split(","):
+        if "=" in item:
+            name, number = item.split("=", 1)
+            settings[name.strip()] = float(number)
+    return settings
+
+# Model call concurrency and timeouts
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+LLM_TOOL_CONCURRENCY = int(os.getenv("LLM_TOOL_CONCURRENCY", "4"))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+# Per-tool overrides, e.g. LLM_TOOL_TIMEOUTS="job_finder=120,mcp=20"
+LLM_TOOL_TIMEOUTS = {
+    "ats_score_checker": 60.0,
+    "job_finder": 90.0,
+    "cover_letter_generator": 60.0,
+    "mcp": 30.0,
+    **_parse_tool_settings(os.getenv("LLM_TOOL_TIMEOUTS", ""))
+}
+LLM_TOOL_CONCURRENCY_OVERRIDES = {
+    name: int(limit) for name, limit in _parse_tool_settings(os.getenv("LLM_TOOL_CONCURRENCY_OVERRIDES", "")).items()
+}
+
+# API quota for the request scheduler; 0 disables a limit. Rate-limited calls are
+# retried with exponential backoff and jitter.
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "60"))
+LLM_RATE_LIMIT_BURST = int(os.getenv("LLM_RATE_LIMIT_BURST", "10"))
+LLM_TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", "0"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_BACKOFF_BASE_SECONDS = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "1"))
+LLM_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "30"))
+# Interactive calls admitted in a row before a waiting batch call gets a turn
+LLM_INTERACTIVE_BURST = int(os.getenv("LLM_INTERACTIVE_BURST", "4"))
+
+# Batch ATS scoring limits
+ATS_BATCH_MAX_JOBS = int(os.getenv("ATS_BATCH_MAX_JOBS", "50"))
+ATS_BATCH_CONCURRENCY = int(os.getenv("ATS_BATCH_CONCURRENCY", "4"))
+
+# Default ATS scoring engine: "llm", "local" (in-process, no network) or "hybrid"
+ATS_DEFAULT_MODE = os.getenv("ATS_DEFAULT_MODE", "llm")
+
+# Chat intent routing: confident keyword matches skip the chat model call
+INTENT_CONFIDENCE_THRESHOLD = float(os.getenv("INTENT_CONFIDENCE_THRESHOLD", "0.75"))
+INTENT_LLM_FALLBACK = os.getenv("INTENT_LLM_FALLBACK", "false").lower() in ("1", "true", "yes")
+
+# Input token budgets for prompts; resumes over budget lose low-value sections first
+PROMPT_RESUME_TOKEN_BUDGET = int(os.getenv("PROMPT_RESUME_TOKEN_BUDGET", "3000"))
+PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET = int(os.getenv("PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET", "1500"))
+
+# Uploaded resumes are stored by content hash so tools can be called with a resume_id
+RESUME_STORE_DIR = os.getenv("RESUME_STORE_DIR", os.path.join(os.path.dirname(__file__), "resume_store"))
+RESUME_MEMORY_CACHE_SIZE = int(os.getenv("RESUME_MEMORY_CACHE_SIZE", "128"))
+# Uploaded resumes are personal data: remove them after this many seconds, and the
+# oldest first once the store is larger than this many bytes. 0 disables a limit.
+RESUME_STORE_MAX_AGE_SECONDS = float(os.getenv("RESUME_STORE_MAX_AGE_SECONDS", str(30 * 24 * 3600)))
+RESUME_STORE_MAX_BYTES = int(os.getenv("RESUME_STORE_MAX_BYTES", str(500 * 1024 * 1024)))
+
+# PDF text extraction runs in a process pool so it doesn't block the event loop
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", "2"))
+PDF_TIMEOUT_SECONDS = float(os.getenv("PDF_TIMEOUT_SECONDS", "30"))
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "50"))
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "8"))
+# Extraction stops at the page that brings the text to this many characters (0 for no limit)
+PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "100000"))
+
+# Skills dictionary (canonical name -> synonyms) used to find skills in resumes and job descriptions
+SKILLS_PATH = os.getenv("SKILLS_PATH", os.path.join(os.path.dirname(__file__), "data", "skills.json"))
+
+# Largest accepted resume upload; bigger requests are rejected with 413 before they are read
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+
+# Bulk resume parsing (POST /resumes/bulk and bulk_parse.py); 0 workers parses in the server process
+BULK_PARSE_WORKERS = int(os.getenv("BULK_PARSE_WORKERS", str(os.cpu_count() or 1)))
+BULK_MAX_ARCHIVE_BYTES = int(os.getenv("BULK_MAX_ARCHIVE_BYTES", str(200 * 1024 * 1024)))
+BULK_MAX_FILES = int(os.getenv("BULK_MAX_FILES", "1000"))
+
+# Job applications database; WAL mode lets reads run alongside the single writer thread
+APPLICATIONS_DB_PATH = os.getenv("APPLICATIONS_DB_PATH", os.path.join(os.path.dirname(__file__), "applications.db"))
+APPLICATIONS_DB_READERS = int(os.getenv("APPLICATIONS_DB_READERS", "4"))
+# NORMAL is durable against application crashes in WAL mode; FULL also survives power loss
+APPLICATIONS_DB_SYNCHRONOUS = os.getenv("APPLICATIONS_DB_SYNCHRONOUS", "NORMAL")
+# Application listings are paginated; the JSON fields are only returned when asked for
+APPLICATIONS_PAGE_SIZE = int(os.getenv("APPLICATIONS_PAGE_SIZE", "50"))
+APPLICATIONS_MAX_PAGE_SIZE = int(os.getenv("APPLICATIONS_MAX_PAGE_SIZE", "500"))
+# Application writes are committed in groups: up to this many per transaction,
+# waiting at most this long after the first write for others to join it. With
+# no delay a batch is whatever was queued while the previous one committed.
+APPLICATIONS_DB_BATCH_SIZE = int(os.getenv("APPLICATIONS_DB_BATCH_SIZE", "100"))
+APPLICATIONS_DB_BATCH_DELAY_MS = float(os.getenv("APPLICATIONS_DB_BATCH_DELAY_MS", "0"))
+
+# job_finder results are stored and reused for repeat searches (same skills, experience,
+# location and job type) for this long; 0 asks the model every time
+JOB_SEARCH_TTL_SECONDS = int(os.getenv("JOB_SEARCH_TTL_SECONDS", "86400"))
@@ -0,0 +1,97 @@
+import logging
+import re
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class IntentMatch(NamedTuple):
+    """The tool chosen for a message and how confident the router is"""
+    tool: Optional[str]
+    confidence: float
+    source: str = "rules"
+
+# (tool, pattern, weight). A weight is how strongly one match on its own signals the tool.
+DEFAULT_RULES: List[Tuple[str, str, float]] = [
+    ("ats_score_checker", r"\bats\b", 0.9),
+    ("ats_score_checker", r"\bapplicant tracking\b", 0.9),
+    ("ats_score_checker", r"\bresume (review|score|check|analysis)\b", 0.85),
+    ("ats_score_checker", r"\b(score|rate|check) my resume\b", 0.85),
+    ("ats_score_checker", r"\bscore\b", 0.5),
+    ("ats_score_checker", r"\bkeywords?\b", 0.4),
+
+    ("job_finder", r"\b(find|search|look(ing)? for|show)\b.*\b(jobs?|roles?|positions?|openings?)\b", 0.9),
+    ("job_finder", r"\bjob (search|hunt|openings?|listings?)\b", 0.85),
+    ("job_finder", r"\b(openings?|vacanc(y|ies))\b", 0.6),
+    ("job_finder", r"\bjobs?\b", 0.5),
+    ("job_finder", r"\b(find|search)\b", 0.4),
+
+    ("cover_letter_generator", r"\bcover letters?\b", 0.95),
+    ("cover_letter_generator", r"\b(write|draft|generate|create)\b.*\bletter\b", 0.85),
+    ("cover_letter_generator", r"\bletter\b", 0.5),
+
+    ("job_applicator", r"\bapply (to|for)\b", 0.85),
+    ("job_applicator", r"\bsubmit (an? |my )?application\b", 0.85),
+    ("job_applicator", r"\bapply\b", 0.6),
+
+    ("application_status", r"\bstatus\b.*\bapplications?\b|\bapplications?\b.*\bstatus\b", 0.95),
+    ("application_status", r"\b(track|tracking|list|show)\b.*\bapplications\b", 0.85),
+    ("application_status", r"\b(where|what) (did|have) i applied\b", 0.85),
+    ("application_status", r"\bstatus\b", 0.5),
+]
+
+class IntentRouter:
+    """Classify chat messages to tools with compiled keyword rules before any model call"""
+
+    def __init__(
+        self,
+        rules: Optional[List[Tuple[str, str, float]]] = None,
+        threshold: float = 0.75,
+        fallback: Optional[Callable[[str], Awaitable[Optional[str]]]] = None
+    ):
+        self.threshold = threshold
+        self.fallback = fallback
+        self._rules: List[Tuple[str, re.Pattern, float]] = []
+        for tool, pattern, weight in (rules if rules is not None else DEFAULT_RULES):
+            self.add_rule(tool, pattern, weight)
+
+    def add_rule(self, tool: str, pattern: str, weight: float):
+        """Register a pattern that signals a tool with the given weight (0-1)"""
+        self._rules.append((tool, re.compile(pattern, re.IGNORECASE), weight))
+
+    def classify(self, text: str) -> IntentMatch:
+        """
+        Score every tool against a message using only the compiled rules.
+
+        Matches for the same tool are combined as independent evidence
+        (1 - product of (1 - weight)). The confidence is the best tool's score
+        reduced by half the runner-up's, so ambiguous messages score low.
+        """
+        misses: Dict[str, float] = {}
+        for tool, pattern, weight in self._rules:
+            if pattern.search(text):
+                misses[tool] = misses.get(tool, 1.0) * (1 - weight)
+
+        if not misses:
+            return IntentMatch(None, 0.0)
+
+        scores = sorted(((1 - miss, tool) for tool, miss in misses.items()), reverse=True)
+        best_score, best_tool = scores[0]
+        runner_up = scores[1][0] if len(scores) > 1 else 0.0
+        return IntentMatch(best_tool, round(max(0.0, best_score - runner_up / 2), 4))
+
+    async def route(self, text: str) -> IntentMatch:
+        """Classify a message, asking the fallback classifier only when rule confidence is low"""
+        match = self.classify(text)
+        if match.confidence >= self.threshold or self.fallback is None:
+            return match
+
+        try:
+            tool = await self.fallback(text)
+        except Exception as e:
+            logger.warning(f"Intent fallback failed, using rule match: {str(e)}")
+            return match
+        return IntentMatch(tool, match.confidence, "fallback")
+
+    def is_confident(self, match: IntentMatch) -> bool:
+        """Whether a match is certain enough to skip the chat model call"""
+        return match.tool is not None and (match.source == "fallback" or match.confidence >= self.threshold)
@@ -8,6 +8,7 @@ import uuid
 import os
 import sqlite3
 import random
+import threading
 
 # Import for web automation
 try:
@@ -25,306 +26,55 @@ except ImportError:
 
 # Import utilities
 from utils import extract_text_from_pdf
-from config import GEMINI_API_KEY
+from config import (
+    APPLICATIONS_DB_BATCH_DELAY_MS,
+    APPLICATIONS_DB_BATCH_SIZE,
+    APPLICATIONS_DB_PATH,
+    APPLICATIONS_DB_READERS,
+    APPLICATIONS_DB_SYNCHRONOUS,
+    api_key_missing
+)
+from storage import ApplicationQuery, ApplicationStore
+from resume_parser import ResumeParser
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Initialize database
-DB_PATH = os.path.join(os.path.dirname(__file__), "applications.db")
+# Applications and the resumes they were made with, shared by the automator and the API.
+# Opened on first use rather than on import, and closed with the server.
+_application_store: Optional[ApplicationStore] = None
+_application_store_lock = threading.Lock()
 
-def init_db():
-    """Initialize the database schema if it doesn't exist"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    # Create applications table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS applications (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        job_title TEXT NOT NULL,
-        company TEXT NOT NULL,
-        job_url TEXT NOT NULL,
-        application_date TEXT NOT NULL,
-        status TEXT NOT NULL,
-        resume_data TEXT,
-        application_data TEXT,
-        UNIQUE(job_url)
-    )
-    ''')
-    
-    conn.commit()
-    conn.close()
-    logger.info("Application database initialized")
-
-# Initialize database on module import
-init_db()
+def get_application_store() -> ApplicationStore:
+    """Return the shared application store, opening the database on first use"""
+    global _application_store
+    with _application_store_lock:
+        if _application_store is None:
+            _application_store = ApplicationStore(
+                APPLICATIONS_DB_PATH,
+                readers=APPLICATIONS_DB_READERS,
+                synchronous=APPLICATIONS_DB_SYNCHRONOUS,
+                batch_size=APPLICATIONS_DB_BATCH_SIZE,
+                batch_delay=APPLICATIONS_DB_BATCH_DELAY_MS / 1000
+            )
+        return _application_store
 
-class ResumeParser:
-    """Extract structured data from resume text"""
-    
-    def parse_resume(self, resume_text: str) -> Dict[str, Any]:
-        """Parse resume text into structured data"""
-        result = {
-            "full_name": "",
-            "first_name": "",
-            "last_name": "",
-            "email": "",
-            "phone": "",
-            "location": "",
-            "education": [],
-            "experience": [],
-            "skills": []
-        }
-        
-        # Extract basic contact information
-        result.update(self._extract_contact_info(resume_text))
-        
-        # Extract education
-        result["education"] = self._extract_education(resume_text)
-        
-        # Extract work experience
-        result["experience"] = self._extract_experience(resume_text)
-        
-        # Extract skills
-        result["skills"] = self._extract_skills(resume_text)
-        
-        return result
-    
-    def _extract_contact_info(self, text: str) -> Dict[str, str]:
-        """Extract contact information from resume text"""
-        info = {}
-        
-        # Extract email
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
-        if email_match:
-            info["email"] = email_match.group(0)
-        
-        # Extract phone number (various formats)
-        phone_match = re.search(r'(\+\d{1,2}\s?)?(\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})', text)
-        if phone_match:
-            info["phone"] = phone_match.group(0)
-        
-        # Extract name (usually at the beginning of the resume)
-        # Simplified approach: assume the first line contains the name
-        lines = text.strip().split('\n')
-        if lines:
-            potential_name = lines[0].strip()
-            # Check if it looks like a name (no special characters, not too long)
-            if len(potential_name) < 50 and re.match(r'^[A-Za-z\s\.-]+$', potential_name):
-                info["full_name"] = potential_name
-                
-                # Split into first and last name
-                name_parts = potential_name.split()
-                if len(name_parts) >= 2:
-                    info["first_name"] = name_parts[0]
-                    info["last_name"] = name_parts[-1]
-                elif len(name_parts) == 1:
-                    info["first_name"] = name_parts[0]
-        
-        # Extract location/address (look for common location patterns)
-        address_pattern = r'\b[A-Z][a-z]+,\s*[A-Z]{2}\s*\d{5}\b'  # City, State ZIP
-        address_match = re.search(address_pattern, text)
-        if address_match:
-            info["location"] = address_match.group(0)
-        else:
-            # Try another pattern: just city and state
-            city_state_pattern = r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b'
-            city_state_match = re.search(city_state_pattern, text)
-            if city_state_match:
-                info["location"] = city_state_match.group(0)
-        
-        return info
-    
-    def _extract_education(self, text: str) -> List[Dict[str, str]]:
-        """Extract education information from resume"""
-        education = []
-        
-        # Find education section
-        education_section = self._extract_section(text, ["education", "academic background", "academic history"])
-        if not education_section:
-            return education
-        
-        # Extract degree patterns
-        degree_patterns = [
-            r'(Bachelor|Master|PhD|Doctorate|Associate|B\.S\.|M\.S\.|B\.A\.|M\.A\.|B\.Tech|M\.Tech|M\.B\.A\.)',
-            r'(High School Diploma)'
-        ]
-        
-        for pattern in degree_patterns:
-            for match in re.finditer(pattern, education_section, re.IGNORECASE):
-                degree = match.group(0)
-                
-                # Get surrounding text (100 characters before and after)
-                start_idx = max(0, match.start() - 100)
-                end_idx = min(len(education_section), match.end() + 100)
-                context = education_section[start_idx:end_idx]
-                
-                # Try to extract institution
-                institution_pattern = r'(University|College|Institute|School) of ([A-Za-z\s&]+)'
-                institution_match = re.search(institution_pattern, context, re.IGNORECASE)
-                institution = ""
-                if institution_match:
-                    institution = institution_match.group(0)
-                
-                # Try to extract dates
-                date_pattern = r'(19|20)\d{2}\s*(-|to|–|—)\s*(19|20)\d{2}|((19|20)\d{2})\s*(-|to|–|—)\s*(Present|Current)'
-                date_match = re.search(date_pattern, context, re.IGNORECASE)
-                date_range = date_match.group(0) if date_match else ""
-                
-                education.append({
-                    "degree": degree,
-                    "institution": institution,
-                    "date_range": date_range,
-                    "context": context
-                })
-        
-        return education
-    
-    def _extract_experience(self, text: str) -> List[Dict[str, str]]:
-        """Extract work experience information from resume"""
-        experience = []
-        
-        # Find experience section
-        experience_section = self._extract_section(text, ["experience", "work history", "employment", "professional experience"])
-        if not experience_section:
-            return experience
-        
-        # Look for company and title patterns
-        # This is a simplified approach - real-world resumes vary greatly
-        
-        # Pattern: Job Title at Company Name (Date - Date)
-        job_pattern = r'([A-Za-z\s]+) at ([A-Za-z\s&]+) \((\d{4}.*?)\)'
-        for match in re.finditer(job_pattern, experience_section):
-            title = match.group(1).strip()
-            company = match.group(2).strip()
-            date_range = match.group(3).strip()
-            
-            # Get surrounding text for description
-            start_idx = max(0, match.start() - 50)
-            end_idx = min(len(experience_section), match.end() + 200)
-            description = experience_section[start_idx:end_idx]
-            
-            experience.append({
-                "title": title,
-                "company": company,
-                "date_range": date_range,
-                "description": description
-            })
-        
-        # If no matches found, try alternative pattern
-        if not experience:
-            # Look for lines that might contain job titles and companies
-            lines = experience_section.split('\n')
-            for i, line in enumerate(lines):
-                # Look for patterns like "Job Title - Company"
-                job_company_pattern = r'([A-Za-z\s]+) - ([A-Za-z\s&]+)'
-                match = re.search(job_company_pattern, line)
-                if match:
-                    title = match.group(1).strip()
-                    company = match.group(2).strip()
-                    
-                    # Look for dates in the same line or next line
-                    date_pattern = r'(19|20)\d{2}\s*(-|to|–|—)\s*(19|20)\d{2}|((19|20)\d{2})\s*(-|to|–|—)\s*(Present|Current)'
-                    date_match = None
-                    if i < len(lines) - 1:
-                        date_match = re.search(date_pattern, lines[i] + " " + lines[i+1], re.IGNORECASE)
-                    else:
-                        date_match = re.search(date_pattern, line, re.IGNORECASE)
-                    
-                    date_range = date_match.group(0) if date_match else ""
-                    
-                    # Get description from following lines
-                    description = "\n".join(lines[i:min(i+5, len(lines))])
-                    
-                    experience.append({
-                        "title": title,
-                        "company": company,
-                        "date_range": date_range,
-                        "description": description
-                    })
-        
-        return experience
-    
-    def _extract_skills(self, text: str) -> List[str]:
-        """Extract skills from resume text"""
-        skills = []
-        
-        # Find skills section
-        skills_section = self._extract_section(text, ["skills", "technical skills", "core competencies", "proficiencies"])
-        
-        if skills_section:
-            # Common technical skills to look for
-            skill_patterns = [
-                r'python', r'java', r'javascript', r'typescript', r'html', r'css', r'sql', r'react', r'angular', r'vue', 
-                r'node\.js', r'django', r'flask', r'spring', r'aws', r'azure', r'gcp', r'docker', r'kubernetes',
-                r'machine learning', r'artificial intelligence', r'data science', r'data analysis',
-                r'product management', r'scrum', r'agile', r'waterfall', r'jira', r'confluence',
-                r'photoshop', r'illustrator', r'indesign', r'figma', r'sketch', r'xd'
-            ]
-            
-            for pattern in skill_patterns:
-                if re.search(pattern, skills_section.lower()):
-                    skills.append(pattern.replace('\\', ''))
-            
-            # Also extract skills formatted as lists
-            list_items = re.findall(r'[•·-]\s*([^•·-\n]+)', skills_section)
-            for item in list_items:
-                if len(item.strip()) > 0 and len(item.strip()) < 50:  # Reasonable length for a skill
-                    skills.append(item.strip())
-        else:
-            # If no skills section found, try to extract skills from the whole resume
-            common_skills = [
-                "Python", "Java", "JavaScript", "HTML", "CSS", "SQL", "React", "Angular", "Node.js", 
-                "C++", "C#", "Ruby", "Swift", "Kotlin", "PHP", "Go", "Rust", "Scala",
-                "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Git", "CI/CD", "Jenkins", "TeamCity",
-                "Agile", "Scrum", "Kanban", "JIRA", "Confluence", "Trello", "MS Office", "Excel"
-            ]
-            
-            for skill in common_skills:
-                if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE):
-                    skills.append(skill)
-        
-        return list(set(skills))  # Remove duplicates
-    
-    def _extract_section(self, text: str, section_names: List[str]) -> str:
-        """Extract a section from the resume based on section names"""
-        # Convert text to lowercase for case-insensitive matching
-        text_lower = text.lower()
-        
-        # Find the start of the section
-        section_start = -1
-        section_name_found = ""
-        for name in section_names:
-            # Look for section header pattern (uppercase, followed by colon or newline)
-            pattern = f"(^|\n)\\s*{name}[:\\s]*(\n|$)"
-            match = re.search(pattern, text_lower, re.IGNORECASE)
-            if match:
-                section_start = match.end()
-                section_name_found = name
-                break
-        
-        if section_start == -1:
-            return ""
-        
-        # Find the start of the next section
-        next_section_pattern = r'(^|\n)\s*[A-Z][A-Z\s]+[A-Z][:\s]*(\n|$)'
-        next_section_match = re.search(next_section_pattern, text[section_start:], re.MULTILINE)
-        
-        if next_section_match:
-            section_end = section_start + next_section_match.start()
-        else:
-            section_end = len(text)
-        
-        return text[section_start:section_end].strip()
+def close_application_store():
+    """Finish pending writes and close the shared store, if it was opened"""
+    global _application_store
+    with _application_store_lock:
+        store, _application_store = _application_store, None
+    if store is not None:
+        store.close()
 
 class JobApplicationAutomator:
     """Automate job applications using web browser automation"""
     
-    def __init__(self):
+    def __init__(self, store: Optional[ApplicationStore] = None):
         self.driver = None
         self.wait = None
         self.resume_parser = ResumeParser()
+        self.store = store or get_application_store()
     
     async def setup_driver(self):
         """Initialize the web driver"""
@@ -357,8 +107,8 @@ class JobApplicationAutomator:
             logger.error(f"Error setting up web driver: {str(e)}")
             return False
     
-    async def apply_to_job(self, job_data: Dict[str, Any], resume_content: str) -> Dict[str, Any]:
-        """Apply to a job using the provided resume data"""
+    async def apply_to_job(self, job_data: Dict[str, Any], resume_content: str, parsed_resume: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Apply to a job using the provided resume data, parsing it unless already parsed"""
         if not SELENIUM_AVAILABLE:
             return {
                 "status": "failed",
@@ -374,7 +124,8 @@ class JobApplicationAutomator:
                 }
         
         # Parse resume
-        parsed_resume = self.resume_parser.parse_resume(resume_content)
+        if parsed_resume is None:
+            parsed_resume = self.resume_parser.parse_resume(resume_content)
         
         # Get job information
         job_url = job_data.get("application_link", "")
@@ -654,15 +405,7 @@ class JobApplicationAutomator:
     async def check_application_exists(self, job_url: str) -> bool:
         """Check if an application already exists for the given job URL"""
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT id FROM applications WHERE job_url = ?', (job_url,))
-            result = cursor.fetchone()
-            
-            conn.close()
-            
-            return result is not None
+            return await self.store.application_exists(job_url)
         
         except Exception as e:
             logger.error(f"Error checking application existence: {str(e)}")
@@ -670,87 +413,41 @@ class JobApplicationAutomator:
     
     async def record_application(self, job_data: Dict[str, Any], resume_data: Dict[str, Any]) -> int:
         """Record an application in the database"""
+        job_url = job_data.get("application_link", "")
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            
-            # Prepare data
-            job_url = job_data.get("application_link", "")
-            job_title = job_data.get("job_title", "Unknown Position")
-            company = job_data.get("company_name", "Unknown Company")
-            now = datetime.datetime.now().isoformat()
-            
-            # Convert data to JSON for storage
-            resume_json = json.dumps(resume_data)
-            job_json = json.dumps(job_data)
-            
-            # Insert application record
-            cursor.execute('''
-            INSERT INTO applications 
-            (job_title, company, job_url, application_date, status, resume_data, application_data)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_title, 
-                company, 
-                job_url, 
-                now, 
-                "initiated", 
-                resume_json,
-                job_json
-            ))
+            application_id = await self.store.add_application(job_data, resume_data)
             
-            application_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Recorded application #{application_id} for {job_title} at {company}")
+            logger.info(f"Recorded application #{application_id} for {job_data.get('job_title', 'Unknown Position')} at {job_data.get('company_name', 'Unknown Company')}")
             return application_id
         
         except sqlite3.IntegrityError:
             # Handle duplicate application
             logger.warning(f"Attempted to add duplicate application for {job_url}")
-            conn.close()
             return -1
         
         except Exception as e:
             logger.error(f"Error recording application: {str(e)}")
-            if 'conn' in locals():
-                conn.close()
             return -1
     
+    async def update_application_status(self, application_id: int, status: str) -> bool:
+        """Update the status of a recorded application"""
+        try:
+            updated = await self.store.update_status(application_id, status)
+            if not updated:
+                logger.warning(f"No application #{application_id} to update")
+            return updated
+        
+        except Exception as e:
+            logger.error(f"Error updating application status: {str(e)}")
+            return False
+    
     async def get_all_applications(self) -> List[Dict[str, Any]]:
         """Get all applications from the database"""
         try:
-            conn = sqlite3.connect(DB_PATH)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-            SELECT * FROM applications ORDER BY application_date DESC
-            ''')
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
-            applications = []
-            for row in rows:
-                application = dict(row)
-                
-                # Parse JSON fields
-                if application.get("resume_data"):
-                    application["resume_data"] = json.loads(application["resume_data"])
-                
-                if application.get("application_data"):
-                    application["application_data"] = json.loads(application["application_data"])
-                
-                applications.append(application)
-            
-            return applications
+            return await self.store.list_applications()
         
         except Exception as e:
             logger.error(f"Error getting applications: {str(e)}")
-            if 'conn' in locals():
-                conn.close()
             return []
     
     def close(self):
@@ -761,9 +458,9 @@ class JobApplicationAutomator:
             logger.info("Closed web driver")
 
 # Function to use for applying to jobs
-async def automated_job_application(job_data: Dict[str, Any], resume_content: str) -> Dict[str, Any]:
+async def automated_job_application(job_data: Dict[str, Any], resume_content: str, parsed_resume: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Apply to a job automatically"""
-    if not GEMINI_API_KEY or GEMINI_API_KEY == "your-api-key-here":
+    if api_key_missing():
         logger.error("Invalid or missing Gemini API key")
         return {
             "error": "The Gemini API key is not configured. Please add a valid API key to the .env file."
@@ -782,7 +479,7 @@ async def automated_job_application(job_data: Dict[str, Any], resume_content: st
         automator = JobApplicationAutomator()
         
         # Apply to the job
-        result = await automator.apply_to_job(job_data, resume_content)
+        result = await automator.apply_to_job(job_data, resume_content, parsed_resume)
         
         # Close the browser when done
         automator.close()
@@ -798,15 +495,15 @@ async def automated_job_application(job_data: Dict[str, Any], resume_content: st
         }
 
 # Function to get all applications
-async def get_applications() -> Dict[str, Any]:
-    """Get all recorded job applications"""
+async def get_applications(query: Optional[ApplicationQuery] = None) -> Dict[str, Any]:
+    """Get one page of recorded job applications, newest first"""
     try:
-        automator = JobApplicationAutomator()
-        applications = await automator.get_all_applications()
+        page = await get_application_store().query_applications(query or ApplicationQuery())
         
         return {
             "status": "success",
-            "applications": applications
+            "applications": page["applications"],
+            "next_cursor": page["next_cursor"]
         }
     
     except Exception as e:
@@ -0,0 +1,94 @@
+import json
+import logging
+from typing import Any, List
+
+logger = logging.getLogger(__name__)
+
+class JSONArrayStreamParser:
+    """
+    Incrementally parse a JSON array of objects arriving in chunks.
+
+    Each element is returned by feed() as soon as its closing brace arrives, so
+    callers can use the first job while the model is still writing the rest.
+    Text before the array (such as a ```json fence or a short preamble) and
+    after it is ignored. A response that is a single object rather than an
+    array yields that object.
+
+    The scan is a single pass over each character with no backtracking; only
+    the text of the element currently being read is kept between chunks.
+    """
+
+    def __init__(self):
+        self._pending = ""  # Text of an element that started in an earlier chunk
+        self._depth = 0  # Nesting depth inside the current element
+        self._in_array = False
+        self._in_string = False
+        self._escape = False
+        self.done = False
+        self.items = 0
+        self.errors = 0
+
+    @property
+    def incomplete(self) -> bool:
+        """Whether the input ended in the middle of an element"""
+        return self._depth > 0
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Consume the next piece of text and return the elements it completed"""
+        items = []
+        start = 0 if self._depth else -1
+
+        for i, ch in enumerate(chunk):
+            if self.done:
+                break
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                # Quotes outside an element belong to prose around the array
+                if self._depth:
+                    self._in_string = True
+            elif ch == "{" or ch == "[":
+                if self._depth == 0:
+                    if ch == "[" and not self._in_array:
+                        self._in_array = True
+                        continue
+                    start = i
+                self._depth += 1
+            elif ch == "}" or ch == "]":
+                if self._depth == 0:
+                    if ch == "]" and self._in_array:
+                        self.done = True
+                    continue
+                self._depth -= 1
+                if self._depth == 0:
+                    text = self._pending + chunk[start:i + 1]
+                    self._pending = ""
+                    start = -1
+                    self._parse(text, items)
+                    # A lone object outside any array is the whole response
+                    if not self._in_array:
+                        self.done = True
+
+        if self._depth and start >= 0:
+            self._pending += chunk[start:]
+        return items
+
+    def _parse(self, text: str, items: List[Any]):
+        try:
+            items.append(json.loads(text))
+            self.items += 1
+        except json.JSONDecodeError as e:
+            self.errors += 1
+            logger.warning(f"Skipping malformed element in streamed JSON array: {str(e)}")
+
+def parse_json_array(text: str) -> List[Any]:
+    """Return every complete element of the JSON array in a text, skipping malformed ones"""
+    return JSONArrayStreamParser().feed(text)
@@ -0,0 +1,270 @@
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import random
+from typing import Any, AsyncIterator, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+class LLMResponse(NamedTuple):
+    """Text of a model response with token counts, 0 when the backend doesn't report them"""
+    text: str
+    prompt_tokens: int = 0
+    response_tokens: int = 0
+
+class ReplayMissError(Exception):
+    """Raised in replay mode when no recording exists for a prompt"""
+
+class RateLimitError(Exception):
+    """Raised by a backend when the provider rejects a call for exceeding its quota"""
+
+class LLMBackend:
+    """Interface for the model behind LLMClient"""
+
+    # Identifies the model in response cache keys
+    model_name = "base"
+    # Whether the backend needs GEMINI_API_KEY to work
+    requires_api_key = False
+
+    async def generate(self, prompt: str, tool: str, json_mode: bool = False, schema: Optional[Dict[str, Any]] = None) -> LLMResponse:
+        """
+        Return the complete response for a prompt, as JSON when json_mode is True.
+        Backends that can enforce a JSON schema on the output use schema when given.
+        """
+        raise NotImplementedError
+
+    async def stream(self, prompt: str, tool: str, json_mode: bool = False, schema: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """Yield the response for a prompt in chunks"""
+        raise NotImplementedError
+        yield  # pragma: no cover - makes this an async generator
+
+    def is_rate_limit_error(self, error: Exception) -> bool:
+        """Whether an error means the call was rejected for exceeding the quota and can be retried later"""
+        return isinstance(error, RateLimitError)
+
+class GeminiBackend(LLMBackend):
+    """Google Gemini through the google-generativeai SDK"""
+
+    requires_api_key = True
+
+    def __init__(self, model_name: str, generation_config: Dict[str, Any], api_key: Optional[str]):
+        # Imported here so the fake and replay backends work without the SDK installed
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self.model_name = model_name
+        # A single model instance means the underlying async gRPC channel is created
+        # once and reused by every call instead of being set up per request
+        self.model = genai.GenerativeModel(model_name, generation_config=generation_config)
+
+        # JSON output mode needs google-generativeai 0.5+ and schema enforcement a
+        # later release; without them the output follows the schema in the prompt alone
+        # Read from the constructor, which works whether or not the SDK defines it as a dataclass
+        supported = set(inspect.signature(genai.types.GenerationConfig).parameters)
+        if "response_mime_type" in supported:
+            self._json_config = {**generation_config, "response_mime_type": "application/json"}
+        else:
+            logger.warning("This google-generativeai version has no JSON output mode; upgrade to 0.5 or later")
+            self._json_config = None
+        self._supports_schema = "response_schema" in supported
+        if self._json_config and not self._supports_schema:
+            logger.warning("This google-generativeai version can't enforce a response schema; upgrade to 0.8 or later")
+
+    def _generation_config(self, json_mode: bool, schema: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return the per-call generation config, or None for the model's default"""
+        if not json_mode or self._json_config is None:
+            return None
+        if schema is not None and self._supports_schema:
+            return {**self._json_config, "response_schema": schema}
+        return self._json_config
+
+    async def generate(self, prompt: str, tool: str, json_mode: bool = False, schema: Optional[Dict[str, Any]] = None) -> LLMResponse:
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config=self._generation_config(json_mode, schema)
+        )
+        usage = getattr(response, "usage_metadata", None)
+        return LLMResponse(
+            response.text,
+            getattr(usage, "prompt_token_count", 0) or 0,
+            getattr(usage, "candidates_token_count", 0) or 0
+        )
+
+    async def stream(self, prompt: str, tool: str, json_mode: bool = False, schema: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config=self._generation_config(json_mode, schema),
+            stream=True
+        )
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+    def is_rate_limit_error(self, error: Exception) -> bool:
+        # google.api_core raises ResourceExhausted (HTTP 429) when the quota is exceeded
+        return (
+            super().is_rate_limit_error(error)
+            or type(error).__name__ in ("ResourceExhausted", "TooManyRequests")
+            or getattr(error, "code", None) == 429
+        )
+
+# Canned responses in the formats each tool expects
+FAKE_RESPONSES = {
+    "ats_score_checker": json.dumps({
+        "score": 72,
+        "matching_keywords": ["python", "rest apis", "docker"],
+        "missing_keywords": ["kubernetes", "gcp"],
+        "formatting_issues": "No specific issues detected",
+        "recommendations": "Mention Kubernetes and GCP experience if you have it."
+    }),
+    "job_finder": json.dumps([
+        {
+            "job_title": f"Software Engineer {i}",
+            "company_name": f"Example Company {i}",
+            "location": "Remote",
+            "job_description": "Build and maintain backend services.",
+            "required_qualifications": "Bachelor's degree in Computer Science",
+            "experience_required": "2-4",
+            "skills_required": "Python, SQL, Docker",
+            "estimated_salary_range": "$100,000 - $130,000",
+            "application_link": f"https://www.linkedin.com/jobs/view/{3500000000 + i}"
+        }
+        for i in range(1, 6)
+    ]),
+    "cover_letter_generator": (
+        "Dear Hiring Manager,\n\n"
+        "I am excited to apply for this position. My experience building reliable backend "
+        "services matches the requirements you describe.\n\n"
+        "Thank you for your consideration.\n\nSincerely,\nCandidate"
+    ),
+    "mcp": "I can help you with ATS scoring, job searches, cover letters and applications. What would you like to do?"
+}
+
+class FakeBackend(LLMBackend):
+    """Deterministic offline backend returning canned responses after a configurable delay"""
+
+    model_name = "fake"
+
+    def __init__(self, latency: float = 0.5, jitter: float = 0.0, responses: Optional[Dict[str, str]] = None, seed: int = 0, chunk_count: int = 8):
+        self.latency = latency
+        self.jitter = jitter
+        self.responses = {**FAKE_RESPONSES, **(responses or {})}
+        self.chunk_count = chunk_count
+        self._random = random.Random(seed)
+
+    def _delay(self) -> float:
+        return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+    def _response_for(self, tool: str) -> str:
+        return self.responses.get(tool, self.responses["mcp"])
+
+    async def generate(self, prompt: str, tool: str, json_mode: bool = False, schema: Optional[Dict[str, Any]] = None) -> LLMResponse:
+        await asyncio.sleep(self._delay())
+        return LLMResponse(self._response_for(tool))
+
+    async def stream(self, prompt: str, tool: str, json_mode: bool = False, schema: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        text = self._response_for(tool)
+        size = max(1, -(-len(text) // self.chunk_count))
+        delay = self._delay() / self.chunk_count
+        for start in range(0, len(text), size):
+            await asyncio.sleep(delay)
+            yield text[start:start + size]
+
+class RecordReplayBackend(LLMBackend):
+    """Save responses from another backend to disk, or play saved responses back"""
+
+    def __init__(self, directory: str, mode: str = "replay", inner: Optional[LLMBackend] = None, model_name: str = "replay"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown record/replay mode: {mode}")
+        if mode == "record" and inner is None:
+            raise ValueError("Record mode needs a backend to record from")
+
+        self.directory = directory
+        self.mode = mode
+        self.inner = inner
+        # Replayed responses stand in for the recorded model, so they share its cache entries
+        self.model_name = inner.model_name if inner else model_name
+        self.requires_api_key = mode == "record" and inner.requires_api_key
+        os.makedirs(directory, exist_ok=True)
+
+    def is_rate_limit_error(self, error: Exception) -> bool:
+        return self.inner.is_rate_limit_error(error) if self.inner else super().is_rate_limit_error(error)
+
+    def _path(self, prompt: str, tool: str) -> str:
+        key = hashlib.sha256(f"{tool}\n{prompt}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load(self, path: str) -> Dict[str, Any]:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save(self, path: str, prompt: str, tool: str, response: LLMResponse):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"tool": tool, "prompt": prompt, **response._asdict()}, f)
+
+    async def _replay(self, prompt: str, tool: str) -> LLMResponse:
+        path = self._path(prompt, tool)
+        if not os.path.exists(path):
+            raise ReplayMissError(f"No recorded response for this {tool} prompt in {self.directory}")
+        recording = await asyncio.to_thread(self._load, path)
+        return LLMResponse(recording["text"], recording.get("prompt_tokens", 0), recording.get("response_tokens", 0))
+
+    async def generate(self, prompt: str, tool: str, json_mode: bool = False, schema: Optional[Dict[str, Any]] = None) -> LLMResponse:
+        if self.mode == "replay":
+            return await self._replay(prompt, tool)
+
+        response = await self.inner.generate(prompt, tool, json_mode, schema)
+        await asyncio.to_thread(self._save, self._path(prompt, tool), prompt, tool, response)
+        return response
+
+    async def stream(self, prompt: str, tool: str, json_mode: bool = False, schema: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        if self.mode == "replay":
+            yield (await self._replay(prompt, tool)).text
+            return
+
+        chunks = []
+        async for chunk in self.inner.stream(prompt, tool, json_mode, schema):
+            chunks.append(chunk)
+            yield chunk
+        await asyncio.to_thread(self._save, self._path(prompt, tool), prompt, tool, LLMResponse("".join(chunks)))
+
+def create_backend(
+    kind: str,
+    model_name: str,
+    generation_config: Dict[str, Any],
+    api_key: Optional[str] = None,
+    recordings_dir: Optional[str] = None,
+    fake_latency: float = 0.5,
+    fake_responses_path: Optional[str] = None
+) -> LLMBackend:
+    """
+    Build the backend selected by the LLM_BACKEND setting.
+
+    Args:
+        kind: "gemini", "fake", "record" (call Gemini and save responses) or "replay"
+        model_name: Gemini model name
+        generation_config: Gemini generation settings
+        api_key: Gemini API key
+        recordings_dir: Directory for recorded responses
+        fake_latency: Delay in seconds for each fake response
+        fake_responses_path: Optional JSON file mapping tool names to canned responses
+
+    Returns:
+        The configured backend
+    """
+    if kind == "gemini":
+        return GeminiBackend(model_name, generation_config, api_key)
+    if kind == "fake":
+        responses = None
+        if fake_responses_path:
+            with open(fake_responses_path, "r", encoding="utf-8") as f:
+                responses = json.load(f)
+        return FakeBackend(latency=fake_latency, responses=responses)
+    if kind == "record":
+        return RecordReplayBackend(recordings_dir, "record", GeminiBackend(model_name, generation_config, api_key))
+    if kind == "replay":
+        return RecordReplayBackend(recordings_dir, "replay", model_name=model_name)
+    raise ValueError(f"Unknown LLM backend: {kind}. Use gemini, fake, record or replay.")
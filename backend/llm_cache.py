@@ -0,0 +1,212 @@
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class ResponseCache:
+    """Disk-backed LRU cache for model responses, keyed on model, config and prompt"""
+
+    def __init__(self, db_path: str, ttl_seconds: int = 86400, max_entries: int = 1000, max_bytes: int = 50 * 1024 * 1024):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # Counters are kept in memory and reset when the server restarts
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _init_db(self):
+        """Create the cache table if it doesn't exist"""
+        conn = self._connect()
+        try:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_last_accessed ON responses(last_accessed)')
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def normalize_prompt(prompt: str) -> str:
+        """Collapse whitespace so cosmetic differences don't produce cache misses"""
+        return re.sub(r"\s+", " ", prompt).strip()
+
+    @classmethod
+    def make_key(cls, model_name: str, generation_config: Dict[str, Any], prompt: str) -> str:
+        """
+        Build a content-addressed cache key.
+
+        Args:
+            model_name: The name of the model that produces the response
+            generation_config: The generation settings passed to the model
+            prompt: The full prompt text
+
+        Returns:
+            A hex SHA-256 digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                "model": model_name,
+                "config": generation_config or {},
+                "prompt": cls.normalize_prompt(prompt)
+            },
+            sort_keys=True,
+            separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss or expired entry"""
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    'SELECT response, created_at FROM responses WHERE key = ?', (key,)
+                ).fetchone()
+
+                if row and self.ttl_seconds > 0 and now - row[1] > self.ttl_seconds:
+                    conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                    conn.commit()
+                    with self._lock:
+                        self._expired += 1
+                    row = None
+
+                if row is None:
+                    with self._lock:
+                        self._misses += 1
+                    return None
+
+                # Touch the entry so LRU eviction keeps recently used responses
+                conn.execute('UPDATE responses SET last_accessed = ? WHERE key = ?', (now, key))
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading from response cache: {str(e)}")
+            with self._lock:
+                self._misses += 1
+            return None
+
+        with self._lock:
+            self._hits += 1
+        return row[0]
+
+    def set(self, key: str, response: str):
+        """Store a response and evict least recently used entries past the size limits"""
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        try:
+            conn = self._connect()
+            try:
+                conn.execute('''
+                INSERT OR REPLACE INTO responses (key, response, size, created_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?)
+                ''', (key, response, size, now, now))
+                evicted = self._evict(conn)
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing to response cache: {str(e)}")
+            return
+
+        if evicted:
+            with self._lock:
+                self._evictions += evicted
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Delete the least recently used entries beyond max_entries or max_bytes"""
+        evicted = 0
+        if self.max_entries > 0:
+            cursor = conn.execute('''
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY last_accessed DESC LIMIT -1 OFFSET ?
+            )
+            ''', (self.max_entries,))
+            evicted += cursor.rowcount
+
+        if self.max_bytes > 0:
+            cursor = conn.execute('''
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY last_accessed DESC, key) AS running_size
+                    FROM responses
+                ) WHERE running_size > ?
+            )
+            ''', (self.max_bytes,))
+            evicted += cursor.rowcount
+
+        return evicted
+
+    def delete(self, key: str):
+        """Remove one cached response"""
+        try:
+            conn = self._connect()
+            try:
+                conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error deleting from response cache: {str(e)}")
+
+    def clear(self):
+        """Remove every cached response"""
+        conn = self._connect()
+        try:
+            conn.execute('DELETE FROM responses')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current cache size"""
+        entries, total_bytes = 0, 0
+        try:
+            conn = self._connect()
+            try:
+                entries, total_bytes = conn.execute(
+                    'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses'
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading response cache stats: {str(e)}")
+
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "expired": self._expired,
+                "evictions": self._evictions,
+                "entries": entries,
+                "bytes": total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds
+            }
@@ -0,0 +1,263 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from llm_backends import LLMBackend
+from llm_cache import ResponseCache
+from prompt_budget import estimate_tokens
+from scheduler import RequestScheduler
+from singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+class LLMTimeoutError(Exception):
+    """Raised when a model call exceeds its tool's timeout"""
+
+class LLMClient:
+    """Shared async client for model calls with bounded concurrency and per-tool timeouts"""
+
+    def __init__(
+        self,
+        backend: LLMBackend,
+        generation_config: Dict[str, Any],
+        cache: Optional[ResponseCache] = None,
+        max_concurrency: int = 8,
+        tool_concurrency: int = 4,
+        default_timeout: float = 60.0,
+        tool_timeouts: Optional[Dict[str, float]] = None,
+        tool_concurrency_overrides: Optional[Dict[str, int]] = None,
+        scheduler: Optional[RequestScheduler] = None
+    ):
+        self.backend = backend
+        self.scheduler = scheduler
+        self.generation_config = generation_config
+        self.cache = cache
+        self.default_timeout = default_timeout
+        self.tool_timeouts = tool_timeouts or {}
+        self.tool_concurrency = tool_concurrency
+        self.tool_concurrency_overrides = tool_concurrency_overrides or {}
+
+        self._max_concurrency = max_concurrency
+        self._global_limit = asyncio.Semaphore(max_concurrency)
+        self._tool_limits: Dict[str, asyncio.Semaphore] = {}
+        self._single_flight = SingleFlight()
+
+        self._in_flight = 0
+        self._tool_in_flight: Dict[str, int] = {}
+        self._calls = 0
+        self._timeouts = 0
+        self._errors = 0
+        self._token_usage: Dict[str, Dict[str, int]] = {}
+
+    def _tool_limit(self, tool: str) -> asyncio.Semaphore:
+        """Return the concurrency limiter for a tool, creating it on first use"""
+        if tool not in self._tool_limits:
+            limit = self.tool_concurrency_overrides.get(tool, self.tool_concurrency)
+            self._tool_limits[tool] = asyncio.Semaphore(limit)
+        return self._tool_limits[tool]
+
+    def timeout_for(self, tool: str) -> float:
+        """Return the timeout in seconds for a tool"""
+        return self.tool_timeouts.get(tool, self.default_timeout)
+
+    def cache_key(self, prompt: str, json_mode: bool = False) -> str:
+        """Return the response cache key for a prompt"""
+        # A response schema isn't part of the key: the prompts that use one spell it out
+        config = {**self.generation_config, "response_mime_type": "application/json"} if json_mode else self.generation_config
+        return ResponseCache.make_key(self.backend.model_name, config, prompt)
+
+    async def generate(
+        self,
+        prompt: str,
+        tool: str = "default",
+        use_cache: bool = True,
+        json_mode: bool = False,
+        priority: str = "interactive",
+        schema: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate a model response without blocking the default thread pool.
+
+        Identical requests that arrive while one is already in flight share its
+        result instead of calling the model again.
+
+        Args:
+            prompt: The full prompt text
+            tool: The calling tool, used for its concurrency limit and timeout
+            use_cache: Whether a cached response may be returned. When False the
+                cache is skipped and refreshed with the new response.
+            json_mode: Ask the model for application/json output
+            priority: Scheduler lane, "interactive" or "batch"
+            schema: JSON schema the json_mode output must follow, enforced by
+                backends that support it
+
+        Returns:
+            The response text
+        """
+        cache_key = self.cache_key(prompt, json_mode)
+        if self.cache and use_cache:
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                return cached
+
+        return await self._single_flight.do(
+            cache_key,
+            lambda: self._call_and_store(prompt, tool, cache_key, json_mode, priority, schema)
+        )
+
+    async def _call_and_store(
+        self,
+        prompt: str,
+        tool: str,
+        cache_key: str,
+        json_mode: bool = False,
+        priority: str = "interactive",
+        schema: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Call the model and cache the response"""
+        response = await self._call_model(prompt, tool, json_mode, priority, schema)
+
+        if self.cache:
+            await asyncio.to_thread(self.cache.set, cache_key, response)
+        return response
+
+    async def stream(
+        self,
+        prompt: str,
+        tool: str = "default",
+        use_cache: bool = True,
+        json_mode: bool = False,
+        priority: str = "interactive",
+        schema: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a model response chunk by chunk as it is generated.
+
+        A cached response is yielded as a single chunk. The tool timeout applies to
+        the wait for each chunk rather than the whole response.
+
+        Args:
+            prompt: The full prompt text
+            tool: The calling tool, used for its concurrency limit and timeout
+            use_cache: Whether a cached response may be returned
+            json_mode: Ask the model for application/json output
+            priority: Scheduler lane, "interactive" or "batch"
+            schema: JSON schema the json_mode output must follow, enforced by
+                backends that support it
+
+        Yields:
+            Pieces of response text in order
+        """
+        cache_key = self.cache_key(prompt, json_mode)
+        if self.cache and use_cache:
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        timeout = self.timeout_for(tool)
+        chunks = []
+        attempt = 0
+        while True:
+            if self.scheduler:
+                await self.scheduler.acquire(priority, estimate_tokens(prompt))
+            try:
+                async with self._slot(tool, timeout):
+                    iterator = self.backend.stream(prompt, tool, json_mode, schema).__aiter__()
+                    while True:
+                        try:
+                            chunk = await asyncio.wait_for(iterator.__anext__(), timeout=timeout)
+                        except StopAsyncIteration:
+                            break
+                        chunks.append(chunk)
+                        yield chunk
+                    self._record_usage(tool, prompt, "".join(chunks))
+                break
+            except Exception as e:
+                # Text already sent can't be taken back, so only retry before the first chunk
+                if chunks or not self.scheduler or not await self.scheduler.backoff(e, attempt):
+                    raise
+                attempt += 1
+
+        # Only complete responses are cached; an abandoned stream never reaches here
+        if self.cache:
+            await asyncio.to_thread(self.cache.set, cache_key, "".join(chunks))
+
+    async def discard(self, prompt: str, json_mode: bool = False):
+        """
+        Drop a cached response that the caller could not use, such as JSON that
+        failed schema validation, so the next identical request calls the model
+        again instead of getting the same bad response.
+        """
+        if self.cache:
+            await asyncio.to_thread(self.cache.delete, self.cache_key(prompt, json_mode))
+
+    async def _call_model(
+        self,
+        prompt: str,
+        tool: str,
+        json_mode: bool = False,
+        priority: str = "interactive",
+        schema: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Run one model call once the scheduler admits it, inside the tool and global concurrency limits"""
+        timeout = self.timeout_for(tool)
+
+        async def call() -> str:
+            async with self._slot(tool, timeout):
+                response = await asyncio.wait_for(self.backend.generate(prompt, tool, json_mode, schema), timeout=timeout)
+                self._record_usage(tool, prompt, response.text, response.prompt_tokens, response.response_tokens)
+                return response.text
+
+        if self.scheduler is None:
+            return await call()
+        # Admission happens before taking a concurrency slot so queued calls don't hold slots
+        return await self.scheduler.run(call, priority, estimate_tokens(prompt))
+
+    def _record_usage(self, tool: str, prompt: str, text: str, prompt_tokens: int = 0, response_tokens: int = 0):
+        """Add a call's prompt and response token counts to the tool's totals"""
+        # Use the counts reported by the backend when available, otherwise estimate
+        prompt_tokens = prompt_tokens or estimate_tokens(prompt)
+        response_tokens = response_tokens or estimate_tokens(text)
+
+        totals = self._token_usage.setdefault(tool, {"calls": 0, "prompt_tokens": 0, "response_tokens": 0})
+        totals["calls"] += 1
+        totals["prompt_tokens"] += prompt_tokens
+        totals["response_tokens"] += response_tokens
+        logger.info(f"Model call for {tool}: {prompt_tokens} prompt tokens, {response_tokens} response tokens")
+
+    @asynccontextmanager
+    async def _slot(self, tool: str, timeout: float):
+        """Hold a tool slot and a global slot for the duration of a model call"""
+        # Take the tool slot first so a backlog for one tool doesn't hold global slots
+        async with self._tool_limit(tool):
+            async with self._global_limit:
+                self._calls += 1
+                self._in_flight += 1
+                self._tool_in_flight[tool] = self._tool_in_flight.get(tool, 0) + 1
+                try:
+                    yield
+                except asyncio.TimeoutError:
+                    self._timeouts += 1
+                    logger.error(f"Model call for {tool} timed out after {timeout}s")
+                    raise LLMTimeoutError(f"The AI service did not respond within {timeout:g} seconds")
+                except Exception:
+                    self._errors += 1
+                    raise
+                finally:
+                    self._in_flight -= 1
+                    self._tool_in_flight[tool] -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return call counters and current in-flight requests"""
+        return {
+            "calls": self._calls,
+            "errors": self._errors,
+            "timeouts": self._timeouts,
+            "in_flight": self._in_flight,
+            "max_concurrency": self._max_concurrency,
+            "tool_in_flight": dict(self._tool_in_flight),
+            "coalesced": self._single_flight.stats()["coalesced"],
+            "tokens": {tool: dict(totals) for tool, totals in self._token_usage.items()}
+        }
@@ -1,21 +1,55 @@
 import json
 import uuid
 import base64
+import hashlib
 from typing import Dict, List, Optional, Any, Union
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-import google.generativeai as genai
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import asyncio
 import logging
+import zipfile
 
 # Import configuration
-from config import GEMINI_API_KEY, MAX_TOKENS, TEMPERATURE
+from config import (
+    GEMINI_API_KEY, MAX_TOKENS, TEMPERATURE,
+    LLM_BACKEND, LLM_RECORDINGS_DIR, LLM_FAKE_LATENCY_SECONDS, LLM_FAKE_RESPONSES_PATH,
+    LLM_CACHE_ENABLED, LLM_CACHE_PATH, LLM_CACHE_TTL_SECONDS, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_MAX_BYTES,
+    LLM_MAX_CONCURRENCY, LLM_TOOL_CONCURRENCY, LLM_TIMEOUT_SECONDS, LLM_TOOL_TIMEOUTS, LLM_TOOL_CONCURRENCY_OVERRIDES,
+    LLM_REQUESTS_PER_MINUTE, LLM_RATE_LIMIT_BURST, LLM_TOKENS_PER_MINUTE, LLM_MAX_RETRIES,
+    LLM_BACKOFF_BASE_SECONDS, LLM_BACKOFF_MAX_SECONDS, LLM_INTERACTIVE_BURST,
+    ATS_BATCH_MAX_JOBS, ATS_BATCH_CONCURRENCY, ATS_DEFAULT_MODE,
+    INTENT_CONFIDENCE_THRESHOLD, INTENT_LLM_FALLBACK,
+    PROMPT_RESUME_TOKEN_BUDGET, PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET,
+    RESUME_STORE_DIR, RESUME_MEMORY_CACHE_SIZE, RESUME_STORE_MAX_AGE_SECONDS, RESUME_STORE_MAX_BYTES,
+    PDF_WORKERS, PDF_TIMEOUT_SECONDS, PDF_MAX_PAGES, PDF_PAGES_PER_TASK, PDF_MAX_CHARS,
+    MAX_UPLOAD_BYTES, BULK_PARSE_WORKERS, BULK_MAX_ARCHIVE_BYTES, BULK_MAX_FILES,
+    APPLICATIONS_PAGE_SIZE, APPLICATIONS_MAX_PAGE_SIZE, JOB_SEARCH_TTL_SECONDS,
+    api_key_missing
+)
 # Import utilities
-from utils import extract_text_from_pdf
+from pdf_extractor import PDFExtractor
+from resume_store import ResumeExtractionError, ResumeStore, StoredResume
+from uploads import UploadSizeLimitMiddleware, UploadTooLargeError, hash_upload
+from llm_backends import create_backend
+from llm_cache import ResponseCache
+from llm_client import LLMClient
+from scheduler import RequestScheduler
+from ats_scorer import score_resume, local_feedback
+from intent_router import IntentRouter
+from prompt_budget import prepare_resume, prepare_job_description
+from json_stream import JSONArrayStreamParser
+from schemas import ATSResult, ATSFeedback, JobListing, response_schema, schema_instructions
+from structured_output import StructuredOutputParser, StructuredOutputError
 # Import the automated job application functionality
-from job_application_automator import automated_job_application, get_applications
+from job_application_automator import (
+    automated_job_application, close_application_store, get_application_store, get_applications
+)
+from resume_parser import ResumeParser
+from bulk_parse import ArchiveError, archive_entries, read_archive
+from storage import ApplicationQuery, build_application_query, job_key, normalize_job
+from skills import default_skill_matcher, normalize_skill_text
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +58,14 @@ logger = logging.getLogger(__name__)
 # Initialize the app
 app = FastAPI(title="Dev AI Agent")
 
+# Refuse oversized uploads before their body is read. Added before CORS so
+# the 413 responses still carry CORS headers.
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_upload_bytes=MAX_UPLOAD_BYTES,
+    path_limits={"/resumes/bulk": BULK_MAX_ARCHIVE_BYTES}
+)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -34,18 +76,95 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
-# Gemini API configuration
-genai.configure(api_key=GEMINI_API_KEY)
-
 # Define the model to use with configuration
-model = genai.GenerativeModel(
-    'gemini-1.5-pro',
-    generation_config={
-        'max_output_tokens': MAX_TOKENS,
-        'temperature': TEMPERATURE
-    }
+MODEL_NAME = 'gemini-1.5-pro'
+GENERATION_CONFIG = {
+    'max_output_tokens': MAX_TOKENS,
+    'temperature': TEMPERATURE
+}
+
+# Gemini, or an offline fake / record-replay backend selected with LLM_BACKEND
+llm_backend = create_backend(
+    LLM_BACKEND,
+    MODEL_NAME,
+    GENERATION_CONFIG,
+    api_key=GEMINI_API_KEY,
+    recordings_dir=LLM_RECORDINGS_DIR,
+    fake_latency=LLM_FAKE_LATENCY_SECONDS,
+    fake_responses_path=LLM_FAKE_RESPONSES_PATH
+)
+
+# Persistent cache for model responses, stored next to applications.db
+response_cache = ResponseCache(
+    LLM_CACHE_PATH,
+    ttl_seconds=LLM_CACHE_TTL_SECONDS,
+    max_entries=LLM_CACHE_MAX_ENTRIES,
+    max_bytes=LLM_CACHE_MAX_BYTES
+) if LLM_CACHE_ENABLED else None
+
+# Keeps model calls within the API quota, serving interactive requests before batch work
+scheduler = RequestScheduler(
+    requests_per_minute=LLM_REQUESTS_PER_MINUTE,
+    burst=LLM_RATE_LIMIT_BURST,
+    tokens_per_minute=LLM_TOKENS_PER_MINUTE,
+    max_retries=LLM_MAX_RETRIES,
+    backoff_base=LLM_BACKOFF_BASE_SECONDS,
+    backoff_max=LLM_BACKOFF_MAX_SECONDS,
+    interactive_burst=LLM_INTERACTIVE_BURST,
+    is_rate_limit_error=llm_backend.is_rate_limit_error
 )
 
+# Shared client that every tool goes through for model calls
+llm = LLMClient(
+    llm_backend,
+    GENERATION_CONFIG,
+    cache=response_cache,
+    max_concurrency=LLM_MAX_CONCURRENCY,
+    tool_concurrency=LLM_TOOL_CONCURRENCY,
+    default_timeout=LLM_TIMEOUT_SECONDS,
+    tool_timeouts=LLM_TOOL_TIMEOUTS,
+    tool_concurrency_overrides=LLM_TOOL_CONCURRENCY_OVERRIDES,
+    scheduler=scheduler
+)
+
+# Shared parser for tools that expect JSON from the model
+structured_output = StructuredOutputParser()
+
+# Uploaded resumes by content hash, so tools can be called with a resume_id
+pdf_extractor = PDFExtractor(
+    workers=PDF_WORKERS,
+    timeout=PDF_TIMEOUT_SECONDS,
+    max_pages=PDF_MAX_PAGES,
+    pages_per_task=PDF_PAGES_PER_TASK,
+    max_chars=PDF_MAX_CHARS
+)
+resume_store = ResumeStore(
+    RESUME_STORE_DIR,
+    memory_entries=RESUME_MEMORY_CACHE_SIZE,
+    extractor=pdf_extractor,
+    max_bytes=RESUME_STORE_MAX_BYTES,
+    max_age=RESUME_STORE_MAX_AGE_SECONDS
+)
+
+@app.on_event("shutdown")
+def shutdown_pdf_workers():
+    """Stop the PDF extraction processes with the server"""
+    pdf_extractor.shutdown()
+
+@app.on_event("shutdown")
+def shutdown_application_store():
+    """Finish pending database writes and close the connections"""
+    close_application_store()
+
+async def _parse_response(response: str, prompt: str, model: Any, tool: str, many: bool = False) -> Any:
+    """Parse a JSON model response, removing it from the response cache if it can't be parsed"""
+    try:
+        return structured_output.parse(response, model, tool, many=many)
+    except StructuredOutputError:
+        # Otherwise a retry would be served the same malformed response from the cache
+        await llm.discard(prompt, json_mode=True)
+        raise
+
 # MCP Protocol - Tool definitions
 class ToolParameter(BaseModel):
     name: str
@@ -71,6 +190,7 @@ class MCPRequest(BaseModel):
     text: str
     context: Optional[Dict[str, Any]] = None
     tool_choice: Optional[str] = None
+    use_cache: bool = True
 
 class MCPResponse(BaseModel):
     id: str
@@ -83,7 +203,8 @@ ats_tool = Tool(
     description="Analyzes a resume against a job description to provide an ATS compatibility score",
     parameters=[
         ToolParameter(name="resume_content", type="string", description="The content of the resume", required=True),
-        ToolParameter(name="job_description", type="string", description="The job description text", required=True)
+        ToolParameter(name="job_description", type="string", description="The job description text", required=True),
+        ToolParameter(name="mode", type="string", description="Scoring engine: llm, local (no AI call) or hybrid (local score, AI recommendations)", required=False)
     ]
 )
 
@@ -118,21 +239,48 @@ job_application_tool = Tool(
 
 application_status_tool = Tool(
     name="application_status",
-    description="Gets the status of all job applications",
-    parameters=[]
+    description="Gets the status of job applications, newest first, one page at a time",
+    parameters=[
+        ToolParameter(name="limit", type="integer", description="Applications per page"),
+        ToolParameter(name="cursor", type="string", description="next_cursor from the previous page"),
+        ToolParameter(name="status", type="string", description="Only applications with this status"),
+        ToolParameter(name="company", type="string", description="Only applications to this company"),
+        ToolParameter(name="date_from", type="string", description="Only applications on or after this ISO date or datetime"),
+        ToolParameter(name="date_to", type="string", description="Only applications on or before this ISO date (the whole day) or datetime (inclusive)"),
+        ToolParameter(name="fields", type="string", description="Comma-separated fields to return; resume_data and application_data are only included when listed")
+    ]
 )
 
 available_tools = [ats_tool, job_search_tool, cover_letter_tool, job_application_tool, application_status_tool]
 
 # Tool implementation functions
-async def ats_score_checker(resume_content: str, job_description: str) -> Dict[str, Any]:
-    """Analyze resume against job description for ATS score"""
-    if not GEMINI_API_KEY or GEMINI_API_KEY == "your-api-key-here":
+ATS_MODES = ("llm", "local", "hybrid")
+
+async def ats_score_checker(resume_content: str, job_description: str, use_cache: bool = True, mode: str = ATS_DEFAULT_MODE, priority: str = "interactive") -> Dict[str, Any]:
+    """Analyze resume against job description for ATS score.
+
+    mode selects the scoring engine: "llm" asks Gemini for the whole analysis, "local"
+    scores in-process without any network call, and "hybrid" scores locally and asks
+    Gemini only for the formatting issues and recommendations.
+    """
+    if mode not in ATS_MODES:
+        return {"error": f"Unknown ATS scoring mode: {mode}. Use one of: {', '.join(ATS_MODES)}", "score": 0}
+    
+    if mode == "local":
+        return await _local_ats_score(resume_content, job_description)
+    
+    if api_key_missing():
         logger.error("Invalid or missing Gemini API key in ats_score_checker")
         return {
             "error": "The Gemini API key is not configured. Please add a valid API key to the .env file.",
             "score": 0
         }
+    
+    if mode == "hybrid":
+        return await _hybrid_ats_score(resume_content, job_description, use_cache, priority)
+    
+    resume_content = prepare_resume(resume_content, PROMPT_RESUME_TOKEN_BUDGET)
+    job_description = prepare_job_description(job_description, PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET)
         
     prompt = f"""
     You are an ATS (Applicant Tracking System) expert. 
@@ -151,58 +299,85 @@ async def ats_score_checker(resume_content: str, job_description: str) -> Dict[s
     4. Formatting issues that might affect ATS scanning
     5. Specific recommendations to improve the score
     
-    Format your response as JSON with these exact fields:
-    {{
-        "score": 75,
-        "matching_keywords": ["keyword1", "keyword2"],
-        "missing_keywords": ["keyword3", "keyword4"],
-        "formatting_issues": "Description of formatting issues",
-        "recommendations": "Specific recommendations to improve"
-    }}
-    
-    Make sure to return valid JSON.
+    {schema_instructions(ATSResult)}
     """
     
     try:
-        response = await asyncio.to_thread(
-            lambda: model.generate_content(prompt).text
+        response = await llm.generate(
+            prompt, tool="ats_score_checker", use_cache=use_cache, json_mode=True, priority=priority,
+            schema=response_schema(ATSResult)
         )
-        # Convert string response to JSON if possible
-        try:
-            result = json.loads(response)
-            # Ensure we have all expected fields with defaults if missing
-            return {
-                "score": result.get("score", 50),
-                "matching_keywords": result.get("matching_keywords", []),
-                "missing_keywords": result.get("missing_keywords", []),
-                "formatting_issues": result.get("formatting_issues", "No specific issues detected"),
-                "recommendations": result.get("recommendations", "No specific recommendations")
-            }
-        except json.JSONDecodeError:
-            # If response is not valid JSON, extract a score if possible and return as text
-            import re
-            score_match = re.search(r"score.*?(\d+)", response, re.IGNORECASE)
-            score = int(score_match.group(1)) if score_match else 50
-            return {
-                "score": score,
-                "analysis": response
-            }
+        return await _parse_response(response, prompt, ATSResult, "ats_score_checker")
     except Exception as e:
         logger.error(f"Error in ATS scoring: {str(e)}")
         return {"error": str(e), "score": 0}
 
-async def job_finder(resume_content: str, experience_years: float, location: str, job_type: str = None) -> Dict[str, Any]:
-    """Find relevant job opportunities"""
-    if not GEMINI_API_KEY or GEMINI_API_KEY == "your-api-key-here":
-        logger.error("Invalid or missing Gemini API key in job_finder")
-        return {
-            "error": "The Gemini API key is not configured. Please add a valid API key to the .env file."
-        }
-        
+async def _local_ats_score(resume_content: str, job_description: str) -> Dict[str, Any]:
+    """Score a resume with the in-process keyword engine, with rule-based feedback"""
+    try:
+        result = await asyncio.to_thread(score_resume, resume_content, job_description)
+    except Exception as e:
+        logger.error(f"Error in local ATS scoring: {str(e)}")
+        return {"error": str(e), "score": 0}
+    
+    formatting_issues, recommendations = local_feedback(resume_content, result["missing_keywords"])
+    return {
+        "score": result["score"],
+        "matching_keywords": result["matching_keywords"],
+        "missing_keywords": result["missing_keywords"],
+        "formatting_issues": formatting_issues,
+        "recommendations": recommendations
+    }
+
+async def _hybrid_ats_score(resume_content: str, job_description: str, use_cache: bool = True, priority: str = "interactive") -> Dict[str, Any]:
+    """Score a resume locally and ask Gemini only for the narrative feedback"""
+    result = await _local_ats_score(resume_content, job_description)
+    if "error" in result:
+        return result
+    
+    resume_content = prepare_resume(resume_content, PROMPT_RESUME_TOKEN_BUDGET)
+    job_description = prepare_job_description(job_description, PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET)
+    
+    prompt = f"""
+    You are an ATS (Applicant Tracking System) expert.
+    Review the following resume against the job description provided.
+    Keyword matching has already been done:
+    
+    MATCHING KEYWORDS: {', '.join(result['matching_keywords']) or 'None'}
+    MISSING KEYWORDS: {', '.join(result['missing_keywords']) or 'None'}
+    
+    RESUME:
+    {resume_content}
+    
+    JOB DESCRIPTION:
+    {job_description}
+    
+    Provide only:
+    1. Formatting issues that might affect ATS scanning
+    2. Specific recommendations to improve the score
+    
+    {schema_instructions(ATSFeedback)}
+    """
+    
+    try:
+        response = await llm.generate(
+            prompt, tool="ats_score_checker", use_cache=use_cache, json_mode=True, priority=priority,
+            schema=response_schema(ATSFeedback)
+        )
+        result.update(await _parse_response(response, prompt, ATSFeedback, "ats_score_checker"))
+    except Exception as e:
+        # The local score is still valid, so keep the rule-based feedback
+        logger.warning(f"Falling back to local ATS feedback: {str(e)}")
+    
+    return result
+
+def _job_finder_prompt(resume_content: str, experience_years: float, location: str, job_type: str = None) -> str:
+    """Build the job search prompt shared by the regular and streaming endpoints"""
     job_type_text = f", job type: {job_type}" if job_type else ""
+    resume_content = prepare_resume(resume_content, PROMPT_RESUME_TOKEN_BUDGET)
     
     # Using format() method instead of f-string to avoid issues with nested curly braces
-    prompt = """
+    return """
     You are an expert job search assistant.
     Find relevant job opportunities based on the following:
     
@@ -226,130 +401,88 @@ async def job_finder(resume_content: str, experience_years: float, location: str
        Do NOT use placeholder, example.com, or localhost URLs.
        This is critical - the user needs real links to apply to jobs.
     
-    Format your response as a JSON array of job objects with EXACTLY these field names.
-    Make sure to escape all quotes in string values.
     IMPORTANT: You must include ALL of the fields listed above for EACH job.
     You must return at least 5 job listings.
     
-    Example format (DO NOT COPY THIS EXAMPLE VERBATIM):
-    [
-      {{
-        "job_title": "Software Engineer",
-        "company_name": "Tech Company",
-        "location": "San Francisco, CA (Remote)",
-        "job_description": "Description of the role",
-        "required_qualifications": "Bachelor's degree in CS",
-        "experience_required": "3-5",
-        "skills_required": "JavaScript, React",
-        "estimated_salary_range": "$100,000 - $130,000",
-        "application_link": "https://www.linkedin.com/jobs/view/3579246352"
-      }}
-    ]
+    {schema}
     """.format(
         resume_content=resume_content,
         experience_years=experience_years,
         location=location,
-        job_type_text=job_type_text
+        job_type_text=job_type_text,
+        schema=schema_instructions(JobListing, many=True)
     )
+
+def _job_search_key(resume_content: str, experience_years: float, location: str, job_type: Optional[str] = None) -> str:
+    """
+    Identify a job search by what it asks for: the resume's skills, experience, location and job type.
+
+    Resumes with the same skills share results; a resume with no known skills
+    is identified by its whole text instead.
+    """
+    skills = sorted(default_skill_matcher().find(resume_content))
+    search = {
+        "skills": skills or hashlib.sha256(normalize_skill_text(resume_content).strip().encode("utf-8")).hexdigest(),
+        "experience_years": round(float(experience_years)),
+        "location": normalize_skill_text(location or "").strip(),
+        "job_type": normalize_skill_text(job_type or "").strip()
+    }
+    return hashlib.sha256(json.dumps(search, sort_keys=True).encode("utf-8")).hexdigest()
+
+async def _stored_jobs(search_key: str, use_cache: bool) -> Optional[List[Dict[str, Any]]]:
+    """Return the stored results of a recent identical search, if reuse is allowed"""
+    if not use_cache or JOB_SEARCH_TTL_SECONDS <= 0:
+        return None
+    try:
+        jobs = await get_application_store().get_search_results(search_key, JOB_SEARCH_TTL_SECONDS)
+    except Exception as e:
+        logger.error(f"Error reading stored job search results: {str(e)}")
+        return None
+    if jobs:
+        logger.info(f"Answered job search {search_key[:12]} with {len(jobs)} stored jobs")
+    return jobs
+
+async def _store_jobs(search_key: str, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Store a search's jobs for reuse, returning them normalized and deduplicated"""
+    if JOB_SEARCH_TTL_SECONDS <= 0 or not jobs:
+        return jobs
+    try:
+        return await get_application_store().save_search_results(search_key, jobs, JOB_SEARCH_TTL_SECONDS)
+    except Exception as e:
+        logger.error(f"Error storing job search results: {str(e)}")
+        return jobs
+
+async def job_finder(resume_content: str, experience_years: float, location: str, job_type: str = None, use_cache: bool = True) -> Dict[str, Any]:
+    """Find relevant job opportunities, reusing the results of a recent identical search"""
+    search_key = _job_search_key(resume_content, experience_years, location, job_type)
+    stored = await _stored_jobs(search_key, use_cache)
+    if stored:
+        return stored
+    
+    if api_key_missing():
+        logger.error("Invalid or missing Gemini API key in job_finder")
+        return {
+            "error": "The Gemini API key is not configured. Please add a valid API key to the .env file."
+        }
+    
+    prompt = _job_finder_prompt(resume_content, experience_years, location, job_type)
     
     try:
-        response = await asyncio.to_thread(
-            lambda: model.generate_content(prompt).text
+        response = await llm.generate(
+            prompt, tool="job_finder", use_cache=use_cache, json_mode=True, schema=response_schema(JobListing, many=True)
         )
         logger.info(f"Raw job finder response received: {response[:100]}...")
-        
-        # Try to clean up the response before parsing
-        response = response.strip()
-        
-        # Handle cases where the response has markdown code blocks
-        if response.startswith("```json") and "```" in response:
-            response = response.split("```json")[1].split("```")[0].strip()
-        elif response.startswith("```") and "```" in response:
-            response = response.split("```")[1].split("```")[0].strip()
-        
-        # Convert string response to JSON if possible
-        try:
-            # First attempt: direct JSON parsing
-            json_response = json.loads(response)
-            
-            # Handle different response formats
-            # If it's an array, return it directly
-            if isinstance(json_response, list):
-                return json_response
-            # If it's an object with job-related keys, wrap it in an array
-            elif isinstance(json_response, dict) and any(key in json_response for key in ['job_title', 'title', 'company', 'company_name']):
-                return [json_response]
-            # Otherwise, return it as is
-            else:
-                return json_response
-                
-        except json.JSONDecodeError as json_err:
-            logger.warning(f"Could not parse job finder response as JSON: {str(json_err)}")
-            
-            # Try to extract JSON array from response
-            import re
-            
-            # Look for a JSON array pattern
-            array_match = re.search(r'\[\s*\{.*?\}\s*\]', response, re.DOTALL)
-            if array_match:
-                try:
-                    json_array = array_match.group(0)
-                    jobs = json.loads(json_array)
-                    logger.info(f"Successfully extracted JSON array with {len(jobs)} jobs")
-                    return jobs
-                except json.JSONDecodeError as arr_err:
-                    logger.warning(f"Failed to parse extracted array: {str(arr_err)}")
-            
-            # If we can't extract valid JSON, create a structured response from the text
-            try:
-                logger.info("Attempting to create structured job data from text")
-                # Attempt to create a fallback response with structured data
-                fallback_jobs = []
-                
-                # Parse job information from text using regex patterns
-                job_blocks = re.findall(r'(?:Job Title|Title|job_title):\s*(.+?)(?:\n|$).*?(?:Company|Company Name|company_name):\s*(.+?)(?:\n|$).*?(?:Location|location):\s*(.+?)(?:\n|$)', 
-                                       response, re.DOTALL | re.IGNORECASE)
-                
-                for i, (title, company, location) in enumerate(job_blocks[:5]):
-                    # Create a more realistic application link
-                    company_slug = ''.join(e for e in company.strip().lower().replace(' ', '-') if e.isalnum() or e == '-')
-                    title_slug = ''.join(e for e in title.strip().lower().replace(' ', '-') if e.isalnum() or e == '-')
-                    job_id = i + 100000 + (hash(title + company) % 900000)  # Use hash for more unique IDs
-                    
-                    fallback_jobs.append({
-                        "job_title": title.strip(),
-                        "company_name": company.strip(),
-                        "location": location.strip(),
-                        "job_description": f"See full description on job posting site",
-                        "required_qualifications": "See full job posting for details",
-                        "experience_required": "Not specified",
-                        "skills_required": "Not specified",
-                        "estimated_salary_range": "Not specified",
-                        "application_link": f"https://www.linkedin.com/jobs/view/{company_slug}-{title_slug}-{job_id}"
-                    })
-                
-                # If we found at least one job, return the fallback array
-                if fallback_jobs:
-                    logger.info(f"Created {len(fallback_jobs)} fallback job entries from text response")
-                    return fallback_jobs
-            except Exception as e:
-                logger.error(f"Error creating fallback job entries: {str(e)}")
-            
-            # If all else fails, return the raw text
-            return {"jobs": response}
+        jobs = await _parse_response(response, prompt, JobListing, "job_finder", many=True)
+        return await _store_jobs(search_key, jobs)
     except Exception as e:
         logger.error(f"Error in job finding: {str(e)}")
         return {"error": str(e)}
 
-async def cover_letter_generator(resume_content: str, job_description: str) -> Dict[str, Any]:
-    """Generate a professional cover letter"""
-    if not GEMINI_API_KEY or GEMINI_API_KEY == "your-api-key-here":
-        logger.error("Invalid or missing Gemini API key in cover_letter_generator")
-        return {
-            "error": "The Gemini API key is not configured. Please add a valid API key to the .env file."
-        }
-        
-    prompt = f"""
+def _cover_letter_prompt(resume_content: str, job_description: str) -> str:
+    """Build the cover letter prompt shared by the regular and streaming endpoints"""
+    resume_content = prepare_resume(resume_content, PROMPT_RESUME_TOKEN_BUDGET)
+    job_description = prepare_job_description(job_description, PROMPT_JOB_DESCRIPTION_TOKEN_BUDGET)
+    return f"""
     You are an expert cover letter writer.
     Create a professional, personalized cover letter based on the following:
     
@@ -368,19 +501,27 @@ async def cover_letter_generator(resume_content: str, job_description: str) -> D
     
     Return just the text of the cover letter, properly formatted with paragraphs.
     """
+
+async def cover_letter_generator(resume_content: str, job_description: str, use_cache: bool = True) -> Dict[str, Any]:
+    """Generate a professional cover letter"""
+    if api_key_missing():
+        logger.error("Invalid or missing Gemini API key in cover_letter_generator")
+        return {
+            "error": "The Gemini API key is not configured. Please add a valid API key to the .env file."
+        }
+        
+    prompt = _cover_letter_prompt(resume_content, job_description)
     
     try:
-        response = await asyncio.to_thread(
-            lambda: model.generate_content(prompt).text
-        )
+        response = await llm.generate(prompt, tool="cover_letter_generator", use_cache=use_cache)
         return {"cover_letter": response}
     except Exception as e:
         logger.error(f"Error in cover letter generation: {str(e)}")
         return {"error": str(e)}
 
-async def job_applicator(resume_content: str, job_data: Dict[str, Any]) -> Dict[str, Any]:
+async def job_applicator(resume_content: str, job_data: Dict[str, Any], parsed_resume: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Apply to a job automatically using the user's resume"""
-    if not GEMINI_API_KEY or GEMINI_API_KEY == "your-api-key-here":
+    if api_key_missing():
         logger.error("Invalid or missing Gemini API key in job_applicator")
         return {
             "error": "The Gemini API key is not configured. Please add a valid API key to the .env file."
@@ -388,52 +529,163 @@ async def job_applicator(resume_content: str, job_data: Dict[str, Any]) -> Dict[
     
     try:
         # Call the automated job application function
-        result = await automated_job_application(job_data, resume_content)
+        result = await automated_job_application(job_data, resume_content, parsed_resume)
         return result
     except Exception as e:
         logger.error(f"Error in job application: {str(e)}")
         return {"error": str(e)}
 
-async def application_status() -> Dict[str, Any]:
-    """Get the status of all job applications"""
-    if not GEMINI_API_KEY or GEMINI_API_KEY == "your-api-key-here":
+async def application_status(query: Optional[ApplicationQuery] = None) -> Dict[str, Any]:
+    """Get the status of job applications, one page at a time"""
+    if api_key_missing():
         logger.error("Invalid or missing Gemini API key in application_status")
         return {
             "error": "The Gemini API key is not configured. Please add a valid API key to the .env file."
         }
     
     try:
-        # Get all applications
-        result = await get_applications()
+        # Get one page of applications
+        result = await get_applications(query)
         return result
     except Exception as e:
         logger.error(f"Error getting application status: {str(e)}")
         return {"error": str(e)}
 
 # MCP Protocol endpoints
+MCP_SYSTEM_PROMPT = """You are an AI assistant for job seekers. You have access to these tools:
+        1. ats_score_checker - Analyzes a resume against a job description for ATS compatibility
+        2. job_finder - Finds relevant job opportunities based on user criteria
+        3. cover_letter_generator - Creates a professional cover letter based on resume and job description
+        4. job_applicator - Automatically applies to a job using the user's resume
+        5. application_status - Gets the status of all job applications
+        
+        Help the user with job applications by asking for necessary information and using the appropriate tool.
+        """
+
+def _format_tool_results(tool_results: Dict[str, Any]) -> str:
+    """Format the result of a tool call as a chat reply"""
+    formatted_response = ""
+    if tool_results.get("name") == "ats_score_checker":
+        result = tool_results.get("result", {})
+        score = result.get("score", "N/A")
+        formatted_response = f"Here is your ATS analysis:\n\n"
+        
+        if "analysis" in result:
+            formatted_response += result["analysis"]
+        else:
+            # Detailed formatting for structured JSON response
+            formatted_response += f"Score: {score}/100\n\n"
+            if "matching_keywords" in result:
+                formatted_response += f"Matching Keywords: {', '.join(result['matching_keywords'])}\n\n"
+            if "missing_keywords" in result:
+                formatted_response += f"Missing Keywords: {', '.join(result['missing_keywords'])}\n\n"
+            if "formatting_issues" in result:
+                formatted_response += f"Formatting Issues: {result['formatting_issues']}\n\n"
+            if "recommendations" in result:
+                formatted_response += f"Recommendations: {result['recommendations']}\n\n"
+    
+    elif tool_results.get("name") == "job_finder":
+        formatted_response = "Here are the job opportunities I found for you:\n\n"
+        jobs = tool_results.get("result", [])
+        
+        if isinstance(jobs, list):
+            for i, job in enumerate(jobs, 1):
+                formatted_response += f"**{i}. {job.get('title', 'Job Title')} - {job.get('company', 'Company')}**\n"
+                formatted_response += f"Location: {job.get('location', 'N/A')}\n"
+                formatted_response += f"Description: {job.get('description', 'N/A')}\n"
+                formatted_response += f"Required Qualifications: {job.get('qualifications', 'N/A')}\n"
+                formatted_response += f"Salary Range: {job.get('salary_range', 'N/A')}\n"
+                formatted_response += f"Apply at: {job.get('application_link', 'N/A')}\n\n"
+        else:
+            formatted_response += str(jobs)
+    
+    elif tool_results.get("name") == "cover_letter_generator":
+        formatted_response = "Here is your generated cover letter:\n\n"
+        formatted_response += tool_results.get("result", {}).get("cover_letter", "Could not generate cover letter.")
+    
+    elif tool_results.get("name") == "job_applicator":
+        formatted_response = "Job application submitted successfully."
+        # Include any additional status information from the result
+        result = tool_results.get("result", {})
+        if isinstance(result, dict):
+            if "application_link" in result:
+                formatted_response += f"\nYou can check the application status at: {result['application_link']}"
+            if "status" in result:
+                formatted_response += f"\nApplication status: {result['status']}"
+    
+    return formatted_response
+
+# Placeholder parameters the frontend fills in for each tool
+TOOL_CALL_PARAMETERS = {
+    "ats_score_checker": ["resume_content", "job_description"],
+    "job_finder": ["resume_content", "experience_years", "location", "job_type"],
+    "cover_letter_generator": ["resume_content", "job_description"],
+    "job_applicator": ["resume_content", "job_data"],
+    "application_status": []
+}
+
+# Replies used when the intent is clear enough that no chat model call is needed
+TOOL_REPLY_TEMPLATES = {
+    "ats_score_checker": "I can check how well your resume matches a job. Please upload your resume and paste the job description.",
+    "job_finder": "I can find jobs that fit your background. Please upload your resume and tell me your years of experience and preferred location.",
+    "cover_letter_generator": "I can write a cover letter for you. Please upload your resume and paste the job description.",
+    "job_applicator": "I can start the application for you. Please upload your resume and choose the job you want to apply to.",
+    "application_status": "Here is the status of your job applications."
+}
+
+def _tool_calls_for(tool_name: Optional[str]) -> Optional[List[ToolCall]]:
+    """Build the tool call for a routed tool, with placeholder parameters"""
+    if tool_name not in TOOL_CALL_PARAMETERS:
+        return None
+    return [
+        ToolCall(
+            id=str(uuid.uuid4()),
+            name=tool_name,
+            parameters=[
+                ToolCallParameter(name=name, value="${" + name + "}")
+                for name in TOOL_CALL_PARAMETERS[tool_name]
+            ]
+        )
+    ]
+
+async def _classify_intent_with_llm(user_message: str) -> Optional[str]:
+    """Ask the model which tool a message needs, used only for low-confidence messages"""
+    prompt = f"""
+    Classify the user's message for a job-seeker assistant.
+    Reply with exactly one of: {', '.join(TOOL_CALL_PARAMETERS)}, none
+    
+    Message: {user_message}
+    """
+    answer = (await llm.generate(prompt, tool="mcp")).strip().lower()
+    return answer if answer in TOOL_CALL_PARAMETERS else None
+
+intent_router = IntentRouter(
+    threshold=INTENT_CONFIDENCE_THRESHOLD,
+    fallback=_classify_intent_with_llm if INTENT_LLM_FALLBACK else None
+)
+
+def _sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Encode a Server-Sent Events message"""
+    message = f"event: {event}\n" if event else ""
+    return message + f"data: {json.dumps(data)}\n\n"
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"  # Stop reverse proxies from buffering the stream
+}
+
 @app.post("/mcp")
 async def mcp_endpoint(request: MCPRequest) -> MCPResponse:
     """Main MCP endpoint for handling agent requests"""
     try:
         # Check if API key is valid
-        if not GEMINI_API_KEY or GEMINI_API_KEY == "your-api-key-here":
+        if api_key_missing():
             logger.error("Invalid or missing Gemini API key")
             return MCPResponse(
                 id=str(uuid.uuid4()),
                 text="Error: The Gemini API key is not configured. Please add a valid API key to the .env file.",
                 tool_calls=None
             )
-            
-        # Generate response to user query with tool definitions
-        system_prompt = """You are an AI assistant for job seekers. You have access to these tools:
-        1. ats_score_checker - Analyzes a resume against a job description for ATS compatibility
-        2. job_finder - Finds relevant job opportunities based on user criteria
-        3. cover_letter_generator - Creates a professional cover letter based on resume and job description
-        4. job_applicator - Automatically applies to a job using the user's resume
-        5. application_status - Gets the status of all job applications
-        
-        Help the user with job applications by asking for necessary information and using the appropriate tool.
-        """
         
         user_message = request.text
         context = request.context or {}
@@ -441,70 +693,26 @@ async def mcp_endpoint(request: MCPRequest) -> MCPResponse:
         # Check if this is a tool response call
         if 'tool_results' in context:
             logger.info(f"Received tool results: {context['tool_results']}")
-            tool_results = context['tool_results']
-            
-            # Format a response based on the tool results
-            formatted_response = ""
-            if tool_results.get("name") == "ats_score_checker":
-                result = tool_results.get("result", {})
-                score = result.get("score", "N/A")
-                formatted_response = f"Here is your ATS analysis:\n\n"
-                
-                if "analysis" in result:
-                    formatted_response += result["analysis"]
-                else:
-                    # Detailed formatting for structured JSON response
-                    formatted_response += f"Score: {score}/100\n\n"
-                    if "matching_keywords" in result:
-                        formatted_response += f"Matching Keywords: {', '.join(result['matching_keywords'])}\n\n"
-                    if "missing_keywords" in result:
-                        formatted_response += f"Missing Keywords: {', '.join(result['missing_keywords'])}\n\n"
-                    if "formatting_issues" in result:
-                        formatted_response += f"Formatting Issues: {result['formatting_issues']}\n\n"
-                    if "recommendations" in result:
-                        formatted_response += f"Recommendations: {result['recommendations']}\n\n"
-            
-            elif tool_results.get("name") == "job_finder":
-                formatted_response = "Here are the job opportunities I found for you:\n\n"
-                jobs = tool_results.get("result", [])
-                
-                if isinstance(jobs, list):
-                    for i, job in enumerate(jobs, 1):
-                        formatted_response += f"**{i}. {job.get('title', 'Job Title')} - {job.get('company', 'Company')}**\n"
-                        formatted_response += f"Location: {job.get('location', 'N/A')}\n"
-                        formatted_response += f"Description: {job.get('description', 'N/A')}\n"
-                        formatted_response += f"Required Qualifications: {job.get('qualifications', 'N/A')}\n"
-                        formatted_response += f"Salary Range: {job.get('salary_range', 'N/A')}\n"
-                        formatted_response += f"Apply at: {job.get('application_link', 'N/A')}\n\n"
-                else:
-                    formatted_response += str(jobs)
-            
-            elif tool_results.get("name") == "cover_letter_generator":
-                formatted_response = "Here is your generated cover letter:\n\n"
-                formatted_response += tool_results.get("result", {}).get("cover_letter", "Could not generate cover letter.")
-            
-            elif tool_results.get("name") == "job_applicator":
-                formatted_response = "Job application submitted successfully."
-                # Include any additional status information from the result
-                result = tool_results.get("result", {})
-                if isinstance(result, dict):
-                    if "application_link" in result:
-                        formatted_response += f"\nYou can check the application status at: {result['application_link']}"
-                    if "status" in result:
-                        formatted_response += f"\nApplication status: {result['status']}"
-            
             return MCPResponse(
                 id=str(uuid.uuid4()),
-                text=formatted_response,
+                text=_format_tool_results(context['tool_results']),
                 tool_calls=None
             )
         
+        # Route the message first; a clear tool intent needs no chat model call
+        intent = await intent_router.route(user_message)
+        if intent_router.is_confident(intent):
+            logger.info(f"Routed message to {intent.tool} ({intent.source}, confidence {intent.confidence})")
+            return MCPResponse(
+                id=str(uuid.uuid4()),
+                text=TOOL_REPLY_TEMPLATES[intent.tool],
+                tool_calls=_tool_calls_for(intent.tool)
+            )
+        
         # No tool results, this is an initial user query
-        prompt = f"{system_prompt}\n\nUser: {user_message}"
+        prompt = f"{MCP_SYSTEM_PROMPT}\n\nUser: {user_message}"
         try:
-            response = await asyncio.to_thread(
-                lambda: model.generate_content(prompt).text
-            )
+            response = await llm.generate(prompt, tool="mcp", use_cache=request.use_cache)
         except Exception as e:
             logger.error(f"Error generating content with Gemini API: {str(e)}")
             return MCPResponse(
@@ -513,140 +721,258 @@ async def mcp_endpoint(request: MCPRequest) -> MCPResponse:
                 tool_calls=None
             )
         
-        # Check if we need to call a tool based on the user's request
-        tool_calls = None
-        
-        # Simple intent detection
-        user_message_lower = user_message.lower()
-        if "ats" in user_message_lower or "score" in user_message_lower or "resume review" in user_message_lower:
-            # Need resume and job description
-            tool_calls = [
-                ToolCall(
-                    id=str(uuid.uuid4()),
-                    name="ats_score_checker",
-                    parameters=[
-                        ToolCallParameter(name="resume_content", value="${resume_content}"),
-                        ToolCallParameter(name="job_description", value="${job_description}")
-                    ]
-                )
-            ]
-        elif "job" in user_message_lower or "find" in user_message_lower or "search" in user_message_lower:
-            # Need resume, experience, location
-            tool_calls = [
-                ToolCall(
-                    id=str(uuid.uuid4()),
-                    name="job_finder",
-                    parameters=[
-                        ToolCallParameter(name="resume_content", value="${resume_content}"),
-                        ToolCallParameter(name="experience_years", value="${experience_years}"),
-                        ToolCallParameter(name="location", value="${location}"),
-                        ToolCallParameter(name="job_type", value="${job_type}")
-                    ]
-                )
-            ]
-        elif "cover letter" in user_message_lower or "letter" in user_message_lower:
-            # Need resume and job description
-            tool_calls = [
-                ToolCall(
-                    id=str(uuid.uuid4()),
-                    name="cover_letter_generator",
-                    parameters=[
-                        ToolCallParameter(name="resume_content", value="${resume_content}"),
-                        ToolCallParameter(name="job_description", value="${job_description}")
-                    ]
-                )
-            ]
-        elif "apply" in user_message_lower or "application" in user_message_lower:
-            # Need resume and job data
-            tool_calls = [
-                ToolCall(
-                    id=str(uuid.uuid4()),
-                    name="job_applicator",
-                    parameters=[
-                        ToolCallParameter(name="resume_content", value="${resume_content}"),
-                        ToolCallParameter(name="job_data", value="${job_data}")
-                    ]
-                )
-            ]
-        elif "status" in user_message_lower or "application status" in user_message_lower:
-            # No parameters needed, just call the status tool
-            tool_calls = [
-                ToolCall(
-                    id=str(uuid.uuid4()),
-                    name="application_status",
-                    parameters=[]
-                )
-            ]
-            
         return MCPResponse(
             id=str(uuid.uuid4()),
             text=response,
-            tool_calls=tool_calls
+            tool_calls=_tool_calls_for(intent.tool)
         )
     
     except Exception as e:
         logger.error(f"Error in MCP endpoint: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/mcp/stream")
+async def mcp_stream_endpoint(request: MCPRequest):
+    """Streaming MCP endpoint that sends the reply as Server-Sent Events.
+
+    Emits "chunk" events with reply text as it is generated, then a "done" event
+    carrying the response id and any tool calls, or an "error" event on failure.
+    """
+    response_id = str(uuid.uuid4())
+
+    async def event_stream():
+        if api_key_missing():
+            logger.error("Invalid or missing Gemini API key")
+            yield _sse_event({"error": "The Gemini API key is not configured. Please add a valid API key to the .env file."}, "error")
+            return
+        
+        context = request.context or {}
+        if 'tool_results' in context:
+            logger.info(f"Received tool results: {context['tool_results']}")
+            yield _sse_event({"text": _format_tool_results(context['tool_results'])}, "chunk")
+            yield _sse_event({"id": response_id, "tool_calls": None}, "done")
+            return
+        
+        intent = await intent_router.route(request.text)
+        if intent_router.is_confident(intent):
+            logger.info(f"Routed message to {intent.tool} ({intent.source}, confidence {intent.confidence})")
+            tool_calls = _tool_calls_for(intent.tool)
+            yield _sse_event({"text": TOOL_REPLY_TEMPLATES[intent.tool]}, "chunk")
+            yield _sse_event({"id": response_id, "tool_calls": [tool_call.model_dump() for tool_call in tool_calls]}, "done")
+            return
+        
+        prompt = f"{MCP_SYSTEM_PROMPT}\n\nUser: {request.text}"
+        try:
+            async for chunk in llm.stream(prompt, tool="mcp", use_cache=request.use_cache):
+                yield _sse_event({"text": chunk}, "chunk")
+        except Exception as e:
+            logger.error(f"Error streaming content from Gemini API: {str(e)}")
+            yield _sse_event({"error": f"Sorry, there was an error communicating with the AI service: {str(e)}."}, "error")
+            return
+        
+        tool_calls = _tool_calls_for(intent.tool)
+        yield _sse_event({
+            "id": response_id,
+            "tool_calls": [tool_call.model_dump() for tool_call in tool_calls] if tool_calls else None
+        }, "done")
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
 # API endpoints for direct tool access
+async def _resolve_resume(resume: Optional[UploadFile], resume_id: Optional[str]) -> StoredResume:
+    """Return the resume for a request from an upload or a resume_id from /resumes"""
+    if resume_id:
+        stored = await resume_store.get(resume_id)
+        if stored is None:
+            raise HTTPException(status_code=404, detail=f"Resume not found: {resume_id}. Upload it again with POST /resumes.")
+        return stored
+    if resume is None:
+        raise HTTPException(status_code=400, detail="Either a resume file or a resume_id is required")
+    
+    # Uploads go through the store too, so re-uploading the same file skips reading and extraction
+    try:
+        resume_id = await hash_upload(resume, MAX_UPLOAD_BYTES)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    try:
+        return await resume_store.add_hashed(resume_id, resume.filename, resume.read)
+    except ResumeExtractionError as e:
+        raise HTTPException(status_code=422, detail=f"Could not read the resume: {str(e)}")
+
+@app.post("/resumes")
+async def upload_resume(resume: UploadFile = File(...)):
+    """Store a resume and return its resume_id for use with the tool endpoints"""
+    stored = await _resolve_resume(resume, None)
+    return JSONResponse(content=stored.summary())
+
+@app.post("/resumes/bulk")
+async def upload_resume_archive(archive: UploadFile = File(...)):
+    """Store every resume in a zip archive, streaming progress as newline-delimited JSON.
+
+    Resumes are extracted and parsed in parallel worker processes. Each line is
+    {"done", "total", "filename", "resume_id", "parsed"} for a stored resume or
+    {"done", "total", "filename", "error"} for one that couldn't be read, in the
+    order they finish, followed by {"finished": true, "total", "stored", "failed"}.
+    """
+    try:
+        # Reading the central directory seeks through the spooled upload, which may be on disk
+        zip_file = await asyncio.to_thread(zipfile.ZipFile, archive.file)
+        entries, oversized = archive_entries(zip_file, BULK_MAX_FILES, MAX_UPLOAD_BYTES)
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=400, detail="The upload is not a valid zip archive")
+    except ArchiveError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    async def progress():
+        total = len(entries) + len(oversized)
+        done = stored = 0
+        # Content read for parsing is kept until its result arrives, so storing a
+        # resume doesn't decompress it a second time. Only the parser's read-ahead
+        # of a few files per worker is held at once.
+        contents: Dict[str, List[bytes]] = {}
+        
+        def documents():
+            for filename, content in read_archive(zip_file, entries):
+                contents.setdefault(filename, []).append(content)
+                yield filename, content
+        
+        def take_content(result: Dict[str, Any]) -> bytes:
+            candidates = contents[result["filename"]]
+            index = 0
+            if len(candidates) > 1:
+                # The archive repeats this filename, so match on the content hash
+                hashes = [hashlib.sha256(content).hexdigest() for content in candidates]
+                index = hashes.index(result["resume_id"])
+            content = candidates.pop(index)
+            if not candidates:
+                del contents[result["filename"]]
+            return content
+        
+        results = ResumeParser().parse_many(documents(), workers=BULK_PARSE_WORKERS, max_chars=PDF_MAX_CHARS)
+        try:
+            for info in oversized:
+                done += 1
+                yield json.dumps({"done": done, "total": total, "filename": info.filename, "error": "The file is too large"}) + "\n"
+            
+            while True:
+                # The parser blocks while it waits for workers, so it is advanced in a thread
+                result = await asyncio.to_thread(next, results, None)
+                if result is None:
+                    break
+                done += 1
+                line = {"done": done, "total": total, "filename": result["filename"], "resume_id": result["resume_id"]}
+                content = take_content(result)
+                if "error" in result:
+                    line["error"] = result["error"]
+                else:
+                    await resume_store.put(content, result["filename"], result["text"], result["parsed"], result["resume_id"])
+                    line["parsed"] = result["parsed"]
+                    stored += 1
+                yield json.dumps(line) + "\n"
+        except Exception as e:
+            logger.error(f"Error in bulk resume upload: {str(e)}")
+            yield json.dumps({"error": str(e)}) + "\n"
+            return
+        finally:
+            await asyncio.to_thread(results.close)
+            zip_file.close()
+        
+        yield json.dumps({"finished": True, "total": total, "stored": stored, "failed": done - stored}) + "\n"
+    
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+@app.get("/resumes/{resume_id}")
+async def get_resume(resume_id: str):
+    """Return the stored metadata and parsed structure of a resume"""
+    stored = await _resolve_resume(None, resume_id)
+    return JSONResponse(content=stored.summary())
+
 @app.post("/tools/ats_score_checker")
 async def api_ats_score_checker(
-    resume: UploadFile = File(...),
-    job_description: str = Form(...)
+    resume: Optional[UploadFile] = File(None),
+    resume_id: Optional[str] = Form(None),
+    job_description: str = Form(...),
+    use_cache: bool = Form(True),
+    mode: str = Form(ATS_DEFAULT_MODE)
 ):
     """API endpoint for ATS score checking"""
+    resume_text = (await _resolve_resume(resume, resume_id)).text
     try:
-        # Read the file content
-        resume_content = await resume.read()
-        
-        # Check if it's a PDF
-        if resume.filename.lower().endswith('.pdf'):
-            # Extract text from PDF
-            resume_text = extract_text_from_pdf(resume_content)
-            if not resume_text:
-                resume_text = "[Could not extract text from the PDF. Please ensure it's a valid PDF with text content.]"
-        else:
-            # Try to decode as text
-            try:
-                resume_text = resume_content.decode("utf-8")
-            except UnicodeDecodeError:
-                # Not a text file
-                resume_text = f"[Could not decode file {resume.filename}. Please upload a PDF or text file.]"
-        
         # Log the first 200 characters of the extracted text for debugging
         logger.info(f"Extracted resume text (first 200 chars): {resume_text[:200]}...")
         
         # Call the ATS scorer with the extracted text
-        result = await ats_score_checker(resume_text, job_description)
+        result = await ats_score_checker(resume_text, job_description, use_cache=use_cache, mode=mode)
         return JSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in ATS score API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/tools/ats_score_checker/batch")
+async def api_ats_score_checker_batch(
+    resume: Optional[UploadFile] = File(None),
+    resume_id: Optional[str] = Form(None),
+    job_descriptions: str = Form(...),
+    concurrency: int = Form(ATS_BATCH_CONCURRENCY),
+    use_cache: bool = Form(True),
+    mode: str = Form(ATS_DEFAULT_MODE)
+):
+    """Score one resume against many job descriptions.
+
+    job_descriptions is a JSON array of strings. The resume is extracted once and
+    results are streamed back as NDJSON in completion order, one line per job
+    description: {"index": <position in the array>, "result": <ats_score_checker result>}.
+    """
+    try:
+        descriptions = json.loads(job_descriptions)
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid job descriptions format. Must be a JSON array of strings.")
+    
+    if not isinstance(descriptions, list) or not all(isinstance(jd, str) for jd in descriptions):
+        raise HTTPException(status_code=400, detail="Invalid job descriptions format. Must be a JSON array of strings.")
+    if not descriptions:
+        raise HTTPException(status_code=400, detail="At least one job description is required")
+    if len(descriptions) > ATS_BATCH_MAX_JOBS:
+        raise HTTPException(status_code=400, detail=f"At most {ATS_BATCH_MAX_JOBS} job descriptions can be scored per request")
+    if mode not in ATS_MODES:
+        raise HTTPException(status_code=400, detail=f"Unknown ATS scoring mode: {mode}. Use one of: {', '.join(ATS_MODES)}")
+    
+    resume_text = (await _resolve_resume(resume, resume_id)).text
+    logger.info(f"Batch ATS scoring {len(descriptions)} job descriptions")
+    
+    limit = asyncio.Semaphore(max(1, min(concurrency, ATS_BATCH_CONCURRENCY)))
+
+    async def score(index: int, job_description: str):
+        async with limit:
+            # Batch work yields to interactive requests in the scheduler
+            return index, await ats_score_checker(resume_text, job_description, use_cache=use_cache, mode=mode, priority="batch")
+
+    async def result_stream():
+        tasks = [asyncio.ensure_future(score(i, jd)) for i, jd in enumerate(descriptions)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+                yield json.dumps({"index": index, "result": result}) + "\n"
+        finally:
+            # Stop outstanding work if the client goes away
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(result_stream(), media_type="application/x-ndjson")
+
 @app.post("/tools/job_finder")
 async def api_job_finder(
-    resume: UploadFile = File(...),
+    resume: Optional[UploadFile] = File(None),
+    resume_id: Optional[str] = Form(None),
     experience_years: float = Form(...),
     location: str = Form(...),
-    job_type: Optional[str] = Form(None)
+    job_type: Optional[str] = Form(None),
+    use_cache: bool = Form(True)
 ):
     """API endpoint for job finding"""
+    resume_text = (await _resolve_resume(resume, resume_id)).text
     try:
-        # Read the file content
-        resume_content = await resume.read()
-        
-        # Extract text based on file type
-        if resume.filename.lower().endswith('.pdf'):
-            resume_text = extract_text_from_pdf(resume_content)
-            if not resume_text:
-                resume_text = "[Could not extract text from the PDF]"
-        else:
-            try:
-                resume_text = resume_content.decode("utf-8")
-            except UnicodeDecodeError:
-                resume_text = f"[Could not decode file {resume.filename}]"
-        
-        result = await job_finder(resume_text, experience_years, location, job_type)
+        result = await job_finder(resume_text, experience_years, location, job_type, use_cache=use_cache)
         
         # Log response type and partial content for debugging
         if isinstance(result, list):
@@ -698,54 +1024,130 @@ async def api_job_finder(
         logger.error(f"Error in job finder API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/tools/job_finder/stream")
+async def api_job_finder_stream(
+    resume: Optional[UploadFile] = File(None),
+    resume_id: Optional[str] = Form(None),
+    experience_years: float = Form(...),
+    location: str = Form(...),
+    job_type: Optional[str] = Form(None),
+    use_cache: bool = Form(True)
+):
+    """Streaming job search as newline-delimited JSON.
+
+    Each line is {"index": n, "job": {...}}, written as soon as the model finishes
+    that job, or {"error": "..."} if the search fails or the output is cut off.
+    Jobs are normalized and deduplicated as they are for the non-streaming search
+    and stored results, so a repeat search streams the same jobs.
+    """
+    resume_text = (await _resolve_resume(resume, resume_id)).text
+    prompt = _job_finder_prompt(resume_text, experience_years, location, job_type)
+    search_key = _job_search_key(resume_text, experience_years, location, job_type)
+
+    async def job_stream():
+        stored = await _stored_jobs(search_key, use_cache)
+        if stored:
+            for index, job in enumerate(stored):
+                yield json.dumps({"index": index, "job": job}) + "\n"
+            return
+        
+        if api_key_missing():
+            logger.error("Invalid or missing Gemini API key in job_finder")
+            yield json.dumps({"error": "The Gemini API key is not configured. Please add a valid API key to the .env file."}) + "\n"
+            return
+        
+        parser = JSONArrayStreamParser()
+        index = 0
+        jobs = []
+        seen = set()
+        try:
+            schema = response_schema(JobListing, many=True)
+            async for chunk in llm.stream(prompt, tool="job_finder", use_cache=use_cache, json_mode=True, schema=schema):
+                for item in parser.feed(chunk):
+                    try:
+                        job = normalize_job(structured_output.validate(item, JobListing, "job_finder"))
+                    except StructuredOutputError:
+                        continue
+                    # A job listed twice is only sent once
+                    if job_key(job) in seen:
+                        continue
+                    seen.add(job_key(job))
+                    yield json.dumps({"index": index, "job": job}) + "\n"
+                    jobs.append(job)
+                    index += 1
+        except Exception as e:
+            logger.error(f"Error in job finder streaming: {str(e)}")
+            yield json.dumps({"error": str(e)}) + "\n"
+            return
+        
+        if parser.incomplete or index == 0:
+            logger.warning(f"Job finder stream ended with {index} complete jobs")
+            await llm.discard(prompt, json_mode=True)
+            yield json.dumps({"error": "The AI response was incomplete. Some jobs may be missing, please try again."}) + "\n"
+            return
+        
+        # Only complete results are kept for reuse
+        await _store_jobs(search_key, jobs)
+
+    return StreamingResponse(job_stream(), media_type="application/x-ndjson")
+
 @app.post("/tools/cover_letter_generator")
 async def api_cover_letter_generator(
-    resume: UploadFile = File(...),
-    job_description: str = Form(...)
+    resume: Optional[UploadFile] = File(None),
+    resume_id: Optional[str] = Form(None),
+    job_description: str = Form(...),
+    use_cache: bool = Form(True)
 ):
     """API endpoint for cover letter generation"""
+    resume_text = (await _resolve_resume(resume, resume_id)).text
     try:
-        # Read the file content
-        resume_content = await resume.read()
-        
-        # Extract text based on file type
-        if resume.filename.lower().endswith('.pdf'):
-            resume_text = extract_text_from_pdf(resume_content)
-            if not resume_text:
-                resume_text = "[Could not extract text from the PDF]"
-        else:
-            try:
-                resume_text = resume_content.decode("utf-8")
-            except UnicodeDecodeError:
-                resume_text = f"[Could not decode file {resume.filename}]"
-        
-        result = await cover_letter_generator(resume_text, job_description)
+        result = await cover_letter_generator(resume_text, job_description, use_cache=use_cache)
         return JSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in cover letter API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/tools/cover_letter_generator/stream")
+async def api_cover_letter_generator_stream(
+    resume: Optional[UploadFile] = File(None),
+    resume_id: Optional[str] = Form(None),
+    job_description: str = Form(...),
+    use_cache: bool = Form(True)
+):
+    """Streaming cover letter generation using Server-Sent Events.
+
+    Emits "chunk" events with letter text as it is generated, then a "done" event,
+    or an "error" event on failure.
+    """
+    resume_text = (await _resolve_resume(resume, resume_id)).text
+    prompt = _cover_letter_prompt(resume_text, job_description)
+
+    async def event_stream():
+        if api_key_missing():
+            logger.error("Invalid or missing Gemini API key in cover_letter_generator")
+            yield _sse_event({"error": "The Gemini API key is not configured. Please add a valid API key to the .env file."}, "error")
+            return
+        
+        try:
+            async for chunk in llm.stream(prompt, tool="cover_letter_generator", use_cache=use_cache):
+                yield _sse_event({"text": chunk}, "chunk")
+        except Exception as e:
+            logger.error(f"Error in cover letter streaming: {str(e)}")
+            yield _sse_event({"error": str(e)}, "error")
+            return
+        yield _sse_event({}, "done")
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
 @app.post("/tools/job_applicator")
 async def api_job_applicator(
-    resume: UploadFile = File(...),
+    resume: Optional[UploadFile] = File(None),
+    resume_id: Optional[str] = Form(None),
     job_data: str = Form(...)
 ):
     """API endpoint for automated job application"""
+    stored = await _resolve_resume(resume, resume_id)
     try:
-        # Read the file content
-        resume_content = await resume.read()
-        
-        # Extract text based on file type
-        if resume.filename.lower().endswith('.pdf'):
-            resume_text = extract_text_from_pdf(resume_content)
-            if not resume_text:
-                resume_text = "[Could not extract text from the PDF]"
-        else:
-            try:
-                resume_text = resume_content.decode("utf-8")
-            except UnicodeDecodeError:
-                resume_text = f"[Could not decode file {resume.filename}]"
-        
         # Parse job data from JSON string
         try:
             job_data_dict = json.loads(job_data)
@@ -753,52 +1155,83 @@ async def api_job_applicator(
             raise HTTPException(status_code=400, detail="Invalid job data format. Must be valid JSON.")
         
         # Apply to the job
-        result = await job_applicator(resume_text, job_data_dict)
+        result = await job_applicator(stored.text, job_data_dict, stored.parsed)
         return JSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in job application API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/tools/application_status")
-async def api_application_status():
-    """API endpoint to get the status of all job applications"""
+async def api_application_status(
+    limit: int = Form(APPLICATIONS_PAGE_SIZE),
+    cursor: Optional[str] = Form(None),
+    status: Optional[str] = Form(None),
+    company: Optional[str] = Form(None),
+    date_from: Optional[str] = Form(None),
+    date_to: Optional[str] = Form(None),
+    fields: Optional[str] = Form(None)
+):
+    """API endpoint to get a page of job applications, optionally filtered"""
+    try:
+        query = build_application_query(
+            limit=limit,
+            cursor=cursor,
+            status=status,
+            company=company,
+            date_from=date_from,
+            date_to=date_to,
+            fields=fields.split(",") if fields else None,
+            max_limit=APPLICATIONS_MAX_PAGE_SIZE
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
-        result = await application_status()
+        result = await application_status(query)
         return JSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error in application status API: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/tools/application_status/search")
+async def api_application_search(
+    query: str = Form(...),
+    limit: int = Form(APPLICATIONS_PAGE_SIZE),
+    offset: int = Form(0),
+    status: Optional[str] = Form(None)
+):
+    """API endpoint to full-text search job applications, best matches first"""
+    if limit > APPLICATIONS_MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"limit must be at most {APPLICATIONS_MAX_PAGE_SIZE}")
+
+    try:
+        result = await get_application_store().search_applications(query, limit=limit, offset=offset, status=status or None)
+        return JSONResponse(content={"status": "success", **result})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in application search API: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 # Tool execution endpoint - used by MCP protocol
 @app.post("/execute_tool")
 async def execute_tool(
     tool_name: str = Form(...),
     resume: Optional[UploadFile] = File(None),
+    resume_id: Optional[str] = Form(None),
     job_description: Optional[str] = Form(None),
     experience_years: Optional[float] = Form(None),
     location: Optional[str] = Form(None),
     job_type: Optional[str] = Form(None),
-    job_data: Optional[str] = Form(None)
+    job_data: Optional[str] = Form(None),
+    use_cache: bool = Form(True),
+    mode: str = Form(ATS_DEFAULT_MODE)
 ):
     """Execute a tool based on the provided parameters"""
+    # Read resume content if provided
+    stored = await _resolve_resume(resume, resume_id) if resume or resume_id else None
+    resume_text = stored.text if stored else None
     try:
-        # Read resume content if provided
-        resume_content = None
-        resume_text = None
-        if resume:
-            resume_content = await resume.read()
-            
-            # Extract text from resume
-            if resume.filename.lower().endswith('.pdf'):
-                resume_text = extract_text_from_pdf(resume_content)
-                if not resume_text:
-                    resume_text = "[Could not extract text from the PDF]"
-            else:
-                try:
-                    resume_text = resume_content.decode("utf-8")
-                except UnicodeDecodeError:
-                    resume_text = f"[Could not decode file {resume.filename}]"
-        
         # Parse job data if provided
         job_data_dict = None
         if job_data:
@@ -811,25 +1244,25 @@ async def execute_tool(
         if tool_name == "ats_score_checker":
             if not resume_text or not job_description:
                 raise HTTPException(status_code=400, detail="Resume and job description are required for ATS score checking")
-            result = await ats_score_checker(resume_text, job_description)
+            result = await ats_score_checker(resume_text, job_description, use_cache=use_cache, mode=mode)
         
         elif tool_name == "job_finder":
             if not resume_text or not experience_years or not location:
                 raise HTTPException(status_code=400, detail="Resume, experience years, and location are required for job finding")
-            result = await job_finder(resume_text, experience_years, location, job_type)
+            result = await job_finder(resume_text, experience_years, location, job_type, use_cache=use_cache)
         
         elif tool_name == "cover_letter_generator":
             if not resume_text or not job_description:
                 raise HTTPException(status_code=400, detail="Resume and job description are required for cover letter generation")
-            result = await cover_letter_generator(resume_text, job_description)
+            result = await cover_letter_generator(resume_text, job_description, use_cache=use_cache)
         
         elif tool_name == "job_applicator":
             if not resume_text or not job_data_dict:
                 raise HTTPException(status_code=400, detail="Resume and job data are required for job application")
-            result = await job_applicator(resume_text, job_data_dict)
+            result = await job_applicator(resume_text, job_data_dict, stored.parsed)
         
         elif tool_name == "application_status":
-            result = await application_status()
+            result = await application_status(build_application_query(limit=APPLICATIONS_PAGE_SIZE, max_limit=APPLICATIONS_MAX_PAGE_SIZE))
         
         else:
             raise HTTPException(status_code=400, detail=f"Unknown tool: {tool_name}")
@@ -840,6 +1273,19 @@ async def execute_tool(
         logger.error(f"Error executing tool: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/metrics")
+async def get_metrics():
+    """Return runtime counters for model calls, scheduling, the response cache, output parsing, PDF extraction and the applications database"""
+    return {
+        "llm": llm.stats(),
+        "scheduler": scheduler.stats(),
+        "structured_output": structured_output.stats(),
+        "resume_store": resume_store.stats(),
+        "pdf_extraction": pdf_extractor.stats(),
+        "applications_db": get_application_store().stats(),
+        "llm_cache": await asyncio.to_thread(response_cache.stats) if response_cache else {"enabled": False}
+    }
+
 # Root endpoint with tools information
 @app.get("/")
 async def get_tools_info():
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Deque, Dict, List, Optional
+
+from utils import (
+    PAGE_SEPARATOR, ResumeExtractionError, char_budget, decode_resume_text, extract_pdf_pages, join_pdf_pages,
+    take_pdf_pages
+)
+
+logger = logging.getLogger(__name__)
+
+class PDFExtractor:
+    """
+    Extract PDF text in a process pool so PyPDF2 never blocks the event loop.
+
+    The first pages_per_task pages are read in one task, which also reports the
+    page count; the remaining pages, up to max_pages, are split into ranges of
+    pages_per_task and extracted in parallel. The text is identical to
+    utils.extract_text_from_pdf for documents within the page cap.
+
+    With a character budget (max_chars, or per call), pages after the one that
+    reaches it are not returned; a worker stops reading its range once its own
+    pages reach the part of the budget left after the first range.
+
+    The timeout bounds how long a request waits. A worker that is still busy
+    when it expires finishes its page range in the background, so max_pages is
+    what bounds the work a single document can cause.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout: float = 30,
+        max_pages: int = 50,
+        pages_per_task: int = 8,
+        max_chars: int = 0
+    ):
+        # 0 workers extracts in a thread instead, for hosts that can't start processes
+        self.workers = workers
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.pages_per_task = max(1, pages_per_task)
+        self.max_chars = max_chars
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        self._documents = 0
+        self._pages = 0
+        self._errors = 0
+        self._timeouts = 0
+        self._truncated = 0
+        self._latencies: Deque[float] = deque(maxlen=1000)
+
+    async def extract(self, content: bytes, max_chars: Optional[int] = None, max_tokens: Optional[int] = None) -> str:
+        """
+        Return the text of a PDF.
+
+        Args:
+            content: The PDF file content as bytes
+            max_chars: Character budget, defaulting to the extractor's max_chars
+            max_tokens: Budget as an estimated token count, if tighter
+
+        Raises:
+            ResumeExtractionError: If the PDF can't be read in time or has no text
+        """
+        started = time.perf_counter()
+        self._documents += 1
+        budget = char_budget(max_chars or self.max_chars, max_tokens)
+        try:
+            return await asyncio.wait_for(self._extract(content, budget), timeout=self.timeout)
+        except asyncio.TimeoutError as e:
+            self._timeouts += 1
+            logger.error(f"PDF extraction timed out after {self.timeout:g}s")
+            raise ResumeExtractionError(f"Error extracting PDF content: timed out after {self.timeout:g} seconds") from e
+        except ResumeExtractionError:
+            # The PDF was read but has no text
+            raise
+        except Exception as e:
+            self._errors += 1
+            if isinstance(e, BrokenProcessPool):
+                # A worker died (e.g. out of memory); start a fresh pool next time
+                self._pool = None
+            logger.error(f"Error extracting text from PDF: {str(e)}")
+            raise ResumeExtractionError(f"Error extracting PDF content: {str(e)}") from e
+        finally:
+            self._latencies.append(time.perf_counter() - started)
+
+    async def extract_resume_text(self, content: bytes, filename: str, max_chars: Optional[int] = None) -> str:
+        """Async counterpart of utils.extract_resume_text"""
+        if filename and filename.lower().endswith(".pdf"):
+            return await self.extract(content, max_chars=max_chars)
+        return decode_resume_text(content, filename)
+
+    async def _extract(self, content: bytes, budget: Optional[int]) -> str:
+        first_end = min(self.pages_per_task, self.max_pages) if self.max_pages > 0 else self.pages_per_task
+        page_count, pages = await self._run(content, 0, first_end, budget)
+
+        limit = min(page_count, self.max_pages) if self.max_pages > 0 else page_count
+        remaining = budget - sum(len(page) + len(PAGE_SEPARATOR) for page in pages) if budget else None
+        if limit > first_end and len(pages) == first_end and (remaining is None or remaining > 0):
+            ranges = [(start, min(start + self.pages_per_task, limit)) for start in range(first_end, limit, self.pages_per_task)]
+            results = await asyncio.gather(*(self._run(content, start, end, remaining) for start, end in ranges))
+            pages.extend(page for _, more in results for page in more)
+            pages = take_pdf_pages(pages, budget)
+
+        if budget and len(pages) < limit:
+            logger.info(f"Stopped PDF extraction after {len(pages)} of {page_count} pages at the {budget} character budget")
+        elif page_count > limit:
+            self._truncated += 1
+            logger.warning(f"PDF has {page_count} pages, only the first {limit} were extracted")
+        self._pages += len(pages)
+        return join_pdf_pages(pages)
+
+    async def _run(self, content: bytes, start: int, end: int, max_chars: Optional[int]):
+        if self.workers <= 0:
+            return await asyncio.to_thread(extract_pdf_pages, content, start, end, max_chars)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, extract_pdf_pages, content, start, end, max_chars)
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return extraction counters and latency percentiles over recent documents"""
+        latencies: List[float] = sorted(self._latencies)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 2)
+
+        return {
+            "workers": self.workers,
+            "documents": self._documents,
+            "pages": self._pages,
+            "errors": self._errors,
+            "timeouts": self._timeouts,
+            "truncated": self._truncated,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0
+        }
@@ -0,0 +1,106 @@
+import math
+import re
+from typing import List, Optional, Tuple
+
+# Rough size of a Gemini token in characters for English text
+CHARS_PER_TOKEN = 4
+
+# Resume sections dropped first when a resume is over budget, least valuable first
+LOW_VALUE_SECTIONS = [
+    "references", "hobbies", "interests", "personal details", "personal information",
+    "extracurricular activities", "activities", "volunteer experience", "volunteering",
+    "languages", "publications", "awards", "honors", "certifications", "objective", "summary"
+]
+
+HORIZONTAL_SPACE_PATTERN = re.compile(r"[ \t\f\v\u00a0]+")
+HEADER_PATTERN = re.compile(r"^[A-Za-z][A-Za-z &/]{1,40}:?$")
+TRUNCATION_MARKER = "[...truncated to fit the input budget]"
+
+# Headers that start a section; anything else is body text of the current section
+SECTION_HEADERS = set(LOW_VALUE_SECTIONS) | {
+    "experience", "work experience", "professional experience", "employment", "work history",
+    "education", "skills", "technical skills", "projects"
+}
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of model tokens in a text"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+def normalize_text(text: str) -> str:
+    """
+    Clean extracted document text before it goes into a prompt.
+
+    Collapses repeated spaces, drops a line that repeats the line before it
+    (ignoring blank lines in between, as left by page separators) and squeezes
+    runs of blank lines down to one. Lines repeated elsewhere in the document,
+    such as the same heading under two jobs, are kept.
+    """
+    lines = []
+    previous_key = None
+    previous_blank = True
+    for raw_line in text.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        line = HORIZONTAL_SPACE_PATTERN.sub(" ", raw_line).strip()
+        if not line:
+            if not previous_blank:
+                lines.append("")
+            previous_blank = True
+            continue
+
+        key = line.lower()
+        if key == previous_key:
+            continue
+        previous_key = key
+        lines.append(line)
+        previous_blank = False
+
+    return "\n".join(lines).strip()
+
+def _split_sections(text: str) -> List[Tuple[Optional[str], List[str]]]:
+    """Split resume text into (header, lines) pairs, with None for the text before the first header"""
+    sections: List[Tuple[Optional[str], List[str]]] = [(None, [])]
+    for line in text.split("\n"):
+        header = line.strip().rstrip(":").lower()
+        if HEADER_PATTERN.match(line.strip()) and header in SECTION_HEADERS:
+            sections.append((header, [line]))
+        else:
+            sections[-1][1].append(line)
+    return sections
+
+def truncate_to_budget(text: str, max_tokens: int) -> str:
+    """Cut text at a line boundary so it fits the token budget"""
+    if max_tokens <= 0 or estimate_tokens(text) <= max_tokens:
+        return text
+    limit = max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER) - 1
+    cut = text.rfind("\n", 0, limit)
+    return text[:cut if cut > 0 else max(limit, 0)].rstrip() + "\n" + TRUNCATION_MARKER
+
+def trim_resume(text: str, max_tokens: int) -> str:
+    """
+    Fit a resume into a token budget.
+
+    Low-value sections (references, hobbies, ...) are removed first, in
+    LOW_VALUE_SECTIONS order, and the remaining text is truncated only if that
+    is not enough.
+    """
+    if max_tokens <= 0 or estimate_tokens(text) <= max_tokens:
+        return text
+
+    sections = _split_sections(text)
+    for section_name in LOW_VALUE_SECTIONS:
+        remaining = [(name, lines) for name, lines in sections if name != section_name]
+        if len(remaining) == len(sections):
+            continue
+        sections = remaining
+        trimmed = "\n".join(line for _, lines in sections for line in lines).strip()
+        if estimate_tokens(trimmed) <= max_tokens:
+            return trimmed
+
+    return truncate_to_budget("\n".join(line for _, lines in sections for line in lines).strip(), max_tokens)
+
+def prepare_resume(text: str, max_tokens: int) -> str:
+    """Normalize a resume and fit it into the token budget"""
+    return trim_resume(normalize_text(text), max_tokens)
+
+def prepare_job_description(text: str, max_tokens: int) -> str:
+    """Normalize a job description and fit it into the token budget"""
+    return truncate_to_budget(normalize_text(text), max_tokens)
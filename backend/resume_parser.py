@@ -0,0 +1,363 @@
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from skills import default_skill_matcher
+from utils import ResumeExtractionError, extract_resume_text
+
+logger = logging.getLogger(__name__)
+
+# Section headers the parser looks for, in order of preference per section
+EDUCATION_HEADERS = ["education", "academic background", "academic history"]
+EXPERIENCE_HEADERS = ["experience", "work history", "employment", "professional experience"]
+SKILLS_HEADERS = ["skills", "technical skills", "core competencies", "proficiencies"]
+
+# One pattern for every known header, longest first so no header hides a longer one.
+# The header must be alone on its line apart from whitespace and a colon.
+SECTION_HEADER_PATTERN = re.compile(
+    r"^[^\S\n]*(" + "|".join(sorted(
+        (re.escape(name) for name in set(EDUCATION_HEADERS + EXPERIENCE_HEADERS + SKILLS_HEADERS)),
+        key=len, reverse=True
+    )) + r")",
+    re.IGNORECASE | re.MULTILINE
+)
+SECTION_HEADER_END_PATTERN = re.compile(r"[:\s]*(\n|$)")
+# Any all-caps line ends the current section
+NEXT_SECTION_PATTERN = re.compile(r'(^|\n)\s*[A-Z][A-Z\s]+[A-Z][:\s]*(\n|$)', re.MULTILINE)
+
+EMAIL_PATTERN = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_PATTERN = re.compile(r'(\+\d{1,2}\s?)?(\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4})')
+NAME_PATTERN = re.compile(r'^[A-Za-z\s\.-]+$')
+ADDRESS_PATTERN = re.compile(r'\b[A-Z][a-z]+,\s*[A-Z]{2}\s*\d{5}\b')  # City, State ZIP
+CITY_STATE_PATTERN = re.compile(r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b')
+
+DEGREE_PATTERNS = [
+    re.compile(r'(Bachelor|Master|PhD|Doctorate|Associate|B\.S\.|M\.S\.|B\.A\.|M\.A\.|B\.Tech|M\.Tech|M\.B\.A\.)', re.IGNORECASE),
+    re.compile(r'(High School Diploma)', re.IGNORECASE)
+]
+INSTITUTION_PATTERN = re.compile(r'(University|College|Institute|School) of ([A-Za-z\s&]+)', re.IGNORECASE)
+DATE_RANGE_PATTERN = re.compile(r'(19|20)\d{2}\s*(-|to|–|—)\s*(19|20)\d{2}|((19|20)\d{2})\s*(-|to|–|—)\s*(Present|Current)', re.IGNORECASE)
+JOB_AT_COMPANY_PATTERN = re.compile(r'([A-Za-z\s]+) at ([A-Za-z\s&]+) \((\d{4}.*?)\)')
+JOB_DASH_COMPANY_PATTERN = re.compile(r'([A-Za-z\s]+) - ([A-Za-z\s&]+)')
+# The hyphen is escaped: unescaped, "·-\n" is an invalid character range
+SKILL_LIST_ITEM_PATTERN = re.compile(r'[•·-]\s*([^•·\-\n]+)')
+
+class ResumeSections:
+    """
+    Index of the section headers in a resume, built in one pass over the text.
+    
+    Records where the body of the first occurrence of every known header starts,
+    so each extractor can look up its section without searching the text again.
+    """
+    
+    def __init__(self, text: str):
+        self.text = text
+        self._starts: Dict[str, int] = {}
+        # Offsets come from the lowercased text, as headers are matched case-insensitively
+        text_lower = text.lower()
+        for match in SECTION_HEADER_PATTERN.finditer(text_lower):
+            # IGNORECASE also matches a few non-ASCII variants that lower() keeps
+            name = match.group(1).casefold()
+            if name in self._starts:
+                continue
+            end_match = SECTION_HEADER_END_PATTERN.match(text_lower, match.end())
+            if end_match:
+                self._starts[name] = end_match.end()
+        self._sections: Dict[int, str] = {}
+    
+    def section(self, section_names: List[str]) -> str:
+        """Return the section under the first of the given headers found in the resume"""
+        for name in section_names:
+            if name in self._starts:
+                section_start = self._starts[name]
+                break
+        else:
+            return ""
+        
+        if section_start not in self._sections:
+            self._sections[section_start] = self._extract(section_start)
+        return self._sections[section_start]
+    
+    def _extract(self, section_start: int) -> str:
+        text = self.text
+        # The section ends at the next all-caps header line
+        if section_start == 0 or text[section_start - 1:section_start] == "\n":
+            next_section_match = NEXT_SECTION_PATTERN.search(text, section_start)
+            section_end = next_section_match.start() if next_section_match else len(text)
+        else:
+            # "^" only matches at the search position after a newline, so search a copy
+            next_section_match = NEXT_SECTION_PATTERN.search(text[section_start:])
+            section_end = section_start + next_section_match.start() if next_section_match else len(text)
+        return text[section_start:section_end].strip()
+
+class ResumeParser:
+    """Extract structured data from resume text"""
+    
+    def parse_resume(self, resume_text: str) -> Dict[str, Any]:
+        """Parse resume text into structured data"""
+        result = {
+            "full_name": "",
+            "first_name": "",
+            "last_name": "",
+            "email": "",
+            "phone": "",
+            "location": "",
+            "education": [],
+            "experience": [],
+            "skills": []
+        }
+        
+        # Index the section headers once for all the extractors
+        sections = ResumeSections(resume_text)
+        
+        # Extract basic contact information
+        result.update(self._extract_contact_info(resume_text))
+        
+        # Extract education
+        result["education"] = self._extract_education(resume_text, sections)
+        
+        # Extract work experience
+        result["experience"] = self._extract_experience(resume_text, sections)
+        
+        # Extract skills
+        result["skills"] = self._extract_skills(resume_text, sections)
+        
+        return result
+    
+    def parse_many(
+        self,
+        documents: Iterable[Tuple[str, bytes]],
+        workers: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Extract and parse many resume files across a process pool.
+        
+        Results are yielded as soon as each file is done, so not necessarily in
+        input order. Only a few files per worker are read ahead of the results,
+        so documents can be a lazy iterable over a large directory or archive.
+        
+        Args:
+            documents: (filename, content) pairs; PDFs are detected by extension
+            workers: Worker processes, defaulting to the CPU count; 0 parses in this process
+            max_chars: Stop reading PDF pages once the text is at least this long
+            
+        Returns:
+            An iterator of parse_resume_document results
+        """
+        if workers == 0:
+            for filename, content in documents:
+                yield parse_resume_document(filename, content, max_chars)
+            return
+        
+        workers = workers or os.cpu_count() or 1
+        documents = iter(documents)
+        pending = set()
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            while True:
+                # Keep every worker busy without reading the whole input up front
+                while len(pending) < workers * 2:
+                    document = next(documents, None)
+                    if document is None:
+                        break
+                    pending.add(executor.submit(parse_resume_document, document[0], document[1], max_chars))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            # Reached early when the caller stops iterating
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    def _extract_contact_info(self, text: str) -> Dict[str, str]:
+        """Extract contact information from resume text"""
+        info = {}
+        
+        # Extract email
+        email_match = EMAIL_PATTERN.search(text)
+        if email_match:
+            info["email"] = email_match.group(0)
+        
+        # Extract phone number (various formats)
+        phone_match = PHONE_PATTERN.search(text)
+        if phone_match:
+            info["phone"] = phone_match.group(0)
+        
+        # Extract name (usually at the beginning of the resume)
+        # Simplified approach: assume the first line contains the name
+        lines = text.strip().split('\n')
+        if lines:
+            potential_name = lines[0].strip()
+            # Check if it looks like a name (no special characters, not too long)
+            if len(potential_name) < 50 and NAME_PATTERN.match(potential_name):
+                info["full_name"] = potential_name
+                
+                # Split into first and last name
+                name_parts = potential_name.split()
+                if len(name_parts) >= 2:
+                    info["first_name"] = name_parts[0]
+                    info["last_name"] = name_parts[-1]
+                elif len(name_parts) == 1:
+                    info["first_name"] = name_parts[0]
+        
+        # Extract location/address (look for common location patterns)
+        address_match = ADDRESS_PATTERN.search(text)
+        if address_match:
+            info["location"] = address_match.group(0)
+        else:
+            # Try another pattern: just city and state
+            city_state_match = CITY_STATE_PATTERN.search(text)
+            if city_state_match:
+                info["location"] = city_state_match.group(0)
+        
+        return info
+    
+    def _extract_education(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict[str, str]]:
+        """Extract education information from resume"""
+        education = []
+        
+        # Find education section
+        education_section = (sections or ResumeSections(text)).section(EDUCATION_HEADERS)
+        if not education_section:
+            return education
+        
+        # Extract degree patterns
+        for pattern in DEGREE_PATTERNS:
+            for match in pattern.finditer(education_section):
+                degree = match.group(0)
+                
+                # Get surrounding text (100 characters before and after)
+                start_idx = max(0, match.start() - 100)
+                end_idx = min(len(education_section), match.end() + 100)
+                context = education_section[start_idx:end_idx]
+                
+                # Try to extract institution
+                institution_match = INSTITUTION_PATTERN.search(context)
+                institution = ""
+                if institution_match:
+                    institution = institution_match.group(0)
+                
+                # Try to extract dates
+                date_match = DATE_RANGE_PATTERN.search(context)
+                date_range = date_match.group(0) if date_match else ""
+                
+                education.append({
+                    "degree": degree,
+                    "institution": institution,
+                    "date_range": date_range,
+                    "context": context
+                })
+        
+        return education
+    
+    def _extract_experience(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict[str, str]]:
+        """Extract work experience information from resume"""
+        experience = []
+        
+        # Find experience section
+        experience_section = (sections or ResumeSections(text)).section(EXPERIENCE_HEADERS)
+        if not experience_section:
+            return experience
+        
+        # Look for company and title patterns
+        # This is a simplified approach - real-world resumes vary greatly
+        
+        # Pattern: Job Title at Company Name (Date - Date)
+        for match in JOB_AT_COMPANY_PATTERN.finditer(experience_section):
+            title = match.group(1).strip()
+            company = match.group(2).strip()
+            date_range = match.group(3).strip()
+            
+            # Get surrounding text for description
+            start_idx = max(0, match.start() - 50)
+            end_idx = min(len(experience_section), match.end() + 200)
+            description = experience_section[start_idx:end_idx]
+            
+            experience.append({
+                "title": title,
+                "company": company,
+                "date_range": date_range,
+                "description": description
+            })
+        
+        # If no matches found, try alternative pattern
+        if not experience:
+            # Look for lines that might contain job titles and companies
+            lines = experience_section.split('\n')
+            for i, line in enumerate(lines):
+                # Look for patterns like "Job Title - Company"
+                match = JOB_DASH_COMPANY_PATTERN.search(line)
+                if match:
+                    title = match.group(1).strip()
+                    company = match.group(2).strip()
+                    
+                    # Look for dates in the same line or next line
+                    date_match = None
+                    if i < len(lines) - 1:
+                        date_match = DATE_RANGE_PATTERN.search(lines[i] + " " + lines[i+1])
+                    else:
+                        date_match = DATE_RANGE_PATTERN.search(line)
+                    
+                    date_range = date_match.group(0) if date_match else ""
+                    
+                    # Get description from following lines
+                    description = "\n".join(lines[i:min(i+5, len(lines))])
+                    
+                    experience.append({
+                        "title": title,
+                        "company": company,
+                        "date_range": date_range,
+                        "description": description
+                    })
+        
+        return experience
+    
+    def _extract_skills(self, text: str, sections: Optional[ResumeSections] = None) -> List[str]:
+        """Extract skills from resume text"""
+        skills = []
+        
+        # Find skills section
+        skills_section = (sections or ResumeSections(text)).section(SKILLS_HEADERS)
+        
+        if skills_section:
+            # Known skills by their canonical names, e.g. "nodejs" becomes "Node.js"
+            matcher = default_skill_matcher()
+            skills.extend(matcher.find(skills_section))
+            
+            # Also extract skills formatted as lists
+            list_items = SKILL_LIST_ITEM_PATTERN.findall(skills_section)
+            for item in list_items:
+                if len(item.strip()) > 0 and len(item.strip()) < 50:  # Reasonable length for a skill
+                    skills.append(matcher.canonical(item) or item.strip())
+        else:
+            # If no skills section found, try to extract skills from the whole resume
+            skills.extend(default_skill_matcher().find(text))
+        
+        return list(dict.fromkeys(skills))  # Remove duplicates
+
+def parse_resume_document(filename: str, content: bytes, max_chars: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Extract and parse one resume file; runs in ResumeParser.parse_many workers.
+    
+    Returns:
+        {"filename", "resume_id", "text", "parsed"}, or {"filename", "resume_id", "error"}
+        if the text could not be extracted or parsed
+    """
+    result = {"filename": filename, "resume_id": hashlib.sha256(content).hexdigest()}
+    try:
+        text = extract_resume_text(content, filename, max_chars)
+        result["text"] = text
+        result["parsed"] = ResumeParser().parse_resume(text)
+    except ResumeExtractionError as e:
+        result["error"] = str(e)
+    except Exception as e:
+        logger.error(f"Error parsing resume {filename}: {str(e)}")
+        result["error"] = str(e)
+    return result
@@ -0,0 +1,253 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from resume_parser import ResumeParser
+from pdf_extractor import PDFExtractor
+from singleflight import SingleFlight
+from utils import ResumeExtractionError
+
+logger = logging.getLogger(__name__)
+
+RESUME_ID_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+class StoredResume(NamedTuple):
+    """An uploaded resume with its extracted text and parsed structure"""
+    resume_id: str
+    filename: str
+    size: int
+    text: str
+    parsed: Dict[str, Any]
+    # When the entry was written (the mtime of its meta.json), which its age is counted from
+    created_at: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Metadata returned by the /resumes endpoints"""
+        return {
+            "resume_id": self.resume_id,
+            "filename": self.filename,
+            "size": self.size,
+            "text_length": len(self.text),
+            "parsed": self.parsed
+        }
+
+class ResumeStore:
+    """
+    Content-addressed store for uploaded resumes.
+
+    Each resume is stored once under the SHA-256 of its bytes, together with the
+    extracted text and the ResumeParser output, so later requests can refer to
+    it by resume_id instead of uploading and extracting it again. Recently used
+    resumes are also kept in memory.
+
+    Resumes are personal data, so the store is bounded: entries older than
+    max_age seconds are removed, and past max_bytes on disk the oldest entries
+    are removed first. Both are checked whenever a resume is written, and an
+    expired entry is never returned. 0 disables either limit.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        memory_entries: int = 128,
+        extractor: Optional[PDFExtractor] = None,
+        max_bytes: int = 0,
+        max_age: float = 0
+    ):
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.extractor = extractor or PDFExtractor()
+        self._memory: "OrderedDict[str, StoredResume]" = OrderedDict()
+        self._single_flight = SingleFlight()
+        self._parser = ResumeParser()
+        self._uploads = 0
+        self._duplicates = 0
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+        os.makedirs(directory, exist_ok=True)
+
+    async def add(self, content: bytes, filename: str) -> StoredResume:
+        """Store an upload, extracting and parsing it only if its content is new"""
+        async def read() -> bytes:
+            return content
+
+        return await self.add_hashed(hashlib.sha256(content).hexdigest(), filename, read)
+
+    async def add_hashed(self, resume_id: str, filename: str, read: Callable[[], Awaitable[bytes]]) -> StoredResume:
+        """Store an upload whose hash is already known, reading its content only if it is new"""
+        self._uploads += 1
+
+        stored = await self._lookup(resume_id)
+        if stored is not None:
+            self._duplicates += 1
+            return stored
+
+        # Concurrent uploads of the same file share one extraction
+        stored = await self._single_flight.do(resume_id, lambda: self._ingest(resume_id, read, filename))
+        self._remember(stored)
+        return stored
+
+    async def put(self, content: bytes, filename: str, text: str, parsed: Dict[str, Any], resume_id: Optional[str] = None) -> StoredResume:
+        """Store a resume that was already extracted and parsed elsewhere, e.g. in a bulk upload"""
+        self._uploads += 1
+        resume_id = resume_id or hashlib.sha256(content).hexdigest()
+        stored = await asyncio.to_thread(self._save, resume_id, content, filename, text, parsed)
+        self._remember(stored)
+        await self._evict(keep=resume_id)
+        return stored
+
+    async def get(self, resume_id: str) -> Optional[StoredResume]:
+        """Return a stored resume, or None if the id is unknown"""
+        stored = await self._lookup(resume_id) if RESUME_ID_PATTERN.match(resume_id or "") else None
+        if stored is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return stored
+
+    async def _lookup(self, resume_id: str) -> Optional[StoredResume]:
+        stored = self._memory.get(resume_id)
+        if stored is not None and not self._expired(stored.created_at):
+            self._memory.move_to_end(resume_id)
+            return stored
+        # An expired entry is removed from disk by _load
+        self._memory.pop(resume_id, None)
+
+        stored = await asyncio.to_thread(self._load, resume_id)
+        if stored is not None:
+            self._remember(stored)
+        return stored
+
+    def _path(self, resume_id: str, name: str) -> str:
+        return os.path.join(self.directory, resume_id, name)
+
+    async def _ingest(self, resume_id: str, read: Callable[[], Awaitable[bytes]], filename: str) -> StoredResume:
+        """Extract, parse and write a new resume to disk"""
+        started = time.perf_counter()
+        content = await read()
+        try:
+            text = await self.extractor.extract_resume_text(content, filename)
+        except ResumeExtractionError as e:
+            # Not stored, so the same file can be uploaded again once the cause is fixed
+            logger.warning(f"Could not extract resume {resume_id[:12]} ({filename}): {str(e)}")
+            raise
+        stored = await asyncio.to_thread(self._save, resume_id, content, filename, text)
+        logger.info(f"Stored resume {resume_id[:12]} ({filename}) in {time.perf_counter() - started:.3f}s")
+        await self._evict(keep=resume_id)
+        return stored
+
+    def _save(self, resume_id: str, content: bytes, filename: str, text: str, parsed: Optional[Dict[str, Any]] = None) -> StoredResume:
+        if parsed is None:
+            parsed = self._parser.parse_resume(text)
+
+        os.makedirs(os.path.join(self.directory, resume_id), exist_ok=True)
+        self._write(self._path(resume_id, "original"), content)
+        self._write(self._path(resume_id, "text.txt"), text.encode("utf-8"))
+        # The metadata file is written last, so its presence marks a complete entry
+        metadata = {"filename": filename, "size": len(content), "created_at": time.time(), "parsed": parsed}
+        self._write(self._path(resume_id, "meta.json"), json.dumps(metadata).encode("utf-8"))
+        created_at = os.path.getmtime(self._path(resume_id, "meta.json"))
+        return StoredResume(resume_id, filename, len(content), text, parsed, created_at)
+
+    def _write(self, path: str, data: bytes):
+        # Write then rename so readers never see a partly written file
+        temp_path = f"{path}.tmp{os.getpid()}"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def _load(self, resume_id: str) -> Optional[StoredResume]:
+        try:
+            with open(self._path(resume_id, "meta.json"), "r", encoding="utf-8") as f:
+                created_at = os.fstat(f.fileno()).st_mtime
+                metadata = json.load(f)
+            if self._expired(created_at):
+                shutil.rmtree(os.path.join(self.directory, resume_id), ignore_errors=True)
+                self._evicted += 1
+                return None
+            with open(self._path(resume_id, "text.txt"), "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            return None
+        return StoredResume(resume_id, metadata["filename"], metadata["size"], text, metadata["parsed"], created_at)
+
+    def _expired(self, created_at: float) -> bool:
+        return bool(self.max_age) and time.time() - created_at > self.max_age
+
+    async def _evict(self, keep: str):
+        """Apply the age and size limits after a write, forgetting evicted resumes in memory too"""
+        if not (self.max_age or self.max_bytes):
+            return
+        for resume_id in await asyncio.to_thread(self._prune, keep):
+            self._memory.pop(resume_id, None)
+
+    def _prune(self, keep: str) -> List[str]:
+        """
+        Remove expired entries, then the oldest ones until the store fits in
+        max_bytes; the entry in keep, just written, always stays.
+
+        Returns:
+            The ids of the removed resumes
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.is_dir():
+                continue
+            size, created_at = 0, None
+            try:
+                for file in os.scandir(entry.path):
+                    stat = file.stat()
+                    size += stat.st_size
+                    if file.name == "meta.json":
+                        created_at = stat.st_mtime
+            except FileNotFoundError:
+                # Removed by another request meanwhile
+                continue
+            # An entry without meta.json is still being written
+            if created_at is not None:
+                entries.append((created_at, size, entry.name))
+
+        # Oldest first, so expired entries come before the rest
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        removed = []
+        for created_at, size, resume_id in entries:
+            if not (self._expired(created_at) or (self.max_bytes and total > self.max_bytes)):
+                break
+            if resume_id == keep:
+                continue
+            shutil.rmtree(os.path.join(self.directory, resume_id), ignore_errors=True)
+            total -= size
+            removed.append(resume_id)
+
+        if removed:
+            self._evicted += len(removed)
+            logger.info(f"Removed {len(removed)} resumes from the store; {total} bytes remain")
+        return removed
+
+    def _remember(self, stored: StoredResume):
+        self._memory[stored.resume_id] = stored
+        self._memory.move_to_end(stored.resume_id)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return upload and lookup counters"""
+        return {
+            "uploads": self._uploads,
+            "duplicate_uploads": self._duplicates,
+            "hits": self._hits,
+            "misses": self._misses,
+            "in_memory": len(self._memory),
+            "evicted": self._evicted
+        }
@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Priority lanes, highest first
+LANES = ("interactive", "batch")
+
+class RateLimitExceededError(Exception):
+    """Raised when a call is still rate limited after all retries"""
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate up to its capacity"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay_for(self, cost: float) -> float:
+        """Seconds until cost tokens are available, 0 if they are available now"""
+        self._refill()
+        # A single call larger than the bucket would otherwise wait forever
+        missing = min(cost, self.capacity) - self._tokens
+        return max(0.0, missing / self.rate)
+
+    def consume(self, cost: float):
+        self._refill()
+        self._tokens -= min(cost, self.capacity)
+
+    def drain(self):
+        """Empty the bucket, e.g. after the provider reports that the quota is exhausted"""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+class RequestScheduler:
+    """
+    Admit model calls within the API quota, interactive work first.
+
+    Calls wait in one queue per priority lane. A dispatcher admits the oldest
+    interactive call whenever the request (and optional token) buckets allow,
+    but after interactive_burst interactive admissions in a row a waiting batch
+    call goes next so batch work is never starved completely. Calls rejected
+    with a rate-limit error are retried with exponential backoff and full
+    jitter, and the request bucket is drained so other callers slow down too.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 60,
+        burst: int = 10,
+        tokens_per_minute: float = 0,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        interactive_burst: int = 4,
+        is_rate_limit_error: Optional[Callable[[Exception], bool]] = None
+    ):
+        # A rate of 0 disables the corresponding limit
+        self._request_bucket = TokenBucket(requests_per_minute / 60, burst) if requests_per_minute > 0 else None
+        self._token_bucket = TokenBucket(tokens_per_minute / 60, tokens_per_minute) if tokens_per_minute > 0 else None
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.interactive_burst = interactive_burst
+        self.is_rate_limit_error = is_rate_limit_error or (lambda error: False)
+
+        self._queues: Dict[str, Deque[Tuple[asyncio.Future, float]]] = {lane: deque() for lane in LANES}
+        self._interactive_streak = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self._admitted = {lane: 0 for lane in LANES}
+        self._wait_total = {lane: 0.0 for lane in LANES}
+        self._wait_max = {lane: 0.0 for lane in LANES}
+        self._max_depth = {lane: 0 for lane in LANES}
+        self._rate_limited = 0
+        self._retries = 0
+        self._gave_up = 0
+
+    async def run(self, func: Callable[[], Awaitable[Any]], priority: str = "interactive", tokens: float = 0) -> Any:
+        """
+        Run a model call once it is admitted, retrying it if it is rate limited.
+
+        Args:
+            func: Makes the call; invoked again for each retry
+            priority: "interactive" or "batch"
+            tokens: Estimated tokens the call uses, for the token quota
+
+        Returns:
+            The result of func
+        """
+        attempt = 0
+        while True:
+            await self.acquire(priority, tokens)
+            try:
+                return await func()
+            except Exception as e:
+                if not await self.backoff(e, attempt):
+                    raise
+                attempt += 1
+
+    async def acquire(self, priority: str = "interactive", tokens: float = 0):
+        """Wait until a call in the given lane may start"""
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority: {priority}. Use one of: {', '.join(LANES)}")
+
+        started = time.monotonic()
+        # Nobody is waiting, so there is no one to overtake
+        if not any(self._queues.values()) and self._delay_for(tokens) == 0:
+            self._admit(priority, tokens)
+            self._record_wait(priority, 0.0)
+            return
+
+        self._ensure_dispatcher()
+        future = self._loop.create_future()
+        queue = self._queues[priority]
+        queue.append((future, tokens))
+        self._max_depth[priority] = max(self._max_depth[priority], len(queue))
+        self._wakeup.set()
+        await future
+        self._record_wait(priority, time.monotonic() - started)
+
+    async def backoff(self, error: Exception, attempt: int) -> bool:
+        """
+        Sleep before retrying a call that failed with a rate-limit error.
+
+        Returns False without sleeping if the error isn't a rate limit. Raises
+        RateLimitExceededError when attempt has used up the retries.
+        """
+        if not self.is_rate_limit_error(error):
+            return False
+
+        self._rate_limited += 1
+        if self._request_bucket:
+            self._request_bucket.drain()
+        if attempt >= self.max_retries:
+            self._gave_up += 1
+            logger.error(f"Model call still rate limited after {attempt} retries: {str(error)}")
+            raise RateLimitExceededError("The AI service is busy right now. Please try again in a moment.") from error
+
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        self._retries += 1
+        logger.warning(f"Model call rate limited, retrying in {delay:.1f}s (retry {attempt + 1} of {self.max_retries})")
+        await asyncio.sleep(delay)
+        return True
+
+    def _delay_for(self, tokens: float) -> float:
+        delay = self._request_bucket.delay_for(1) if self._request_bucket else 0.0
+        if self._token_bucket and tokens:
+            delay = max(delay, self._token_bucket.delay_for(tokens))
+        return delay
+
+    def _admit(self, priority: str, tokens: float):
+        if self._request_bucket:
+            self._request_bucket.consume(1)
+        if self._token_bucket and tokens:
+            self._token_bucket.consume(tokens)
+        self._admitted[priority] += 1
+
+    def _record_wait(self, priority: str, seconds: float):
+        self._wait_total[priority] += seconds
+        self._wait_max[priority] = max(self._wait_max[priority], seconds)
+
+    def _ensure_dispatcher(self):
+        """Start the dispatcher on the running event loop if it isn't already running there"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._dispatcher is None or self._dispatcher.done():
+            if self._loop is not loop:
+                # Callers queued on a previous event loop can never be resumed
+                for queue in self._queues.values():
+                    queue.clear()
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._dispatcher = loop.create_task(self._dispatch())
+
+    def _next_lane(self) -> Optional[str]:
+        """Pick the lane to admit from next, dropping callers that gave up waiting"""
+        for queue in self._queues.values():
+            while queue and queue[0][0].done():
+                queue.popleft()
+
+        interactive, batch = self._queues["interactive"], self._queues["batch"]
+        if interactive and (not batch or self._interactive_streak < self.interactive_burst):
+            return "interactive"
+        if batch:
+            return "batch"
+        return None
+
+    async def _dispatch(self):
+        while True:
+            lane = self._next_lane()
+            if lane is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            future, tokens = self._queues[lane][0]
+            delay = self._delay_for(tokens)
+            if delay > 0:
+                # Wake early if a new call arrives, in case it should go first
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            self._queues[lane].popleft()
+            self._admit(lane, tokens)
+            future.set_result(None)
+            if lane == "interactive" and self._queues["batch"]:
+                self._interactive_streak += 1
+            else:
+                self._interactive_streak = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depths, wait times and rate-limit counters"""
+        lanes = {}
+        for lane in LANES:
+            admitted = self._admitted[lane]
+            lanes[lane] = {
+                "queue_depth": sum(1 for future, _ in self._queues[lane] if not future.done()),
+                "max_queue_depth": self._max_depth[lane],
+                "admitted": admitted,
+                "avg_wait_ms": round(self._wait_total[lane] * 1000 / admitted, 2) if admitted else 0.0,
+                "max_wait_ms": round(self._wait_max[lane] * 1000, 2)
+            }
+        return {
+            "lanes": lanes,
+            "rate_limited": self._rate_limited,
+            "retries": self._retries,
+            "gave_up": self._gave_up,
+            "requests_available": round(self._request_bucket.available, 2) if self._request_bucket else None,
+            "tokens_available": round(self._token_bucket.available, 2) if self._token_bucket else None
+        }
@@ -0,0 +1,79 @@
+import json
+from typing import Any, Dict, List, Type
+
+from pydantic import BaseModel, BeforeValidator, Field, field_validator
+from typing_extensions import Annotated
+
+def _to_text(value: Any) -> Any:
+    """Accept lists and numbers where the model should have written a string"""
+    if isinstance(value, list):
+        return "\n".join(str(item) for item in value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+def _to_list(value: Any) -> Any:
+    """Accept a comma-separated string where the model should have written a list"""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return value
+
+Text = Annotated[str, BeforeValidator(_to_text)]
+Keywords = Annotated[List[str], BeforeValidator(_to_list)]
+
+class ATSResult(BaseModel):
+    """Output of the ats_score_checker tool in llm mode"""
+    score: int = Field(description="Overall ATS compatibility score from 0 to 100")
+    matching_keywords: Keywords = Field(default_factory=list, description="Key job description keywords found in the resume")
+    missing_keywords: Keywords = Field(default_factory=list, description="Important job description keywords missing from the resume")
+    formatting_issues: Text = Field("No specific issues detected", description="Formatting issues that might affect ATS scanning")
+    recommendations: Text = Field("No specific recommendations", description="Specific recommendations to improve the score")
+
+    @field_validator("score", mode="before")
+    @classmethod
+    def _clamp_score(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            value = value.strip().rstrip("%")
+        try:
+            return min(100, max(0, round(float(value))))
+        except (TypeError, ValueError):
+            return value
+
+class ATSFeedback(BaseModel):
+    """Narrative part of an ATS review, used by hybrid mode"""
+    formatting_issues: Text = Field("No specific issues detected", description="Formatting issues that might affect ATS scanning")
+    recommendations: Text = Field("No specific recommendations", description="Specific recommendations to improve the score")
+
+class JobListing(BaseModel):
+    """One job returned by the job_finder tool"""
+    job_title: Text = Field(description="Job title")
+    company_name: Text = Field(description="Company name")
+    location: Text = Field("Not specified", description="Location including remote status if applicable")
+    job_description: Text = Field("Not specified", description="Brief job description")
+    required_qualifications: Text = Field("Not specified", description="Required qualifications")
+    experience_required: Text = Field("Not specified", description="Required experience in years, e.g. 3-5")
+    skills_required: Text = Field("Not specified", description="Required skills as a comma-separated list")
+    estimated_salary_range: Text = Field("Not specified", description="Estimated salary range")
+    application_link: Text = Field("#", description="Real job board URL (LinkedIn, Indeed, Glassdoor, ...), never a placeholder, example.com or localhost URL")
+
+def _compact_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    schema = model.model_json_schema()
+    properties = {}
+    for name, prop in schema["properties"].items():
+        prop = {key: value for key, value in prop.items() if key not in ("title", "default")}
+        properties[name] = prop
+    return {"type": "object", "properties": properties, "required": list(schema["properties"])}
+
+def response_schema(model: Type[BaseModel], many: bool = False) -> Dict[str, Any]:
+    """The JSON schema of a model's output, or of an array of it when many is True"""
+    schema = _compact_schema(model)
+    if many:
+        schema = {"type": "array", "items": schema}
+    return schema
+
+def schema_instructions(model: Type[BaseModel], many: bool = False) -> str:
+    """Prompt text asking for JSON output matching a schema, or an array of it when many is True"""
+    return (
+        "Respond only with JSON matching this JSON schema, with no markdown or extra text:\n"
+        + json.dumps(response_schema(model, many), separators=(",", ":"))
+    )
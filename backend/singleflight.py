@@ -0,0 +1,51 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single execution"""
+
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func once per key while a call for that key is in flight.
+
+        Callers that arrive while the first call is still running wait for the
+        same result, or get the same exception.
+
+        Args:
+            key: Identifies identical requests
+            func: Zero-argument coroutine function doing the actual work
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            # Run the work in its own task so a caller that gets cancelled
+            # (e.g. a disconnected client) doesn't cancel it for the others
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self._executions += 1
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many calls ran and how many were coalesced onto them"""
+        return {
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._in_flight)
+        }
@@ -0,0 +1,129 @@
+import json
+import logging
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from config import SKILLS_PATH
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+def _is_word_char(ch: str) -> bool:
+    # "+" and "#" count as word characters so "c" doesn't match inside "c++" or "c#"
+    return ch.isalnum() or ch == "+" or ch == "#"
+
+def normalize_skill_text(text: str) -> str:
+    """Lowercase text and collapse whitespace, as skills are matched"""
+    return WHITESPACE_PATTERN.sub(" ", text.lower())
+
+class SkillMatcher:
+    """
+    Find known skills in text with an Aho-Corasick automaton.
+
+    The skills dictionary maps each canonical skill name to its synonyms, e.g.
+    "Node.js" to ["node", "nodejs"]. All names are compiled into one automaton,
+    so a single pass over the text finds every skill however many there are.
+    A match only counts if it is a whole word, and where matches overlap the
+    leftmost, then longest, wins ("node.js" rather than "node").
+    """
+
+    def __init__(self, skills: Dict[str, List[str]]):
+        self._aliases: Dict[str, str] = {}
+        for canonical, synonyms in skills.items():
+            for alias in [canonical] + list(synonyms):
+                key = normalize_skill_text(alias).strip()
+                if key:
+                    self._aliases.setdefault(key, canonical)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # (alias length, canonical name) for every alias ending at each state
+        self._output: List[List[Tuple[int, str]]] = [[]]
+        for alias, canonical in self._aliases.items():
+            self._add(alias, canonical)
+        self._link()
+        self.skill_count = len(skills)
+
+    def _add(self, alias: str, canonical: str):
+        state = 0
+        for ch in alias:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(alias), canonical))
+
+    def _link(self):
+        """Set the failure links breadth first and merge the outputs they lead to"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def matches(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Return the (start, end, canonical name) of each skill mention.
+
+        Offsets refer to normalize_skill_text(text).
+        """
+        text = normalize_skill_text(text)
+        goto, fail, output = self._goto, self._fail, self._output
+        found = []
+        state = 0
+        last = len(text) - 1
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state] or (i < last and _is_word_char(text[i + 1])):
+                continue
+            for length, canonical in output[state]:
+                start = i - length + 1
+                if start == 0 or not _is_word_char(text[start - 1]):
+                    found.append((start, i + 1, canonical))
+
+        found.sort(key=lambda match: (match[0], -match[1]))
+        selected = []
+        end = 0
+        for match in found:
+            if match[0] >= end:
+                selected.append(match)
+                end = match[1]
+        return selected
+
+    def find(self, text: str) -> List[str]:
+        """Return the canonical names of the skills in a text, in order of first mention"""
+        return list(dict.fromkeys(canonical for _, _, canonical in self.matches(text)))
+
+    def canonical(self, phrase: str) -> Optional[str]:
+        """Return the canonical skill a phrase names exactly, or None"""
+        return self._aliases.get(normalize_skill_text(phrase).strip())
+
+def load_skills(path: str) -> SkillMatcher:
+    """Build a matcher from a JSON file mapping canonical skill names to synonyms"""
+    with open(path, "r", encoding="utf-8") as f:
+        return SkillMatcher(json.load(f))
+
+@lru_cache(maxsize=1)
+def default_skill_matcher() -> SkillMatcher:
+    """Return the matcher for the SKILLS_PATH dictionary, built on first use"""
+    try:
+        matcher = load_skills(SKILLS_PATH)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not load the skills dictionary from {SKILLS_PATH}: {str(e)}")
+        return SkillMatcher({})
+    logger.info(f"Loaded {matcher.skill_count} skills from {SKILLS_PATH}")
+    return matcher
@@ -0,0 +1,851 @@
+import asyncio
+import base64
+import datetime
+import hashlib
+import json
+import logging
+import queue
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Bumped whenever the schema changes; stored in PRAGMA user_version
+SCHEMA_VERSION = 5
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Statements are module constants, so each connection's statement cache reuses them prepared
+INSERT_RESUME = 'INSERT OR IGNORE INTO resumes (id, resume_data, created_at) VALUES (?, ?, ?)'
+INSERT_APPLICATION = '''
+INSERT INTO applications
+(job_title, company, job_url, application_date, status, parsed_resume_key, application_data)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+UPDATE_APPLICATION_STATUS = 'UPDATE applications SET status = ? WHERE id = ?'
+SELECT_APPLICATION_BY_URL = 'SELECT id FROM applications WHERE job_url = ?'
+SELECT_APPLICATIONS = '''
+SELECT id, job_title, company, job_url, application_date, status, parsed_resume_key, application_data
+FROM applications ORDER BY application_date DESC
+'''
+SELECT_APPLICATION_RESUMES = '''
+SELECT id, resume_data FROM resumes WHERE id IN (SELECT parsed_resume_key FROM applications)
+'''
+
+UPSERT_JOB = '''
+INSERT INTO jobs (url, job_title, company, location, job_data, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    job_title = excluded.job_title,
+    company = excluded.company,
+    location = excluded.location,
+    job_data = excluded.job_data,
+    last_seen = excluded.last_seen
+'''
+SELECT_JOB_ID = 'SELECT id FROM jobs WHERE url = ?'
+INSERT_JOB_SEARCH = 'INSERT INTO job_searches (search_key, position, job_id, created_at) VALUES (?, ?, ?, ?)'
+DELETE_UNREFERENCED_JOBS = 'DELETE FROM jobs WHERE NOT EXISTS (SELECT 1 FROM job_searches WHERE job_id = jobs.id)'
+SELECT_JOB_SEARCH = '''
+SELECT j.job_data FROM job_searches s JOIN jobs j ON j.id = s.job_id
+WHERE s.search_key = ? AND s.created_at >= ?
+ORDER BY s.position
+'''
+
+# Matches are ranked with bm25, weighting job_title, company, job_description and skills
+SEARCH_APPLICATIONS = '''
+SELECT a.id, a.job_title, a.company, a.job_url, a.application_date, a.status,
+       snippet(applications_fts, -1, '[', ']', '...', 12) AS snippet,
+       bm25(applications_fts, 10.0, 5.0, 1.0, 3.0) AS rank
+FROM applications_fts JOIN applications a ON a.id = applications_fts.rowid
+WHERE applications_fts MATCH ? AND (? IS NULL OR a.status = ?)
+ORDER BY rank, a.id
+LIMIT ? OFFSET ?
+'''
+
+def match_expression(text: str) -> str:
+    """
+    Turn free text into an FTS5 query that matches every word in it.
+
+    Each word is quoted, so punctuation such as "c++" or "node.js" is searched
+    for as text instead of being read as query syntax.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+
+# Fields an application listing can return; resume_data comes from the resumes table.
+# parsed_resume_key is internal: it is not the resume_id of the resume store.
+APPLICATION_COLUMNS = ("id", "job_title", "company", "job_url", "application_date", "status", "application_data")
+APPLICATION_FIELDS = APPLICATION_COLUMNS + ("resume_data",)
+# Returned by default: everything but the large JSON fields
+SUMMARY_FIELDS = ("id", "job_title", "company", "job_url", "application_date", "status")
+
+class ApplicationQuery(NamedTuple):
+    """One page of an application listing, newest first"""
+    limit: int = 50
+    # (application_date, id) of the last application on the previous page
+    after: Optional[Tuple[str, int]] = None
+    status: Optional[str] = None
+    company: Optional[str] = None
+    # Inclusive bounds on application_date
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+    fields: Tuple[str, ...] = SUMMARY_FIELDS
+
+def encode_cursor(application_date: str, application_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{application_date}|{application_id}".encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Return the (application_date, id) in a cursor, raising ValueError if it is malformed"""
+    try:
+        application_date, application_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|")
+        return application_date, int(application_id)
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def _date_bound(value: str, end: bool) -> str:
+    """
+    Normalize a date or datetime filter to an inclusive bound. A plain end date
+    becomes the last instant of that day, so the whole day is included; a
+    datetime is kept as it is, so an application at exactly that time matches.
+    """
+    if len(value) == 10:
+        day = datetime.date.fromisoformat(value)
+        return datetime.datetime.combine(day, datetime.time.max).isoformat() if end else day.isoformat()
+    return datetime.datetime.fromisoformat(value).isoformat()
+
+def build_application_query(
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    company: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    max_limit: int = 500
+) -> ApplicationQuery:
+    """
+    Validate listing parameters as they arrive from a request.
+
+    Args:
+        limit: Applications per page, at most max_limit
+        cursor: next_cursor from the previous page
+        status: Only applications with this status
+        company: Only applications to this company, ignoring case
+        date_from: Only applications on or after this ISO date or datetime
+        date_to: Only applications on or before this ISO date or datetime
+        fields: Fields to return; defaults to SUMMARY_FIELDS
+
+    Raises:
+        ValueError: If a parameter is invalid
+    """
+    if not 1 <= limit <= max_limit:
+        raise ValueError(f"limit must be between 1 and {max_limit}")
+    fields = tuple(dict.fromkeys(field.strip() for field in fields if field.strip())) if fields else SUMMARY_FIELDS
+    unknown = [field for field in fields if field not in APPLICATION_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Use any of: {', '.join(APPLICATION_FIELDS)}")
+    try:
+        date_from = _date_bound(date_from, end=False) if date_from else None
+        date_to = _date_bound(date_to, end=True) if date_to else None
+    except ValueError as e:
+        raise ValueError(f"Dates must be ISO dates or datetimes: {str(e)}") from e
+    return ApplicationQuery(
+        limit=limit,
+        after=decode_cursor(cursor) if cursor else None,
+        status=status or None,
+        company=company or None,
+        date_from=date_from,
+        date_to=date_to,
+        fields=fields
+    )
+
+def _select_page(query: ApplicationQuery) -> Tuple[str, List[Any]]:
+    """Build the SQL for one page; every filter combination is served by an index"""
+    # id and application_date make the cursor; parsed_resume_key keys the decoded resumes
+    needed = set(query.fields) | {"id", "application_date"}
+    columns = [f"a.{column}" for column in APPLICATION_COLUMNS if column in needed]
+    join = ""
+    if "resume_data" in query.fields:
+        columns.extend(["a.parsed_resume_key", "r.resume_data"])
+        join = " LEFT JOIN resumes r ON r.id = a.parsed_resume_key"
+
+    conditions, params = [], []
+    if query.status:
+        conditions.append("a.status = ?")
+        params.append(query.status)
+    if query.company:
+        conditions.append("a.company = ? COLLATE NOCASE")
+        params.append(query.company)
+    if query.date_from:
+        conditions.append("a.application_date >= ?")
+        params.append(query.date_from)
+    if query.date_to:
+        conditions.append("a.application_date <= ?")
+        params.append(query.date_to)
+    if query.after:
+        conditions.append("(a.application_date, a.id) < (?, ?)")
+        params.extend(query.after)
+
+    sql = f"SELECT {', '.join(columns)} FROM applications a{join}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    # One extra row tells whether there is a next page
+    sql += " ORDER BY a.application_date DESC, a.id DESC LIMIT ?"
+    params.append(query.limit + 1)
+    return sql, params
+
+def compact_json(data: Any) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+def decode_application_data(data: str) -> Any:
+    # Rows migrated from an old database may hold invalid JSON, see _migrate_inline_resumes
+    try:
+        return json.loads(data)
+    except ValueError:
+        return None
+
+def serialize_resume(resume_data: Dict[str, Any]) -> str:
+    # Sorted keys so the same resume always hashes the same
+    return json.dumps(resume_data, separators=(",", ":"), ensure_ascii=False, sort_keys=True)
+
+def parsed_resume_key(resume_json: str) -> str:
+    """
+    Return the key a parsed resume is stored under: the hash of its serialized
+    JSON, not the hash of the uploaded file that the resume store uses
+    """
+    return hashlib.sha256(resume_json.encode("utf-8")).hexdigest()
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+LINKEDIN_JOB_ID_PATTERN = re.compile(r"^/jobs/view/(?:[^/]*-)?(\d+)/?$")
+# Query parameters that only track where a click came from
+TRACKING_PARAMETERS = {"ref", "refid", "trk", "trackingid", "src", "source", "from", "position", "pagenum", "fbclid", "gclid"}
+
+def canonicalize_job_url(url: str) -> Optional[str]:
+    """
+    Return a canonical form of a job link, so the same job posted under
+    different links is stored once, or None if it isn't an http(s) URL.
+
+    The scheme becomes https, the host loses "www." and its case, tracking
+    parameters and fragments are dropped and the rest of the query is sorted.
+    LinkedIn and Indeed links are reduced to their job id.
+    """
+    parts = urlsplit((url or "").strip())
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return None
+    host = parts.hostname.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts.path.rstrip("/") or "/"
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query)
+        if key.lower() not in TRACKING_PARAMETERS and not key.lower().startswith("utm_")
+    ]
+
+    if host.endswith("linkedin.com"):
+        match = LINKEDIN_JOB_ID_PATTERN.match(path)
+        job_id = match.group(1) if match else dict(query).get("currentJobId")
+        if job_id:
+            return f"https://linkedin.com/jobs/view/{job_id}"
+    elif host.endswith("indeed.com"):
+        job_key = dict(query).get("jk") or dict(query).get("vjk")
+        if job_key:
+            return f"https://indeed.com/viewjob?jk={job_key}"
+
+    return urlunsplit(("https", host, path, urlencode(sorted(query)), ""))
+
+def job_key(job: Dict[str, Any]) -> str:
+    """Return the key a job listing is stored under: its canonical link, or its title, company and location"""
+    url = canonicalize_job_url(str(job.get("application_link", "")))
+    if url:
+        return url
+    # Listings without a usable link are told apart by what they describe
+    fields = [str(job.get(name, "")).lower() for name in ("job_title", "company_name", "location")]
+    return "job:" + hashlib.sha256("|".join(WHITESPACE_PATTERN.sub(" ", field).strip() for field in fields).encode("utf-8")).hexdigest()
+
+def normalize_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Collapse whitespace in a job listing's text fields and drop repeated skills"""
+    normalized = {
+        key: WHITESPACE_PATTERN.sub(" ", value).strip() if isinstance(value, str) else value
+        for key, value in job.items()
+    }
+    skills = normalized.get("skills_required")
+    if isinstance(skills, str) and "," in skills:
+        unique = {skill.strip().lower(): skill.strip() for skill in reversed(skills.split(",")) if skill.strip()}
+        normalized["skills_required"] = ", ".join(reversed(list(unique.values())))
+    return normalized
+
+def _create_schema(cursor: sqlite3.Cursor):
+    # Each parsed resume is stored once, keyed by parsed_resume_key, and shared by
+    # every application made with it
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS resumes (
+        id TEXT PRIMARY KEY,
+        resume_data TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    )
+    ''')
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS applications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_title TEXT NOT NULL,
+        company TEXT NOT NULL,
+        job_url TEXT NOT NULL,
+        application_date TEXT NOT NULL,
+        status TEXT NOT NULL,
+        parsed_resume_key TEXT REFERENCES resumes(id),
+        application_data TEXT,
+        UNIQUE(job_url)
+    )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_parsed_resume_key ON applications(parsed_resume_key)')
+    # Listings are newest first; id breaks ties so (application_date, id) is a stable cursor
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_date ON applications(application_date, id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status, application_date, id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_company ON applications(company COLLATE NOCASE, application_date, id)')
+    _create_search_index(cursor)
+
+    # Job listings returned by job_finder, stored once however many searches return them
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        url TEXT NOT NULL UNIQUE,
+        job_title TEXT NOT NULL,
+        company TEXT NOT NULL,
+        location TEXT,
+        job_data TEXT NOT NULL,
+        first_seen TEXT NOT NULL,
+        last_seen TEXT NOT NULL
+    )
+    ''')
+    # The jobs each search returned, in order, until the search expires
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS job_searches (
+        search_key TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+        created_at REAL NOT NULL,
+        PRIMARY KEY (search_key, position)
+    )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_job_searches_created_at ON job_searches(created_at)')
+    # Used to find jobs no search refers to any more, and by the foreign key when one is deleted
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_job_searches_job_id ON job_searches(job_id)')
+
+# The searchable text of an application, from its row (new or old in a trigger)
+def _search_values(row: str) -> str:
+    return (
+        f"{row}.id, {row}.job_title, {row}.company, "
+        f"{_json_text(row, 'job_description')}, {_json_text(row, 'skills_required')}"
+    )
+
+def _json_text(row: str, key: str) -> str:
+    # Invalid JSON must not make the write fail, so it is indexed as empty
+    return f"CASE WHEN json_valid({row}.application_data) THEN json_extract({row}.application_data, '$.{key}') END"
+
+def _create_search_index(cursor: sqlite3.Cursor):
+    """Create the full-text index over applications and the triggers that keep it in sync"""
+    cursor.execute('''
+    CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5(
+        job_title, company, job_description, skills,
+        tokenize = 'porter unicode61'
+    )
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS applications_fts_insert AFTER INSERT ON applications BEGIN
+        INSERT INTO applications_fts (rowid, job_title, company, job_description, skills)
+        VALUES ({_search_values("new")});
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS applications_fts_delete AFTER DELETE ON applications BEGIN
+        DELETE FROM applications_fts WHERE rowid = old.id;
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS applications_fts_update AFTER UPDATE OF job_title, company, application_data ON applications BEGIN
+        DELETE FROM applications_fts WHERE rowid = old.id;
+        INSERT INTO applications_fts (rowid, job_title, company, job_description, skills)
+        VALUES ({_search_values("new")});
+    END
+    ''')
+
+def _backfill_search_index(cursor: sqlite3.Cursor) -> int:
+    """Rebuild the full-text index from every application; returns the number indexed"""
+    cursor.execute('DELETE FROM applications_fts')
+    cursor.execute(f'''
+    INSERT INTO applications_fts (rowid, job_title, company, job_description, skills)
+    SELECT {_search_values("applications")} FROM applications
+    ''')
+    return cursor.rowcount
+
+def _migrate_inline_resumes(cursor: sqlite3.Cursor) -> int:
+    """
+    Move the resume JSON stored in every applications row into the resumes table.
+
+    Returns the number of applications migrated.
+    """
+    cursor.execute('ALTER TABLE applications RENAME TO applications_v0')
+    _create_schema(cursor)
+
+    rows = cursor.execute('''
+    SELECT id, job_title, company, job_url, application_date, status, resume_data, application_data
+    FROM applications_v0 ORDER BY id
+    ''').fetchall()
+    for row in rows:
+        resume_key = None
+        application_json = row[7]
+        try:
+            if row[6]:
+                resume_json = serialize_resume(json.loads(row[6]))
+                resume_key = parsed_resume_key(resume_json)
+                cursor.execute(INSERT_RESUME, (resume_key, resume_json, row[4]))
+            if application_json:
+                application_json = compact_json(json.loads(application_json))
+        except ValueError:
+            # Kept as it was rather than failing the whole migration
+            logger.warning(f"Application #{row[0]} has invalid JSON data")
+        cursor.execute('''
+        INSERT INTO applications
+        (id, job_title, company, job_url, application_date, status, parsed_resume_key, application_data)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', row[:6] + (resume_key, application_json))
+
+    cursor.execute('DROP TABLE applications_v0')
+    return len(rows)
+
+class ApplicationStore:
+    """
+    Async access to the job applications database.
+
+    Writes from every task go into one queue. A dedicated writer thread takes
+    them in batches of up to batch_size, waiting at most batch_delay seconds
+    after the first for more to arrive, and commits each batch in a single
+    transaction, so concurrent writers share one commit and one sync. With no
+    delay, a batch is whatever was queued while the previous one committed. Each
+    write has its own savepoint, so a failing write doesn't undo the others
+    in its batch, and its caller gets its result or exception only once the
+    batch is committed.
+
+    Reads run on a small pool of reader threads with a connection each. The
+    database is in WAL mode, so readers see the last committed state without
+    waiting for the writer, and the event loop only ever awaits the threads.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        readers: int = 4,
+        synchronous: str = "NORMAL",
+        busy_timeout: float = 10.0,
+        batch_size: int = 100,
+        batch_delay: float = 0.0
+    ):
+        if synchronous.upper() not in SYNCHRONOUS_MODES:
+            raise ValueError(f"Unknown synchronous mode: {synchronous}. Use one of: {', '.join(SYNCHRONOUS_MODES)}")
+        self.db_path = db_path
+        self.synchronous = synchronous.upper()
+        self.busy_timeout = busy_timeout
+        self.batch_size = max(1, batch_size)
+        self.batch_delay = max(0.0, batch_delay)
+
+        self._readers = ThreadPoolExecutor(max_workers=max(1, readers), thread_name_prefix="applications-db-reader")
+        self._reader_count = max(1, readers)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._reads = 0
+        self._writes = 0
+        self._write_errors = 0
+        self._batches = 0
+        self._batched_writes = 0
+        self._largest_batch = 0
+
+        # None in the queue stops the writer once the writes ahead of it are committed
+        self._queue: "queue.Queue[Optional[Tuple[Callable[[sqlite3.Connection], Any], Future]]]" = queue.Queue()
+        # The schema is created or migrated on the writer thread, ahead of any
+        # write; reads wait for it on their own thread, not the event loop
+        self._ready: Future = Future()
+        self._writer = threading.Thread(target=self._write_loop, name="applications-db-writer", daemon=True)
+        self._writer.start()
+
+    def _connection(self, read_only: bool) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
+            conn.execute('PRAGMA foreign_keys = ON')
+            conn.execute(f'PRAGMA synchronous = {self.synchronous}')
+            if read_only:
+                conn.execute('PRAGMA query_only = ON')
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _init_db(self):
+        """Initialize the database schema, migrating databases created by older versions"""
+        conn = self._connection(read_only=False)
+        # Persistent: the database stays in WAL mode for every later connection
+        conn.execute('PRAGMA journal_mode = WAL')
+        cursor = conn.cursor()
+
+        # One transaction, so a failed migration leaves the old schema intact
+        cursor.execute('BEGIN')
+        try:
+            version = cursor.execute('PRAGMA user_version').fetchone()[0]
+            columns = {row[1] for row in cursor.execute('PRAGMA table_info(applications)')}
+
+            migrated = 0
+            if "resume_data" in columns:
+                migrated = _migrate_inline_resumes(cursor)
+            else:
+                if "resume_id" in columns:
+                    # Named so it isn't mistaken for the resume store's resume_id
+                    cursor.execute('ALTER TABLE applications RENAME COLUMN resume_id TO parsed_resume_key')
+                    cursor.execute('DROP INDEX IF EXISTS idx_applications_resume_id')
+                _create_schema(cursor)
+            if version < 3:
+                # Applications recorded before the search index existed
+                indexed = _backfill_search_index(cursor)
+                logger.info(f"Indexed {indexed} applications for search")
+            if version != SCHEMA_VERSION:
+                cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        if migrated:
+            # Give the space taken by the duplicated resumes back to the filesystem
+            conn.execute('VACUUM')
+            logger.info(f"Migrated {migrated} applications to schema version {SCHEMA_VERSION}")
+        logger.info("Application database initialized")
+
+    def _read(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        self._ready.result()
+        conn = self._connection(read_only=True)
+        # One read transaction, so every query in func sees the same snapshot
+        conn.execute('BEGIN')
+        try:
+            return func(conn)
+        finally:
+            conn.rollback()
+
+    def _write_loop(self):
+        try:
+            self._init_db()
+            self._ready.set_result(None)
+        except Exception as e:
+            logger.error(f"Error initializing the application database: {str(e)}")
+            self._ready.set_exception(e)
+
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            self._commit(batch)
+
+    def _next_batch(self) -> Optional[List[Tuple[Callable[[sqlite3.Connection], Any], Future]]]:
+        """Wait for a write, then collect more until the batch is full or batch_delay has passed"""
+        item = self._queue.get()
+        if item is None:
+            return None
+        batch = [item]
+        deadline = time.monotonic() + self.batch_delay
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # Stop after committing this batch
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _commit(self, batch: List[Tuple[Callable[[sqlite3.Connection], Any], Future]]):
+        """Run a batch of writes in one transaction, then hand each caller its result"""
+        # Writes whose callers have given up are skipped
+        batch = [(func, future) for func, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        outcomes: List[Tuple[Future, Any, Optional[BaseException]]] = []
+        try:
+            conn = self._connection(read_only=False)
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                for func, future in batch:
+                    conn.execute('SAVEPOINT write')
+                    try:
+                        outcomes.append((future, func(conn), None))
+                    except Exception as e:
+                        conn.execute('ROLLBACK TO write')
+                        outcomes.append((future, None, e))
+                    conn.execute('RELEASE write')
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        except Exception as e:
+            logger.error(f"Error committing {len(batch)} application database writes: {str(e)}")
+            outcomes = [(future, None, e) for _, future in batch]
+
+        with self._lock:
+            self._batches += 1
+            self._batched_writes += len(batch)
+            self._largest_batch = max(self._largest_batch, len(batch))
+            self._write_errors += sum(1 for _, _, error in outcomes if error is not None)
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    async def _submit(self, executor: Executor, func: Callable[..., T], *args: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    async def read(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        """Run func(connection) in a read transaction on a reader thread"""
+        with self._lock:
+            self._reads += 1
+        return await self._submit(self._readers, self._read, func)
+
+    def submit_write(self, func: Callable[[sqlite3.Connection], T]) -> "Future[T]":
+        """
+        Queue func(connection) for the writer thread.
+
+        The returned future is resolved with func's result once the batch it
+        ran in is committed, or with its exception if it raised, in which case
+        its changes are rolled back.
+        """
+        future: Future = Future()
+        with self._lock:
+            self._writes += 1
+        self._queue.put((func, future))
+        return future
+
+    async def write(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        """Run func(connection) in the writer's next batch and return its result once committed"""
+        return await asyncio.wrap_future(self.submit_write(func))
+
+    async def application_exists(self, job_url: str) -> bool:
+        """Whether an application was already recorded for a job URL"""
+        def exists(conn: sqlite3.Connection) -> bool:
+            return conn.execute(SELECT_APPLICATION_BY_URL, (job_url,)).fetchone() is not None
+
+        return await self.read(exists)
+
+    async def add_application(self, job_data: Dict[str, Any], resume_data: Dict[str, Any], status: str = "initiated") -> int:
+        """
+        Record an application and the resume it was made with.
+
+        Returns:
+            The new application id
+
+        Raises:
+            sqlite3.IntegrityError: If an application for the job URL already exists
+        """
+        now = datetime.datetime.now().isoformat()
+        # Serialized here rather than on the writer thread, which only writes
+        resume_json = serialize_resume(resume_data)
+        row = (
+            job_data.get("job_title", "Unknown Position"),
+            job_data.get("company_name", "Unknown Company"),
+            job_data.get("application_link", ""),
+            now,
+            status,
+            parsed_resume_key(resume_json),
+            compact_json(job_data)
+        )
+
+        def insert(conn: sqlite3.Connection) -> int:
+            # Store the resume once, however many applications use it
+            conn.execute(INSERT_RESUME, (row[5], resume_json, now))
+            return conn.execute(INSERT_APPLICATION, row).lastrowid
+
+        return await self.write(insert)
+
+    async def search_applications(self, text: str, limit: int = 20, offset: int = 0, status: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Search job titles, companies, job descriptions and skills, best matches first.
+
+        Returns:
+            One page of matching applications, each with a snippet of the
+            matching text and its score (higher is better), and the offset of
+            the next page or None
+
+        Raises:
+            ValueError: If the search text is empty or limit/offset are invalid
+        """
+        expression = match_expression(text)
+        if not expression:
+            raise ValueError("The search query is empty")
+        if limit < 1 or offset < 0:
+            raise ValueError("limit must be at least 1 and offset at least 0")
+
+        def select(conn: sqlite3.Connection):
+            conn.row_factory = sqlite3.Row
+            try:
+                return conn.execute(SEARCH_APPLICATIONS, (expression, status, status, limit + 1, offset)).fetchall()
+            finally:
+                conn.row_factory = None
+
+        rows = await self.read(select)
+        applications = []
+        for row in rows[:limit]:
+            application = dict(row)
+            application["score"] = round(-application.pop("rank"), 4)
+            applications.append(application)
+        return {"applications": applications, "next_offset": offset + limit if len(rows) > limit else None}
+
+    async def get_search_results(self, search_key: str, max_age: float) -> Optional[List[Dict[str, Any]]]:
+        """Return the jobs a search found within the last max_age seconds, in order, or None"""
+        def select(conn: sqlite3.Connection) -> List[str]:
+            return [row[0] for row in conn.execute(SELECT_JOB_SEARCH, (search_key, time.time() - max_age))]
+
+        rows = await self.read(select)
+        return [json.loads(job_json) for job_json in rows] if rows else None
+
+    async def save_search_results(self, search_key: str, jobs: List[Dict[str, Any]], max_age: float) -> List[Dict[str, Any]]:
+        """
+        Store the jobs a search found, replacing its earlier results.
+
+        Jobs are normalized and keyed on their canonical link, so a job that
+        another search already found is updated rather than stored again, and
+        a job listed twice is kept once. Searches older than max_age are
+        removed, along with the jobs no remaining search returned. Returns the
+        jobs as stored.
+        """
+        unique: Dict[str, Dict[str, Any]] = {}
+        for job in jobs:
+            if isinstance(job, dict):
+                unique.setdefault(job_key(job), normalize_job(job))
+
+        def save(conn: sqlite3.Connection) -> None:
+            now = time.time()
+            seen = datetime.datetime.now().isoformat()
+            removed = conn.execute('DELETE FROM job_searches WHERE search_key = ? OR created_at < ?', (search_key, now - max_age)).rowcount
+            for position, (url, job) in enumerate(unique.items()):
+                conn.execute(UPSERT_JOB, (
+                    url,
+                    job.get("job_title", ""),
+                    job.get("company_name", ""),
+                    job.get("location"),
+                    compact_json(job),
+                    seen,
+                    seen
+                ))
+                job_id = conn.execute(SELECT_JOB_ID, (url,)).fetchone()[0]
+                conn.execute(INSERT_JOB_SEARCH, (search_key, position, job_id, now))
+            # After the inserts, so jobs this search found again are kept
+            if removed:
+                conn.execute(DELETE_UNREFERENCED_JOBS)
+
+        await self.write(save)
+        return list(unique.values())
+
+    async def update_status(self, application_id: int, status: str) -> bool:
+        """Set an application's status; returns False if there is no such application"""
+        def update(conn: sqlite3.Connection) -> bool:
+            return conn.execute(UPDATE_APPLICATION_STATUS, (status, application_id)).rowcount > 0
+
+        return await self.write(update)
+
+    async def list_applications(self) -> List[Dict[str, Any]]:
+        """Return every application, newest first, with its resume and job data parsed"""
+        def select(conn: sqlite3.Connection):
+            conn.row_factory = sqlite3.Row
+            try:
+                rows = conn.execute(SELECT_APPLICATIONS).fetchall()
+                resumes = conn.execute(SELECT_APPLICATION_RESUMES).fetchall()
+            finally:
+                conn.row_factory = None
+            return rows, resumes
+
+        rows, resume_rows = await self.read(select)
+
+        # Each distinct resume is parsed once, not once per application
+        resumes = {row["id"]: json.loads(row["resume_data"]) for row in resume_rows}
+        applications = []
+        for row in rows:
+            application = dict(row)
+            application["resume_data"] = resumes.get(application.pop("parsed_resume_key"))
+            if application.get("application_data"):
+                application["application_data"] = decode_application_data(application["application_data"])
+            applications.append(application)
+        return applications
+
+    async def query_applications(self, query: ApplicationQuery) -> Dict[str, Any]:
+        """
+        Return one page of applications, newest first, and the cursor for the next page.
+
+        Only the fields in query.fields are returned, and the JSON fields are
+        only read and decoded when they are among them.
+        """
+        sql, params = _select_page(query)
+
+        def select(conn: sqlite3.Connection):
+            conn.row_factory = sqlite3.Row
+            try:
+                return conn.execute(sql, params).fetchall()
+            finally:
+                conn.row_factory = None
+
+        rows = await self.read(select)
+        next_cursor = None
+        if len(rows) > query.limit:
+            rows = rows[:query.limit]
+            next_cursor = encode_cursor(rows[-1]["application_date"], rows[-1]["id"])
+
+        # Applications made with the same resume share its decoded data
+        resumes: Dict[str, Any] = {}
+        applications = []
+        for row in rows:
+            application = {field: row[field] for field in query.fields if field != "resume_data"}
+            if application.get("application_data"):
+                application["application_data"] = decode_application_data(application["application_data"])
+            if "resume_data" in query.fields:
+                resume_key = row["parsed_resume_key"]
+                if resume_key not in resumes:
+                    resumes[resume_key] = json.loads(row["resume_data"]) if row["resume_data"] else None
+                application["resume_data"] = resumes[resume_key]
+            applications.append(application)
+
+        return {"applications": applications, "next_cursor": next_cursor}
+
+    def close(self):
+        """Commit queued writes, then close every connection"""
+        self._queue.put(None)
+        self._writer.join()
+        self._readers.shutdown(wait=True)
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return operation counters and connection settings"""
+        with self._lock:
+            return {
+                "reads": self._reads,
+                "writes": self._writes,
+                "write_errors": self._write_errors,
+                "write_batches": self._batches,
+                "rows_per_batch": round(self._batched_writes / self._batches, 2) if self._batches else 0.0,
+                "largest_batch": self._largest_batch,
+                "queued_writes": self._queue.qsize(),
+                "batch_size": self.batch_size,
+                "batch_delay_ms": self.batch_delay * 1000,
+                "reader_threads": self._reader_count,
+                "connections": len(self._connections),
+                "synchronous": self.synchronous
+            }
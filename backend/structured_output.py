@@ -0,0 +1,145 @@
+import json
+import logging
+import re
+import time
+from typing import Any, Dict, List, Type
+
+from pydantic import BaseModel, ValidationError
+
+from json_stream import parse_json_array
+
+logger = logging.getLogger(__name__)
+
+TRAILING_COMMA_PATTERN = re.compile(r",\s*([}\]])")
+
+class StructuredOutputError(Exception):
+    """Raised when a model response can't be parsed into the tool's schema"""
+
+class StructuredOutputParser:
+    """
+    Parse model JSON output into a tool's Pydantic schema.
+
+    The response is first parsed as-is. If that fails, one repair pass strips
+    markdown fences and surrounding text, removes trailing commas and, for
+    arrays, keeps only the elements that are complete and valid. There is no
+    further fallback, so the cost of a bad response is bounded by one extra
+    linear scan.
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def parse(self, text: str, model: Type[BaseModel], tool: str, many: bool = False) -> Any:
+        """
+        Parse a response into a dict, or a list of dicts when many is True.
+
+        Args:
+            text: The raw model response
+            model: The schema to validate against
+            tool: The calling tool, used for metrics
+            many: Whether the response is a JSON array of model objects
+
+        Returns:
+            The validated data as plain dicts
+
+        Raises:
+            StructuredOutputError: If the response can't be parsed even after repair
+        """
+        started = time.perf_counter()
+        outcome = "failed"
+        try:
+            try:
+                result = self._validate(json.loads(text), model, many, strict=True)
+                outcome = "parsed"
+                return result
+            except (json.JSONDecodeError, ValidationError, TypeError):
+                pass
+
+            result = self._validate(self._repair(text, many), model, many, strict=False)
+            outcome = "repaired"
+            logger.info(f"Repaired structured output for {tool}")
+            return result
+        except (json.JSONDecodeError, ValidationError, TypeError) as e:
+            logger.warning(f"Could not parse structured output for {tool}: {str(e)}")
+            raise StructuredOutputError("The AI response was not in the expected format. Please try again.")
+        finally:
+            self._record(tool, outcome, time.perf_counter() - started)
+
+    def validate(self, data: Any, model: Type[BaseModel], tool: str) -> Dict[str, Any]:
+        """Validate one already-decoded object, such as a job from a stream"""
+        started = time.perf_counter()
+        outcome = "failed"
+        try:
+            result = model.model_validate(data).model_dump()
+            outcome = "parsed"
+            return result
+        except ValidationError as e:
+            logger.warning(f"Invalid structured output item for {tool}: {str(e)}")
+            raise StructuredOutputError("The AI response was not in the expected format.")
+        finally:
+            self._record(tool, outcome, time.perf_counter() - started)
+
+    def _repair(self, text: str, many: bool) -> Any:
+        """Decode a response after one cleanup pass"""
+        start = text.find("[") if many else text.find("{")
+        # A single object is accepted where an array was expected
+        if many and (start < 0 or 0 <= text.find("{") < start):
+            start = text.find("{")
+        # A truncated array has no closing bracket, so end at its last complete element
+        end = max(text.rfind("]"), text.rfind("}")) if many else text.rfind("}")
+        if start < 0 or end < start:
+            raise json.JSONDecodeError("No JSON found in the response", text, 0)
+
+        cleaned = TRAILING_COMMA_PATTERN.sub(r"\1", text[start:end + 1])
+        try:
+            return json.loads(cleaned)
+        except json.JSONDecodeError:
+            if not many:
+                raise
+            # Keep the complete elements of a truncated or partly malformed array
+            items = parse_json_array(cleaned)
+            if not items:
+                raise
+            return items
+
+    def _validate(self, data: Any, model: Type[BaseModel], many: bool, strict: bool) -> Any:
+        if not many:
+            return model.model_validate(data).model_dump()
+
+        if isinstance(data, dict):
+            # Unwrap {"jobs": [...]} style responses when repairing
+            lists = [value for value in data.values() if isinstance(value, list)]
+            data = lists[0] if not strict and len(lists) == 1 else [data]
+        if not isinstance(data, list):
+            raise TypeError(f"Expected a JSON array, got {type(data).__name__}")
+        if strict:
+            return [model.model_validate(item).model_dump() for item in data]
+
+        items: List[Dict[str, Any]] = []
+        for item in data:
+            try:
+                items.append(model.model_validate(item).model_dump())
+            except ValidationError:
+                continue
+        if not items:
+            raise TypeError("No valid items in the JSON array")
+        return items
+
+    def _record(self, tool: str, outcome: str, seconds: float):
+        stats = self._stats.setdefault(tool, {"parsed": 0, "repaired": 0, "failed": 0, "parse_seconds": 0.0})
+        stats[outcome] += 1
+        stats["parse_seconds"] += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-tool parse outcomes, success rate and average parse time"""
+        report = {}
+        for tool, stats in self._stats.items():
+            total = stats["parsed"] + stats["repaired"] + stats["failed"]
+            report[tool] = {
+                "parsed": stats["parsed"],
+                "repaired": stats["repaired"],
+                "failed": stats["failed"],
+                "success_rate": round((stats["parsed"] + stats["repaired"]) / total, 4) if total else 0.0,
+                "avg_parse_ms": round(stats["parse_seconds"] * 1000 / total, 3) if total else 0.0
+            }
+        return report
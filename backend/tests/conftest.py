@@ -0,0 +1,40 @@
+import os
+import shutil
+import sys
+import tempfile
+
+# config reads the environment at import time, so the app is pointed at the
+# fake model backend and throwaway storage before any test imports it
+STATE_DIR = tempfile.mkdtemp(prefix="backend_tests_")
+os.environ.update({
+    "LLM_BACKEND": "fake",
+    "GEMINI_API_KEY": "",
+    "LLM_FAKE_LATENCY_SECONDS": "0",
+    "LLM_CACHE_ENABLED": "false",
+    "LLM_CACHE_PATH": os.path.join(STATE_DIR, "llm_cache.db"),
+    "LLM_REQUESTS_PER_MINUTE": "0",
+    "LLM_TOKENS_PER_MINUTE": "0",
+    "RESUME_STORE_DIR": os.path.join(STATE_DIR, "resume_store"),
+    "APPLICATIONS_DB_PATH": os.path.join(STATE_DIR, "applications.db"),
+    "PDF_WORKERS": "1",
+    "BULK_PARSE_WORKERS": "1"
+})
+
+import pytest
+
+@pytest.fixture
+def store(tmp_path):
+    """An application store on an empty database"""
+    from storage import ApplicationStore
+
+    application_store = ApplicationStore(str(tmp_path / "applications.db"), readers=2)
+    yield application_store
+    application_store.close()
+
+def pytest_sessionfinish(session, exitstatus):
+    # Only stop what the tests started; main creates its PDF workers on import
+    main = sys.modules.get("main")
+    if main is not None:
+        main.pdf_extractor.shutdown()
+        main.close_application_store()
+    shutil.rmtree(STATE_DIR, ignore_errors=True)
@@ -0,0 +1,191 @@
+import asyncio
+import hashlib
+import io
+import json
+import zipfile
+
+import httpx
+import pytest
+
+import main
+from llm_backends import FakeBackend
+from llm_cache import ResponseCache
+from llm_client import LLMClient
+from schemas import ATSResult
+from structured_output import StructuredOutputError
+
+RESUME_TEXT = b"Jane Doe\njane@example.org\n\nEXPERIENCE\nBackend Engineer at Acme (2019-2024)\n"
+
+def request(method: str, path: str, **kwargs) -> httpx.Response:
+    async def send():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+
+    return asyncio.run(send())
+
+def sse_events(text: str) -> list:
+    """Return (event, data) pairs from a Server-Sent Events body"""
+    events = []
+    for message in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in message.splitlines())
+        events.append((fields.get("event"), json.loads(fields["data"])))
+    return events
+
+def test_cover_letter_streams_chunks_then_done():
+    response = request(
+        "POST", "/tools/cover_letter_generator/stream",
+        files={"resume": ("resume.txt", RESUME_TEXT)}, data={"job_description": "Backend engineer"}
+    )
+    events = sse_events(response.text)
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert events[-1] == ("done", {})
+    letter = "".join(data["text"] for event, data in events if event == "chunk")
+    assert letter.startswith("Dear Hiring Manager")
+
+def test_confident_chat_messages_are_routed_without_a_model_call():
+    calls = main.llm.stats()["calls"]
+    response = request("POST", "/mcp", json={"text": "What is the status of my applications?"})
+
+    assert response.json()["tool_calls"][0]["name"] == "application_status"
+    assert main.llm.stats()["calls"] == calls
+
+def test_batch_ats_scoring_streams_one_line_per_description():
+    response = request(
+        "POST", "/tools/ats_score_checker/batch",
+        files={"resume": ("resume.txt", RESUME_TEXT)},
+        data={"job_descriptions": json.dumps(["Python developer", "SQL analyst", "Docker engineer"]), "mode": "local"}
+    )
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert sorted(line["index"] for line in lines) == [0, 1, 2]
+    assert all("score" in line["result"] for line in lines)
+    assert request(
+        "POST", "/tools/ats_score_checker/batch",
+        files={"resume": ("resume.txt", RESUME_TEXT)}, data={"job_descriptions": "not json"}
+    ).status_code == 400
+
+def test_job_finder_streams_one_line_per_job():
+    response = request(
+        "POST", "/tools/job_finder/stream",
+        files={"resume": ("resume.txt", RESUME_TEXT)}, data={"experience_years": "3", "location": "Remote"}
+    )
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [line["index"] for line in lines] == [0, 1, 2, 3, 4]
+    assert lines[0]["job"]["job_title"] == "Software Engineer 1"
+
+def test_streamed_jobs_are_normalized_like_stored_ones(monkeypatch):
+    job = {"job_title": "  Data   Engineer ", "company_name": "Acme", "skills_required": "SQL, Python, sql",
+           "application_link": "https://www.linkedin.com/jobs/view/42?trk=feed"}
+    responses = {"job_finder": json.dumps([job, {**job, "application_link": "https://linkedin.com/jobs/view/42"}])}
+    monkeypatch.setattr(main, "llm", LLMClient(FakeBackend(latency=0, responses=responses), main.GENERATION_CONFIG))
+    form = {"experience_years": "3", "location": "Stream City"}
+
+    response = request("POST", "/tools/job_finder/stream", files={"resume": ("resume.txt", RESUME_TEXT)}, data=form)
+    jobs = [json.loads(line)["job"] for line in response.text.splitlines()]
+
+    assert len(jobs) == 1
+    assert jobs[0]["job_title"] == "Data Engineer"
+    assert sorted(jobs[0]["skills_required"].split(", ")) == ["Python", "SQL"]
+    # The repeat search is answered from the stored results, which match what was streamed
+    assert request("POST", "/tools/job_finder", files={"resume": ("resume.txt", RESUME_TEXT)}, data=form).json() == jobs
+
+def test_ats_result_follows_the_schema():
+    response = request(
+        "POST", "/tools/ats_score_checker",
+        files={"resume": ("resume.txt", RESUME_TEXT)}, data={"job_description": "Python developer", "mode": "llm"}
+    )
+    result = response.json()
+
+    assert result["score"] == 72
+    assert set(result) >= {"matching_keywords", "missing_keywords", "formatting_issues", "recommendations"}
+
+def test_uploading_the_same_resume_twice_returns_the_same_id():
+    first = request("POST", "/resumes", files={"resume": ("resume.txt", RESUME_TEXT)})
+    second = request("POST", "/resumes", files={"resume": ("copy.txt", RESUME_TEXT)})
+
+    assert first.status_code == 200
+    assert first.json()["resume_id"] == hashlib.sha256(RESUME_TEXT).hexdigest()
+    assert second.json()["resume_id"] == first.json()["resume_id"]
+    assert request("GET", f"/resumes/{first.json()['resume_id']}").status_code == 200
+
+def test_tool_endpoints_accept_a_resume_id():
+    resume_id = request("POST", "/resumes", files={"resume": ("resume.txt", RESUME_TEXT)}).json()["resume_id"]
+    data = {"job_description": "Python developer", "mode": "local"}
+
+    assert request("POST", "/tools/ats_score_checker", data={**data, "resume_id": resume_id}).status_code == 200
+    assert request("POST", "/tools/ats_score_checker", data={**data, "resume_id": "0" * 64}).status_code == 404
+    assert request("POST", "/tools/ats_score_checker", data=data).status_code == 400
+
+def test_resume_without_extractable_text_is_rejected_and_not_stored():
+    content = b"%PDF-1.4 not really a pdf"
+    response = request("POST", "/resumes", files={"resume": ("scan.pdf", content, "application/pdf")})
+
+    assert response.status_code == 422
+    assert request("GET", f"/resumes/{hashlib.sha256(content).hexdigest()}").status_code == 404
+
+def test_bulk_upload_streams_one_line_per_resume():
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("a.txt", b"Alice\n\nSKILLS\nGo")
+        zip_file.writestr("b.txt", b"Bob\n\nSKILLS\nRust")
+        zip_file.writestr("broken.pdf", b"%PDF-1.4 broken")
+        zip_file.writestr("__MACOSX/._a.txt", b"metadata")
+
+    response = request("POST", "/resumes/bulk", files={"archive": ("resumes.zip", archive.getvalue(), "application/zip")})
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert lines[-1] == {"finished": True, "total": 3, "stored": 2, "failed": 1}
+    results = {line["filename"]: line for line in lines[:-1]}
+    assert "error" in results["broken.pdf"]
+    assert results["a.txt"]["resume_id"] == hashlib.sha256(b"Alice\n\nSKILLS\nGo").hexdigest()
+    stored = request("GET", f"/resumes/{results['b.txt']['resume_id']}").json()
+    assert stored["parsed"]["skills"] == ["Rust"]
+
+def test_repeated_job_search_is_answered_from_stored_results():
+    resume_id = request("POST", "/resumes", files={"resume": ("resume.txt", RESUME_TEXT)}).json()["resume_id"]
+    form = {"resume_id": resume_id, "experience_years": "5", "location": "Remote"}
+    calls = main.llm.stats()["calls"]
+
+    first = request("POST", "/tools/job_finder", data=form)
+    second = request("POST", "/tools/job_finder", data={**form, "location": " remote "})
+
+    assert first.status_code == 200
+    assert second.json() == first.json()
+    assert main.llm.stats()["calls"] == calls + 1
+    # Jobs are keyed on their canonical link
+    urls = asyncio.run(main.get_application_store().read(lambda conn: [row[0] for row in conn.execute("SELECT url FROM jobs")]))
+    assert "https://linkedin.com/jobs/view/3500000001" in urls
+
+def test_application_listing_pages_and_rejects_invalid_cursors():
+    async def add_applications():
+        for i in range(3):
+            job = {"job_title": f"Job {i}", "company_name": "Listing Co", "application_link": f"https://listing.example.org/{i}"}
+            await main.get_application_store().add_application(job, {"skills": []})
+
+    asyncio.run(add_applications())
+    first = request("POST", "/tools/application_status", data={"limit": "2", "company": "listing co"}).json()
+    second = request("POST", "/tools/application_status", data={"limit": "2", "company": "listing co", "cursor": first["next_cursor"]}).json()
+
+    assert [application["job_title"] for application in first["applications"] + second["applications"]] == ["Job 2", "Job 1", "Job 0"]
+    assert second["next_cursor"] is None
+    assert request("POST", "/tools/application_status", data={"cursor": "garbage"}).status_code == 400
+
+def test_application_search_endpoint():
+    response = request("POST", "/tools/application_status/search", data={"query": "listing"})
+    assert response.status_code == 200
+    assert request("POST", "/tools/application_status/search", data={"query": " "}).status_code == 400
+
+def test_unparseable_structured_output_is_not_kept_in_the_cache(tmp_path, monkeypatch):
+    backend = FakeBackend(latency=0, responses={"ats_score_checker": "not json"})
+    client = LLMClient(backend, main.GENERATION_CONFIG, cache=ResponseCache(str(tmp_path / "cache.db")))
+    monkeypatch.setattr(main, "llm", client)
+
+    async def generate_and_parse():
+        response = await client.generate("prompt", tool="ats_score_checker", json_mode=True)
+        await main._parse_response(response, "prompt", ATSResult, "ats_score_checker")
+
+    with pytest.raises(StructuredOutputError):
+        asyncio.run(generate_and_parse())
+    assert client.cache.stats()["entries"] == 0
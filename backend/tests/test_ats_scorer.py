@@ -0,0 +1,36 @@
+from ats_scorer import extract_phrases, local_feedback, score_resume
+
+JOB = """Senior Backend Engineer
+We are looking for strong experience with Python, PostgreSQL and Kubernetes.
+You will design REST APIs and run CI/CD pipelines. Python and Kubernetes skills required."""
+
+MATCHING_RESUME = """Jane Doe
+jane@example.org
+EXPERIENCE
+Backend engineer building REST APIs in Python on PostgreSQL, deployed to Kubernetes with CI/CD pipelines."""
+
+UNRELATED_RESUME = """John Smith
+EXPERIENCE
+Pastry chef baking bread and croissants for a busy bakery."""
+
+def test_phrases_break_at_stopwords_and_filler_words():
+    assert extract_phrases("Strong experience with Python and node.js, required") == ["python", "node.js"]
+
+def test_a_matching_resume_scores_higher():
+    matching = score_resume(MATCHING_RESUME, JOB)
+    unrelated = score_resume(UNRELATED_RESUME, JOB)
+
+    assert matching["score"] > unrelated["score"]
+    assert {"python", "kubernetes", "postgresql"} <= set(matching["matching_keywords"])
+    assert "python" in unrelated["missing_keywords"]
+
+def test_scoring_is_deterministic():
+    assert score_resume(MATCHING_RESUME, JOB) == score_resume(MATCHING_RESUME, JOB)
+
+def test_a_description_without_keywords_scores_zero():
+    assert score_resume(MATCHING_RESUME, "The and of a")["score"] == 0
+
+def test_local_feedback_names_missing_keywords():
+    issues, recommendations = local_feedback(UNRELATED_RESUME, ["python", "kubernetes"])
+    assert "No email address" in issues
+    assert "python, kubernetes" in recommendations
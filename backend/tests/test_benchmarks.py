@@ -0,0 +1,25 @@
+from benchmarks.corpus import generate_corpus, generate_resume, text_to_pdf
+from benchmarks.harness import compare, summarize
+from utils import extract_text_from_pdf
+
+def test_corpus_is_deterministic():
+    assert generate_corpus(3, seed=7) == generate_corpus(3, seed=7)
+    assert generate_resume(1) != generate_resume(2)
+
+def test_generated_pdfs_extract_to_their_text():
+    text = extract_text_from_pdf(text_to_pdf("Jane Doe\nPython developer"))
+    assert "Jane Doe" in text
+    assert "Python developer" in text
+
+def test_summarize_reports_percentiles_in_milliseconds():
+    result = summarize([0.001] * 99 + [0.1], wall_seconds=2.0)
+    assert result["p50_ms"] == 1.0
+    assert result["throughput_per_s"] == 50.0
+
+def test_compare_flags_metrics_slower_than_the_threshold():
+    baseline = {"parse": {"p50_ms": 1.0, "p95_ms": 2.0}, "gone": {"p50_ms": 1.0}}
+    results = {"parse": {"p50_ms": 1.1, "p95_ms": 3.0}, "new": {"p50_ms": 5.0}}
+
+    regressions = compare(results, baseline, threshold=0.2)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("parse p95_ms")
@@ -0,0 +1,50 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+import bulk_parse
+from bulk_parse import ArchiveError, archive_entries, load_checkpoint
+
+def make_zip(files) -> zipfile.ZipFile:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+    return zipfile.ZipFile(archive)
+
+def test_archive_entries_skip_other_files_and_split_off_large_ones():
+    zip_file = make_zip({
+        "a.txt": b"Alice", "big.pdf": b"x" * 100, "notes.docx": b"doc",
+        "__MACOSX/._a.txt": b"metadata", ".hidden.txt": b"hidden"
+    })
+    entries, oversized = archive_entries(zip_file, max_files=10, max_file_bytes=50)
+
+    assert [info.filename for info in entries] == ["a.txt"]
+    assert [info.filename for info in oversized] == ["big.pdf"]
+
+@pytest.mark.parametrize("files, max_files", [({"notes.docx": b"doc"}, 10), ({"a.txt": b"A", "b.txt": b"B"}, 1)])
+def test_archives_without_resumes_or_with_too_many_are_rejected(files, max_files):
+    with pytest.raises(ArchiveError):
+        archive_entries(make_zip(files), max_files=max_files, max_file_bytes=1024)
+
+def test_checkpoint_drops_a_half_written_last_line(tmp_path):
+    output = tmp_path / "parsed.ndjson"
+    output.write_text(json.dumps({"filename": "a.txt"}) + "\n" + '{"filename": "b.t')
+
+    assert load_checkpoint(str(output)) == {"a.txt"}
+    assert output.read_text() == json.dumps({"filename": "a.txt"}) + "\n"
+
+def test_an_interrupted_run_continues_where_it_stopped(tmp_path):
+    directory = tmp_path / "resumes"
+    directory.mkdir()
+    for name in ("a.txt", "b.txt"):
+        (directory / name).write_text(f"{name}\n\nSKILLS\nPython")
+    output = tmp_path / "parsed.ndjson"
+    output.write_text(json.dumps({"filename": "a.txt"}) + "\n")
+
+    assert bulk_parse.main([str(directory), "--output", str(output), "--workers", "0"]) == 0
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [line["filename"] for line in lines] == ["a.txt", "b.txt"]
+    assert "text" not in lines[1]
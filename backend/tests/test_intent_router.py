@@ -0,0 +1,41 @@
+import asyncio
+
+from intent_router import IntentRouter
+
+def test_clear_requests_are_routed_confidently():
+    router = IntentRouter()
+    for message, tool in [
+        ("Can you check my ATS score?", "ats_score_checker"),
+        ("Find me python jobs in Berlin", "job_finder"),
+        ("Write a cover letter for this role", "cover_letter_generator"),
+        ("What is the status of my applications?", "application_status")
+    ]:
+        match = router.classify(message)
+        assert match.tool == tool
+        assert router.is_confident(match)
+
+def test_rules_match_whole_words_only():
+    assert IntentRouter().classify("whats up").tool is None
+
+def test_ambiguous_messages_have_low_confidence():
+    router = IntentRouter()
+    match = router.classify("letter about jobs")
+    assert not router.is_confident(match)
+
+def test_rules_can_be_added():
+    router = IntentRouter(rules=[])
+    router.add_rule("job_finder", r"\bgigs?\b", 0.9)
+    assert router.classify("any gigs?").tool == "job_finder"
+
+def test_fallback_is_only_asked_when_rules_are_unsure():
+    asked = []
+
+    async def fallback(text):
+        asked.append(text)
+        return "job_finder"
+
+    router = IntentRouter(fallback=fallback)
+    assert asyncio.run(router.route("Write a cover letter")).source == "rules"
+    match = asyncio.run(router.route("hello there"))
+    assert (match.tool, match.source) == ("job_finder", "fallback")
+    assert asked == ["hello there"]
@@ -0,0 +1,58 @@
+import json
+
+from json_stream import JSONArrayStreamParser, parse_json_array
+
+JOBS = [
+    {"job_title": "Engineer", "skills": ["C++", "Go"]},
+    {"job_title": "Say \"hi\" {not a brace}", "notes": "a ] inside a string"},
+    {"job_title": "Analyst", "nested": {"level": [1, 2, {"deep": True}]}}
+]
+
+def feed_in_chunks(parser: JSONArrayStreamParser, text: str, size: int) -> list:
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start:start + size]))
+    return items
+
+def test_elements_are_returned_whatever_the_chunk_size():
+    text = json.dumps(JOBS)
+    for size in (1, 3, 7, len(text)):
+        parser = JSONArrayStreamParser()
+        assert feed_in_chunks(parser, text, size) == JOBS
+        assert parser.done
+        assert not parser.incomplete
+
+def test_each_element_is_returned_as_soon_as_it_closes():
+    parser = JSONArrayStreamParser()
+    text = json.dumps(JOBS)
+    first_end = text.index("}") + 1
+
+    assert parser.feed(text[:first_end - 1]) == []
+    assert parser.feed(text[first_end - 1:first_end]) == [JOBS[0]]
+
+def test_text_around_the_array_is_ignored():
+    text = 'Sure! Here are the jobs:\n```json\n' + json.dumps(JOBS) + '\n```\nGood luck "applying"!'
+    assert feed_in_chunks(JSONArrayStreamParser(), text, 5) == JOBS
+
+def test_a_single_object_is_the_whole_response():
+    parser = JSONArrayStreamParser()
+    assert parser.feed(json.dumps(JOBS[0]) + ' {"ignored": true}') == [JOBS[0]]
+    assert parser.done
+
+def test_truncated_stream_is_incomplete():
+    parser = JSONArrayStreamParser()
+    text = json.dumps(JOBS)
+    items = feed_in_chunks(parser, text[:text.index("Analyst")], 4)
+
+    assert items == JOBS[:2]
+    assert parser.incomplete
+
+def test_malformed_elements_are_skipped():
+    parser = JSONArrayStreamParser()
+    assert parser.feed('[{"a": 1}, {"b": 2,}, {"c": 3}]') == [{"a": 1}, {"c": 3}]
+    assert parser.errors == 1
+    assert parser.items == 2
+
+def test_parse_json_array():
+    # The last element was cut off
+    assert parse_json_array('[{"a": 1}, {"b": [1, 2]}, {"c": ') == [{"a": 1}, {"b": [1, 2]}]
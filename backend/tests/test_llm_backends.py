@@ -0,0 +1,61 @@
+import asyncio
+import inspect
+import json
+
+import pytest
+
+import config
+from llm_backends import FAKE_RESPONSES, FakeBackend, GeminiBackend, RecordReplayBackend, ReplayMissError, create_backend
+from schemas import ATSResult, response_schema
+
+def collect(chunks) -> list:
+    async def read():
+        return [chunk async for chunk in chunks]
+
+    return asyncio.run(read())
+
+def test_fake_backend_answers_in_each_tool_format():
+    backend = FakeBackend(latency=0)
+    response = asyncio.run(backend.generate("prompt", "job_finder"))
+
+    assert len(json.loads(response.text)) == 5
+    assert asyncio.run(backend.generate("prompt", "unknown")).text == FAKE_RESPONSES["mcp"]
+
+def test_fake_stream_joins_to_the_full_response():
+    chunks = collect(FakeBackend(latency=0, chunk_count=4).stream("prompt", "cover_letter_generator"))
+    assert len(chunks) == 4
+    assert "".join(chunks) == FAKE_RESPONSES["cover_letter_generator"]
+
+def test_recorded_responses_are_replayed(tmp_path):
+    recorder = RecordReplayBackend(str(tmp_path), "record", FakeBackend(latency=0, responses={"mcp": "recorded"}))
+    asyncio.run(recorder.generate("prompt", "mcp"))
+
+    player = RecordReplayBackend(str(tmp_path), "replay")
+    assert asyncio.run(player.generate("prompt", "mcp")).text == "recorded"
+    assert collect(player.stream("prompt", "mcp")) == ["recorded"]
+    with pytest.raises(ReplayMissError):
+        asyncio.run(player.generate("another prompt", "mcp"))
+
+def test_only_the_gemini_backends_need_an_api_key(tmp_path):
+    assert not create_backend("fake", "model", {}).requires_api_key
+    assert not create_backend("replay", "model", {}, recordings_dir=str(tmp_path)).requires_api_key
+    with pytest.raises(ValueError):
+        create_backend("openai", "model", {})
+
+def test_a_missing_api_key_only_matters_to_the_gemini_backends(monkeypatch):
+    monkeypatch.setattr(config, "GEMINI_API_KEY", "your-api-key-here")
+    for kind, missing in (("gemini", True), ("record", True), ("fake", False), ("replay", False)):
+        monkeypatch.setattr(config, "LLM_BACKEND", kind)
+        assert config.api_key_missing() is missing
+    monkeypatch.setattr(config, "GEMINI_API_KEY", "key")
+    assert not config.api_key_missing()
+
+def test_gemini_backend_sends_the_response_schema_when_the_sdk_supports_it():
+    genai = pytest.importorskip("google.generativeai")
+    backend = GeminiBackend("gemini-pro", {"temperature": 0.7}, api_key="test")
+    supported = set(inspect.signature(genai.types.GenerationConfig).parameters)
+    schema = response_schema(ATSResult)
+
+    config = backend._generation_config(True, schema) or {}
+    assert config.get("response_schema") == (schema if "response_schema" in supported else None)
+    assert backend._generation_config(False, schema) is None
@@ -0,0 +1,88 @@
+import pytest
+
+import llm_cache
+from llm_cache import ResponseCache
+
+class Clock:
+    """Stands in for time.time so entries age without waiting"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(llm_cache.time, "time", clock)
+    return clock
+
+def test_get_returns_what_was_set(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "cache.db"))
+    cache.set("key", "response")
+
+    assert cache.get("key") == "response"
+    assert cache.get("other") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "cache.db"), ttl_seconds=60)
+    cache.set("key", "response")
+
+    clock.now += 59
+    assert cache.get("key") == "response"
+    clock.now += 2
+    assert cache.get("key") is None
+    assert cache.stats()["expired"] == 1
+    assert cache.stats()["entries"] == 0
+
+def test_max_entries_evicts_least_recently_used(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "cache.db"), max_entries=2)
+    cache.set("a", "1")
+    clock.now += 1
+    cache.set("b", "2")
+    clock.now += 1
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") == "1"
+    clock.now += 1
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.stats()["evictions"] == 1
+
+def test_max_bytes_evicts_oldest_until_under_the_limit(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "cache.db"), max_bytes=25)
+    for key in ("a", "b", "c"):
+        cache.set(key, "x" * 10)
+        clock.now += 1
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "x" * 10
+    assert cache.stats()["bytes"] == 20
+
+def test_clear_removes_every_entry(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "cache.db"))
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+def test_delete_removes_one_entry(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "cache.db"))
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.delete("a")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "2"
+
+def test_prompt_whitespace_does_not_change_the_key():
+    config = {"temperature": 0.7}
+    assert ResponseCache.make_key("model", config, "Hello   world\n") == ResponseCache.make_key("model", config, "Hello world")
+    assert ResponseCache.make_key("model", config, "Hello") != ResponseCache.make_key("other", config, "Hello")
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from llm_backends import LLMBackend, LLMResponse
+from llm_cache import ResponseCache
+from llm_client import LLMClient, LLMTimeoutError
+
+class SlowBackend(LLMBackend):
+    """Answers every prompt after a delay and records how many calls overlap"""
+
+    model_name = "slow"
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.running = 0
+        self.most_running = 0
+
+    async def generate(self, prompt: str, tool: str, json_mode: bool = False, schema=None) -> LLMResponse:
+        self.calls += 1
+        self.running += 1
+        self.most_running = max(self.most_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            return LLMResponse(f"reply to {prompt}")
+        finally:
+            self.running -= 1
+
+    async def stream(self, prompt: str, tool: str, json_mode: bool = False, schema=None):
+        self.calls += 1
+        for word in f"reply to {prompt}".split(" "):
+            yield word + " "
+
+def make_client(backend: SlowBackend, **kwargs) -> LLMClient:
+    return LLMClient(backend, {"temperature": 0.7}, **kwargs)
+
+def test_client_serves_repeated_prompts_from_the_cache(tmp_path):
+    backend = SlowBackend()
+    client = make_client(backend, cache=ResponseCache(str(tmp_path / "cache.db")))
+
+    async def generate_twice():
+        first = await client.generate("prompt", tool="mcp")
+        second = await client.generate("prompt", tool="mcp")
+        return first, second
+
+    assert asyncio.run(generate_twice()) == ("reply to prompt", "reply to prompt")
+    assert backend.calls == 1
+
+def test_discard_drops_the_cached_response(tmp_path):
+    backend = SlowBackend()
+    client = make_client(backend, cache=ResponseCache(str(tmp_path / "cache.db")))
+
+    async def generate_discard_generate():
+        await client.generate("prompt", tool="job_finder", json_mode=True)
+        await client.discard("prompt", json_mode=True)
+        await client.generate("prompt", tool="job_finder", json_mode=True)
+
+    asyncio.run(generate_discard_generate())
+    assert backend.calls == 2
+
+def test_identical_in_flight_prompts_are_coalesced():
+    backend = SlowBackend(delay=0.05)
+    client = make_client(backend)
+
+    async def generate_concurrently():
+        return await asyncio.gather(*(client.generate("prompt", tool="mcp") for _ in range(4)))
+
+    assert asyncio.run(generate_concurrently()) == ["reply to prompt"] * 4
+    assert backend.calls == 1
+    assert client.stats()["coalesced"] == 3
+
+def test_concurrent_calls_stay_within_the_tool_limit():
+    backend = SlowBackend(delay=0.01)
+    client = make_client(backend, max_concurrency=8, tool_concurrency=2)
+
+    async def generate_many():
+        return await asyncio.gather(*(client.generate(f"prompt {i}", tool="job_finder") for i in range(6)))
+
+    assert len(asyncio.run(generate_many())) == 6
+    assert backend.most_running == 2
+    assert client.stats()["in_flight"] == 0
+
+def test_slow_calls_time_out():
+    client = make_client(SlowBackend(delay=1), tool_timeouts={"ats": 0.01})
+
+    with pytest.raises(LLMTimeoutError):
+        asyncio.run(client.generate("prompt", tool="ats"))
+    assert client.stats()["timeouts"] == 1
+
+def test_stream_yields_chunks_and_caches_the_whole_response(tmp_path):
+    backend = SlowBackend()
+    client = make_client(backend, cache=ResponseCache(str(tmp_path / "cache.db")))
+
+    async def collect():
+        return [chunk async for chunk in client.stream("prompt", tool="cover_letter")]
+
+    assert asyncio.run(collect()) == ["reply ", "to ", "prompt "]
+    # A cached response comes back as one chunk
+    assert asyncio.run(collect()) == ["reply to prompt "]
+    assert backend.calls == 1
+
+def test_abandoned_stream_is_not_cached(tmp_path):
+    backend = SlowBackend()
+    client = make_client(backend, cache=ResponseCache(str(tmp_path / "cache.db")))
+
+    async def first_chunk():
+        chunks = client.stream("prompt", tool="cover_letter")
+        chunk = await chunks.__anext__()
+        await chunks.aclose()
+        return chunk
+
+    assert asyncio.run(first_chunk()) == "reply "
+    assert client.cache.stats()["entries"] == 0
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from pdf_extractor import PDFExtractor
+from pdfs import make_pdf
+from utils import ResumeExtractionError, extract_text_from_pdf
+
+PAGES = [f"Page {i}" for i in range(1, 8)]
+
+def test_text_matches_the_single_process_extraction():
+    extractor = PDFExtractor(workers=1, pages_per_task=3)
+    try:
+        content = make_pdf(PAGES)
+        assert asyncio.run(extractor.extract(content)) == extract_text_from_pdf(content)
+        assert extractor.stats()["pages"] == len(PAGES)
+    finally:
+        extractor.shutdown()
+
+def test_pages_past_the_cap_are_skipped():
+    extractor = PDFExtractor(workers=0, max_pages=4, pages_per_task=3)
+    text = asyncio.run(extractor.extract(make_pdf(PAGES)))
+
+    assert "Page 4" in text
+    assert "Page 5" not in text
+    assert extractor.stats()["truncated"] == 1
+
+def test_a_broken_pdf_raises_an_extraction_error():
+    extractor = PDFExtractor(workers=0)
+    with pytest.raises(ResumeExtractionError):
+        asyncio.run(extractor.extract_resume_text(b"%PDF-1.4 not really a pdf", "scan.pdf"))
+    assert extractor.stats()["errors"] == 1
+
+    # Utils keeps returning a bracketed message for callers that only want text
+    assert extract_text_from_pdf(b"%PDF-1.4 not really a pdf").startswith("[Error extracting PDF content")
+
+def test_a_pdf_without_text_raises_an_extraction_error():
+    extractor = PDFExtractor(workers=0)
+    with pytest.raises(ResumeExtractionError, match="scanned"):
+        asyncio.run(extractor.extract(make_pdf([""])))
+    with pytest.raises(ResumeExtractionError, match="decode"):
+        asyncio.run(extractor.extract_resume_text(b"\xff\xfe", "resume.txt"))
+
+def test_extraction_stops_at_the_page_reaching_the_budget():
+    extractor = PDFExtractor(workers=0, pages_per_task=2)
+    text = asyncio.run(extractor.extract(make_pdf(PAGES), max_chars=15))
+
+    assert "Page 2" in text
+    assert "Page 3" not in text
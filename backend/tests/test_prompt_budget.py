@@ -0,0 +1,21 @@
+from prompt_budget import estimate_tokens, normalize_text, truncate_to_budget
+
+def test_normalize_collapses_spaces_and_blank_lines():
+    assert normalize_text("Jane   Doe\r\n\r\n\r\n\tPython\t developer  ") == "Jane Doe\n\nPython developer"
+
+def test_normalize_drops_a_line_repeating_the_one_before():
+    text = "Page header\nExperience\n\nPage footer\n\npage footer\nEducation"
+    assert normalize_text(text) == "Page header\nExperience\n\nPage footer\n\nEducation"
+
+def test_normalize_keeps_lines_repeated_elsewhere():
+    text = "Engineer at Acme\nKey results:\n- Shipped X\nEngineer at Beta\nKey results:\n- Shipped Y"
+    assert normalize_text(text) == text
+
+def test_truncate_to_budget_cuts_at_a_line():
+    text = "\n".join(f"line {i}" for i in range(100))
+    truncated = truncate_to_budget(text, 20)
+
+    kept, marker = truncated.rsplit("\n", 1)
+    assert estimate_tokens(truncated) <= 20
+    assert marker.startswith("[...truncated")
+    assert text.startswith(kept + "\n")
@@ -0,0 +1,56 @@
+from resume_parser import EDUCATION_HEADERS, EXPERIENCE_HEADERS, SKILLS_HEADERS, ResumeParser, ResumeSections
+
+from pdfs import make_pdf
+
+RESUME = """Jane Doe
+jane@example.org | (555) 123-4567
+Austin, TX 78701
+
+Professional Experience:
+Backend Engineer at Acme (2019-2024)
+Built APIs.
+
+EDUCATION
+Bachelor of Science, University of Texas
+2015 - 2019
+
+Technical Skills
+- Python
+- SQL
+- Docker
+"""
+
+def test_sections_are_found_whatever_the_header_case():
+    sections = ResumeSections(RESUME)
+
+    assert sections.section(EXPERIENCE_HEADERS) == "Backend Engineer at Acme (2019-2024)\nBuilt APIs."
+    assert sections.section(SKILLS_HEADERS) == "- Python\n- SQL\n- Docker"
+    assert sections.section(["certifications"]) == ""
+
+def test_an_all_caps_line_ends_a_section():
+    sections = ResumeSections("Experience\nEngineer at Acme (2020)\nPROJECTS\nA compiler")
+    assert sections.section(EXPERIENCE_HEADERS) == "Engineer at Acme (2020)"
+
+def test_a_header_must_be_alone_on_its_line():
+    sections = ResumeSections("Summary\nYears of experience in Python\nEducation\nUniversity of Texas")
+    assert sections.section(EXPERIENCE_HEADERS) == ""
+    assert sections.section(EDUCATION_HEADERS) == "University of Texas"
+
+def test_parse_resume():
+    parsed = ResumeParser().parse_resume(RESUME)
+
+    assert (parsed["first_name"], parsed["last_name"]) == ("Jane", "Doe")
+    assert parsed["email"] == "jane@example.org"
+    assert parsed["phone"] == "(555) 123-4567"
+    assert parsed["experience"][0]["company"] == "Acme"
+    assert parsed["education"][0]["date_range"] == "2015 - 2019"
+    # A bulleted skills list used to raise re.error
+    assert {"python", "sql", "docker"} <= {skill.lower() for skill in parsed["skills"]}
+
+def test_parse_many_reports_each_document():
+    documents = [("a.txt", RESUME.encode("utf-8")), ("b.pdf", make_pdf(["Bob Smith"])), ("broken.pdf", b"%PDF-1.4 broken")]
+    results = {result["filename"]: result for result in ResumeParser().parse_many(documents, workers=1)}
+
+    assert results["a.txt"]["parsed"]["email"] == "jane@example.org"
+    assert results["b.pdf"]["parsed"]["full_name"] == "Bob Smith"
+    assert "error" in results["broken.pdf"]
@@ -0,0 +1,78 @@
+import asyncio
+import hashlib
+import os
+import time
+
+import resume_store
+from resume_store import ResumeStore
+
+RESUME_TEXT = b"Jane Doe\njane@example.org\n\nEXPERIENCE\nBackend Engineer at Acme (2019-2024)\n"
+
+def test_the_same_content_is_stored_once(tmp_path):
+    store = ResumeStore(str(tmp_path))
+    first = asyncio.run(store.add(RESUME_TEXT, "resume.txt"))
+    second = asyncio.run(store.add(RESUME_TEXT, "copy.txt"))
+
+    assert first.resume_id == hashlib.sha256(RESUME_TEXT).hexdigest()
+    assert second == first
+    assert store.stats()["duplicate_uploads"] == 1
+    assert first.parsed["email"] == "jane@example.org"
+
+def test_stored_resumes_are_read_back_from_disk(tmp_path):
+    stored = asyncio.run(ResumeStore(str(tmp_path)).add(RESUME_TEXT, "resume.txt"))
+    loaded = asyncio.run(ResumeStore(str(tmp_path)).get(stored.resume_id))
+    assert loaded == stored
+
+def test_memory_keeps_the_most_recent_resumes(tmp_path):
+    store = ResumeStore(str(tmp_path), memory_entries=2)
+    for i in range(3):
+        asyncio.run(store.add(RESUME_TEXT + str(i).encode(), f"resume{i}.txt"))
+    assert store.stats()["in_memory"] == 2
+
+def test_unknown_or_malformed_ids_are_not_found(tmp_path):
+    store = ResumeStore(str(tmp_path))
+    assert asyncio.run(store.get("0" * 64)) is None
+    assert asyncio.run(store.get("../etc/passwd")) is None
+    assert store.stats()["misses"] == 2
+
+def age(store: ResumeStore, resume_id: str, seconds: float):
+    """Backdate a stored resume by rewinding the mtime of its metadata"""
+    path = os.path.join(store.directory, resume_id, "meta.json")
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+def test_expired_resumes_are_not_returned(tmp_path, monkeypatch):
+    store = ResumeStore(str(tmp_path), max_age=60)
+    stored = asyncio.run(store.add(RESUME_TEXT, "resume.txt"))
+    later = time.time() + 120
+    monkeypatch.setattr(resume_store.time, "time", lambda: later)
+
+    # Neither from memory nor from disk, where it is deleted
+    assert asyncio.run(store.get(stored.resume_id)) is None
+    assert not os.path.exists(os.path.join(str(tmp_path), stored.resume_id))
+
+def test_expired_resumes_are_removed_when_another_is_stored(tmp_path):
+    store = ResumeStore(str(tmp_path), max_age=60)
+    kept = asyncio.run(store.add(RESUME_TEXT + b"1", "kept.txt"))
+    expired = asyncio.run(store.add(RESUME_TEXT + b"2", "expired.txt"))
+    age(store, expired.resume_id, 120)
+    new = asyncio.run(store.add(RESUME_TEXT + b"3", "new.txt"))
+
+    assert sorted(os.listdir(str(tmp_path))) == sorted([kept.resume_id, new.resume_id])
+
+def test_the_oldest_resumes_are_removed_past_max_bytes(tmp_path):
+    entry_size = lambda store, resume_id: sum(
+        file.stat().st_size for file in os.scandir(os.path.join(store.directory, resume_id))
+    )
+    store = ResumeStore(str(tmp_path))
+    first = asyncio.run(store.add(RESUME_TEXT + b"0", "resume0.txt"))
+    store.max_bytes = entry_size(store, first.resume_id) * 2 + 10
+
+    ids = [first.resume_id]
+    for i in range(1, 4):
+        age(store, ids[-1], 10 * (4 - i))
+        ids.append(asyncio.run(store.add(RESUME_TEXT + str(i).encode(), f"resume{i}.txt")).resume_id)
+
+    assert sorted(os.listdir(str(tmp_path))) == sorted(ids[2:])
+    assert store.stats()["evicted"] == 2
+    assert asyncio.run(store.get(ids[0])) is None
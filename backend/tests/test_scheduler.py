@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import pytest
+
+from llm_backends import RateLimitError
+from scheduler import RateLimitExceededError, RequestScheduler
+
+def test_interactive_calls_go_first_but_batch_calls_are_not_starved():
+    # 100 requests per second with no burst, so every call after the first queues
+    scheduler = RequestScheduler(requests_per_minute=6000, burst=1, interactive_burst=2)
+    order = []
+
+    async def call(name, priority):
+        await scheduler.acquire(priority)
+        order.append(name)
+
+    async def queue_calls():
+        await scheduler.acquire("interactive")
+        await asyncio.gather(
+            *(call(f"b{i}", "batch") for i in range(1, 4)),
+            *(call(f"i{i}", "interactive") for i in range(1, 5))
+        )
+
+    asyncio.run(queue_calls())
+    assert order == ["i1", "i2", "b1", "i3", "i4", "b2", "b3"]
+    stats = scheduler.stats()["lanes"]
+    assert stats["interactive"]["admitted"] == 5
+    assert stats["batch"]["admitted"] == 3
+
+def test_calls_are_admitted_at_the_configured_rate():
+    scheduler = RequestScheduler(requests_per_minute=600, burst=2)
+
+    async def acquire_many():
+        started = time.monotonic()
+        await asyncio.gather(*(scheduler.acquire("batch") for _ in range(6)))
+        return time.monotonic() - started
+
+    # The burst covers two calls; the other four wait 0.1s each
+    assert asyncio.run(acquire_many()) >= 0.35
+
+def test_unknown_priority_is_rejected():
+    scheduler = RequestScheduler()
+    with pytest.raises(ValueError):
+        asyncio.run(scheduler.acquire("urgent"))
+
+def test_rate_limited_calls_are_retried():
+    scheduler = RequestScheduler(
+        requests_per_minute=0, max_retries=3, backoff_base=0.001,
+        is_rate_limit_error=lambda error: isinstance(error, RateLimitError)
+    )
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RateLimitError("quota exceeded")
+        return "ok"
+
+    assert asyncio.run(scheduler.run(flaky)) == "ok"
+    assert scheduler.stats()["retries"] == 2
+
+def test_gives_up_after_max_retries():
+    scheduler = RequestScheduler(
+        requests_per_minute=0, max_retries=1, backoff_base=0.001,
+        is_rate_limit_error=lambda error: isinstance(error, RateLimitError)
+    )
+
+    async def always_limited():
+        raise RateLimitError("quota exceeded")
+
+    with pytest.raises(RateLimitExceededError):
+        asyncio.run(scheduler.run(always_limited))
+    assert scheduler.stats()["gave_up"] == 1
+
+def test_other_errors_are_not_retried():
+    scheduler = RequestScheduler(requests_per_minute=0, backoff_base=0.001)
+    attempts = []
+
+    async def broken():
+        attempts.append(1)
+        raise KeyError("bug")
+
+    with pytest.raises(KeyError):
+        asyncio.run(scheduler.run(broken))
+    assert len(attempts) == 1
@@ -0,0 +1,59 @@
+import asyncio
+
+from singleflight import SingleFlight
+
+def test_concurrent_calls_with_the_same_key_run_once():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def call_concurrently():
+        return await asyncio.gather(*(single_flight.do("key", work) for _ in range(5)))
+
+    assert asyncio.run(call_concurrently()) == ["result"] * 5
+    assert len(calls) == 1
+    assert single_flight.stats() == {"executions": 1, "coalesced": 4, "in_flight": 0}
+
+def test_different_keys_run_separately():
+    single_flight = SingleFlight()
+
+    async def call_concurrently():
+        async def work(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        return await asyncio.gather(single_flight.do("a", lambda: work(1)), single_flight.do("b", lambda: work(2)))
+
+    assert asyncio.run(call_concurrently()) == [1, 2]
+    assert single_flight.stats()["executions"] == 2
+
+def test_every_waiter_gets_the_exception():
+    single_flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def call_concurrently():
+        return await asyncio.gather(*(single_flight.do("key", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(call_concurrently())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert single_flight.stats()["executions"] == 1
+
+def test_a_key_runs_again_once_its_call_finished():
+    single_flight = SingleFlight()
+
+    async def call_twice():
+        async def work():
+            return "result"
+
+        await single_flight.do("key", work)
+        await single_flight.do("key", work)
+
+    asyncio.run(call_twice())
+    assert single_flight.stats()["executions"] == 2
@@ -0,0 +1,44 @@
+import pytest
+
+from skills import SkillMatcher, default_skill_matcher
+
+@pytest.fixture
+def matcher():
+    return SkillMatcher({
+        "Node.js": ["node", "nodejs"],
+        "C": [],
+        "C++": ["cpp"],
+        "C#": ["csharp"],
+        "Machine Learning": ["ml"],
+        "Java": [],
+        "JavaScript": ["js"]
+    })
+
+def test_synonyms_map_to_the_canonical_name(matcher):
+    assert matcher.find("Built APIs in NodeJS and cpp") == ["Node.js", "C++"]
+
+def test_matches_are_whole_words(matcher):
+    assert matcher.find("javascripting in Javanese") == []
+    assert matcher.find("C, C++ and C#") == ["C", "C++", "C#"]
+
+def test_the_longest_overlapping_match_wins(matcher):
+    assert matcher.find("node.js and node") == ["Node.js"]
+    assert matcher.find("JavaScript, not Java") == ["JavaScript", "Java"]
+
+def test_matching_ignores_case_and_whitespace(matcher):
+    assert matcher.find("MACHINE\n  learning") == ["Machine Learning"]
+
+def test_each_skill_is_listed_once_in_order_of_first_mention(matcher):
+    assert matcher.find("ml, Java, machine learning, js") == ["Machine Learning", "Java", "JavaScript"]
+
+def test_matches_report_offsets(matcher):
+    assert matcher.matches("I know C# well") == [(7, 9, "C#")]
+
+def test_canonical_only_accepts_an_exact_name(matcher):
+    assert matcher.canonical(" NodeJS ") == "Node.js"
+    assert matcher.canonical("node developer") is None
+
+def test_default_dictionary_loads():
+    matcher = default_skill_matcher()
+    assert matcher.skill_count > 0
+    assert "Python" in matcher.find("Python developer")
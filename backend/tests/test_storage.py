@@ -0,0 +1,266 @@
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+from storage import (
+    INSERT_APPLICATION, SCHEMA_VERSION, ApplicationQuery, ApplicationStore, build_application_query,
+    canonicalize_job_url, compact_json, encode_cursor
+)
+
+RESUME = {"full_name": "Jane Doe", "skills": ["Python"]}
+
+def add_applications(store: ApplicationStore, rows):
+    """Insert (job_title, company, application_date, status, application_data) rows"""
+    def insert(conn: sqlite3.Connection):
+        for i, (title, company, date, status, data) in enumerate(rows):
+            conn.execute(INSERT_APPLICATION, (title, company, f"https://jobs.example.org/{i}", date, status, None, compact_json(data)))
+
+    asyncio.run(store.write(insert))
+
+def list_all(store: ApplicationStore, **filters):
+    """Follow next_cursor through every page, returning the pages"""
+    pages, cursor = [], None
+    while True:
+        query = build_application_query(cursor=cursor, **filters)
+        page = asyncio.run(store.query_applications(query))
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+def test_add_and_list_applications(store):
+    job = {"job_title": "Engineer", "company_name": "Acme", "application_link": "https://acme.example.org/1"}
+    application_id = asyncio.run(store.add_application(job, RESUME))
+
+    applications = asyncio.run(store.list_applications())
+    assert [application["id"] for application in applications] == [application_id]
+    assert applications[0]["resume_data"] == RESUME
+    assert applications[0]["application_data"] == job
+    assert asyncio.run(store.application_exists("https://acme.example.org/1"))
+
+def test_duplicate_job_url_is_rejected(store):
+    job = {"job_title": "Engineer", "company_name": "Acme", "application_link": "https://acme.example.org/1"}
+    asyncio.run(store.add_application(job, RESUME))
+    with pytest.raises(sqlite3.IntegrityError):
+        asyncio.run(store.add_application(job, RESUME))
+
+def test_applications_with_the_same_resume_share_one_copy(store):
+    for i in range(2):
+        job = {"job_title": f"Job {i}", "company_name": "Acme", "application_link": f"https://jobs.example.org/{i}"}
+        asyncio.run(store.add_application(job, dict(reversed(list(RESUME.items()))) if i else RESUME))
+
+    applications = asyncio.run(store.list_applications())
+    assert [application["resume_data"] for application in applications] == [RESUME, RESUME]
+    assert asyncio.run(store.read(lambda conn: conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0])) == 1
+    # The key of a parsed resume is not a resume_id from the resume store, so it isn't returned
+    assert "parsed_resume_key" not in applications[0] and "resume_id" not in applications[0]
+
+def test_pages_cover_every_application_once_newest_first(store):
+    # Several applications share a date, so the id has to break ties
+    dates = ["2024-01-0%d" % (i // 3 + 1) for i in range(10)]
+    add_applications(store, [(f"Job {i}", "Acme", date, "initiated", {}) for i, date in enumerate(dates)])
+
+    pages = list_all(store, limit=3)
+    ids = [application["id"] for page in pages for application in page["applications"]]
+    assert [len(page["applications"]) for page in pages] == [3, 3, 3, 1]
+    assert sorted(ids) == list(range(1, 11))
+    listed = [(application["application_date"], application["id"]) for page in pages for application in page["applications"]]
+    assert listed == sorted(listed, reverse=True)
+
+def test_filters_and_field_projection(store):
+    add_applications(store, [
+        ("Job 0", "Acme", "2024-01-01T09:00:00", "initiated", {}),
+        ("Job 1", "acme", "2024-01-02T09:00:00", "failed", {}),
+        ("Job 2", "Other", "2024-01-02T10:00:00", "initiated", {}),
+        ("Job 3", "ACME", "2024-01-03T09:00:00", "initiated", {})
+    ])
+
+    titles = lambda **filters: [application["job_title"] for page in list_all(store, **filters) for application in page["applications"]]
+    assert titles(company="ACME") == ["Job 3", "Job 1", "Job 0"]
+    assert titles(status="initiated", company="acme") == ["Job 3", "Job 0"]
+    assert titles(date_from="2024-01-02", date_to="2024-01-02") == ["Job 2", "Job 1"]
+    # Datetime bounds are inclusive too
+    assert titles(date_from="2024-01-02T09:00:00", date_to="2024-01-02T10:00:00") == ["Job 2", "Job 1"]
+
+    page = asyncio.run(store.query_applications(build_application_query(fields=["job_title", "resume_data"])))
+    assert set(page["applications"][0]) == {"job_title", "resume_data"}
+
+@pytest.mark.parametrize("parameters", [
+    {"cursor": "not-a-cursor"},
+    {"cursor": encode_cursor("2024-01-01", 1)[:-4] + "!!!!"},
+    {"limit": 0},
+    {"limit": 501},
+    {"fields": ["job_title", "password"]},
+    {"date_from": "yesterday"}
+])
+def test_invalid_listing_parameters_raise_value_error(parameters):
+    with pytest.raises(ValueError):
+        build_application_query(**parameters)
+
+def test_full_text_search_ranks_and_filters(store):
+    add_applications(store, [
+        ("Backend Engineer", "Acme", "2024-01-01", "initiated", {"job_description": "Build Kubernetes services", "skills_required": "Go"}),
+        ("Kubernetes Engineer", "Beta", "2024-01-02", "failed", {"job_description": "Operate clusters", "skills_required": "Kubernetes"}),
+        ("Designer", "Gamma", "2024-01-03", "initiated", {"job_description": "Figma work", "skills_required": "Figma"})
+    ])
+
+    result = asyncio.run(store.search_applications("kubernetes"))
+    assert [application["job_title"] for application in result["applications"]] == ["Kubernetes Engineer", "Backend Engineer"]
+    assert result["next_offset"] is None
+    assert "[" in result["applications"][0]["snippet"]
+
+    filtered = asyncio.run(store.search_applications("kubernetes", status="initiated"))
+    assert [application["job_title"] for application in filtered["applications"]] == ["Backend Engineer"]
+
+    first = asyncio.run(store.search_applications("engineer", limit=1))
+    assert len(first["applications"]) == 1
+    assert first["next_offset"] == 1
+
+def test_search_index_follows_status_updates(store):
+    job = {"job_title": "Engineer", "company_name": "Acme", "application_link": "https://acme.example.org/1"}
+    application_id = asyncio.run(store.add_application(job, RESUME))
+    assert asyncio.run(store.update_status(application_id, "completed"))
+
+    result = asyncio.run(store.search_applications("acme", status="completed"))
+    assert [application["id"] for application in result["applications"]] == [application_id]
+
+def test_search_query_is_quoted(store):
+    add_applications(store, [("C++ Developer", "Acme", "2024-01-01", "initiated", {})])
+    assert len(asyncio.run(store.search_applications('c++ "OR'))["applications"]) == 0
+    assert len(asyncio.run(store.search_applications("c++"))["applications"]) == 1
+    with pytest.raises(ValueError):
+        asyncio.run(store.search_applications("   "))
+
+@pytest.mark.parametrize("url, canonical", [
+    ("http://www.Example.com/jobs/1/?utm_source=x&b=2&a=1#apply", "https://example.com/jobs/1?a=1&b=2"),
+    ("https://www.linkedin.com/jobs/view/senior-engineer-at-acme-3512345678/?trk=public", "https://linkedin.com/jobs/view/3512345678"),
+    ("https://linkedin.com/jobs/search/?currentJobId=42&keywords=python", "https://linkedin.com/jobs/view/42"),
+    ("https://uk.indeed.com/viewjob?jk=abc123&from=serp", "https://indeed.com/viewjob?jk=abc123"),
+    ("https://www.indeed.com/jobs?q=python&vjk=def456", "https://indeed.com/viewjob?jk=def456"),
+    ("ftp://example.com/job", None),
+    ("#", None),
+    ("", None)
+])
+def test_canonicalize_job_url(url, canonical):
+    assert canonicalize_job_url(url) == canonical
+
+def test_search_results_are_reused_and_deduplicated(store):
+    jobs = [
+        {"job_title": "Engineer ", "company_name": "Acme", "application_link": "https://www.linkedin.com/jobs/view/1/?trk=a"},
+        {"job_title": "Engineer", "company_name": "Acme", "application_link": "https://linkedin.com/jobs/view/1"},
+        {"job_title": "Analyst", "company_name": "Beta", "application_link": "#"}
+    ]
+    stored = asyncio.run(store.save_search_results("search", jobs, max_age=3600))
+
+    assert [job["job_title"] for job in stored] == ["Engineer", "Analyst"]
+    assert asyncio.run(store.get_search_results("search", max_age=3600)) == stored
+    assert asyncio.run(store.get_search_results("other", max_age=3600)) is None
+    # Too old to reuse
+    assert asyncio.run(store.get_search_results("search", max_age=-1)) is None
+
+def test_expired_searches_and_their_jobs_are_removed(store):
+    first = [{"job_title": "A", "company_name": "Acme", "application_link": "https://jobs.example.org/a"}]
+    shared = {"job_title": "B", "company_name": "Acme", "application_link": "https://jobs.example.org/b"}
+    asyncio.run(store.save_search_results("first", first + [shared], max_age=3600))
+    asyncio.run(store.save_search_results("second", [shared], max_age=3600))
+    # Any earlier search is expired by a max_age of 0
+    asyncio.run(store.save_search_results("third", [shared], max_age=0))
+
+    def urls(conn):
+        return [row[0] for row in conn.execute("SELECT url FROM jobs ORDER BY url")]
+
+    assert asyncio.run(store.read(urls)) == ["https://jobs.example.org/b"]
+    assert asyncio.run(store.get_search_results("first", max_age=3600)) is None
+
+def test_the_database_is_in_wal_mode(store):
+    assert asyncio.run(store.read(lambda conn: conn.execute("PRAGMA journal_mode").fetchone()[0])) == "wal"
+
+def test_old_databases_are_migrated(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute('''
+    CREATE TABLE applications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, job_title TEXT NOT NULL, company TEXT NOT NULL,
+        job_url TEXT NOT NULL, application_date TEXT NOT NULL, status TEXT NOT NULL,
+        resume_data TEXT, application_data TEXT, UNIQUE(job_url)
+    )
+    ''')
+    rows = [
+        ("Engineer", "Acme", "https://a.example.org", "2024-01-01", "initiated", json.dumps(RESUME), json.dumps({"job_description": "Python"})),
+        ("Analyst", "Beta", "https://b.example.org", "2024-01-02", "initiated", json.dumps(RESUME), "not json"),
+        ("Designer", "Gamma", "https://c.example.org", "2024-01-03", "initiated", "{broken", None)
+    ]
+    conn.executemany('''
+    INSERT INTO applications (job_title, company, job_url, application_date, status, resume_data, application_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
+    conn.commit()
+    conn.close()
+
+    store = ApplicationStore(path)
+    try:
+        applications = asyncio.run(store.list_applications())
+        assert [application["job_title"] for application in applications] == ["Designer", "Analyst", "Engineer"]
+        # Both applications made with the same resume share one stored copy
+        assert asyncio.run(store.read(lambda conn: conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0])) == 1
+        assert applications[2]["resume_data"] == RESUME
+        assert applications[2]["application_data"] == {"job_description": "Python"}
+        # Rows with malformed JSON are kept, and read back without their invalid data
+        assert applications[1]["application_data"] is None
+        assert applications[0]["resume_data"] is None
+        assert len(asyncio.run(store.search_applications("python"))["applications"]) == 1
+        assert asyncio.run(store.read(lambda conn: conn.execute("PRAGMA user_version").fetchone()[0])) == SCHEMA_VERSION
+    finally:
+        store.close()
+
+def test_resume_id_column_is_renamed(tmp_path):
+    path = str(tmp_path / "v4.db")
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+    CREATE TABLE resumes (id TEXT PRIMARY KEY, resume_data TEXT NOT NULL, created_at TEXT NOT NULL);
+    CREATE TABLE applications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, job_title TEXT NOT NULL, company TEXT NOT NULL,
+        job_url TEXT NOT NULL, application_date TEXT NOT NULL, status TEXT NOT NULL,
+        resume_id TEXT REFERENCES resumes(id), application_data TEXT, UNIQUE(job_url)
+    );
+    CREATE INDEX idx_applications_resume_id ON applications(resume_id);
+    INSERT INTO resumes VALUES ('key', '{"full_name":"Jane Doe"}', '2024-01-01');
+    INSERT INTO applications (job_title, company, job_url, application_date, status, resume_id)
+    VALUES ('Engineer', 'Acme', 'https://a.example.org', '2024-01-01', 'initiated', 'key');
+    PRAGMA user_version = 4;
+    ''')
+    conn.close()
+
+    store = ApplicationStore(path)
+    try:
+        page = asyncio.run(store.query_applications(ApplicationQuery(fields=("id", "resume_data"))))
+        assert page["applications"] == [{"id": 1, "resume_data": {"full_name": "Jane Doe"}}]
+        columns = asyncio.run(store.read(lambda conn: [row[1] for row in conn.execute("PRAGMA table_info(applications)")]))
+        assert "parsed_resume_key" in columns and "resume_id" not in columns
+    finally:
+        store.close()
+
+def test_concurrent_writes_are_all_committed(store):
+    async def add_many():
+        return await asyncio.gather(*(
+            store.add_application({"job_title": f"Job {i}", "company_name": "Acme", "application_link": f"https://jobs.example.org/{i}"}, RESUME)
+            for i in range(50)
+        ))
+
+    assert sorted(asyncio.run(add_many())) == list(range(1, 51))
+    assert store.stats()["writes"] == 50
+    page = asyncio.run(store.query_applications(ApplicationQuery(limit=100)))
+    assert len(page["applications"]) == 50
+
+def test_the_shared_store_is_opened_on_first_use(tmp_path, monkeypatch):
+    import job_application_automator as automator
+
+    monkeypatch.setattr(automator, "APPLICATIONS_DB_PATH", str(tmp_path / "shared.db"))
+    monkeypatch.setattr(automator, "_application_store", None)
+
+    store = automator.get_application_store()
+    assert automator.get_application_store() is store
+    automator.close_application_store()
+    assert automator._application_store is None
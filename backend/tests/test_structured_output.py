@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from schemas import ATSResult, JobListing, response_schema, schema_instructions
+from structured_output import StructuredOutputError, StructuredOutputParser
+
+def job(i: int) -> dict:
+    return {"job_title": f"Engineer {i}", "company_name": f"Company {i}", "application_link": f"https://jobs.example.org/{i}"}
+
+def test_valid_json_is_parsed_strictly():
+    parser = StructuredOutputParser()
+    result = parser.parse(json.dumps({"score": "85%", "matching_keywords": ["python"]}), ATSResult, "ats")
+
+    assert result["score"] == 85
+    assert result["matching_keywords"] == ["python"]
+    assert result["recommendations"] == "No specific recommendations"
+    assert parser.stats()["ats"]["parsed"] == 1
+
+def test_fenced_response_with_trailing_comma_is_repaired():
+    parser = StructuredOutputParser()
+    text = 'Here is the analysis:\n```json\n{"score": 70, "missing_keywords": ["kubernetes",],}\n```'
+    result = parser.parse(text, ATSResult, "ats")
+
+    assert result["score"] == 70
+    assert result["missing_keywords"] == ["kubernetes"]
+    assert parser.stats()["ats"]["repaired"] == 1
+
+def test_truncated_array_keeps_the_complete_elements():
+    parser = StructuredOutputParser()
+    text = json.dumps([job(1), job(2), job(3)])[:-40]
+    jobs = parser.parse(text, JobListing, "job_finder", many=True)
+
+    assert [item["job_title"] for item in jobs] == ["Engineer 1", "Engineer 2"]
+    assert jobs[0]["location"] == "Not specified"
+
+def test_wrapped_array_is_unwrapped_when_repairing():
+    parser = StructuredOutputParser()
+    jobs = parser.parse(json.dumps({"jobs": [job(1), job(2)]}), JobListing, "job_finder", many=True)
+    assert len(jobs) == 2
+
+def test_invalid_array_items_are_dropped_when_repairing():
+    parser = StructuredOutputParser()
+    jobs = parser.parse(json.dumps([job(1), {"location": "Remote"}]), JobListing, "job_finder", many=True)
+
+    assert [item["job_title"] for item in jobs] == ["Engineer 1"]
+    assert parser.stats()["job_finder"]["repaired"] == 1
+
+def test_unparseable_response_raises():
+    parser = StructuredOutputParser()
+    with pytest.raises(StructuredOutputError):
+        parser.parse("Sorry, I can't help with that.", ATSResult, "ats")
+    assert parser.stats()["ats"]["failed"] == 1
+    assert parser.stats()["ats"]["success_rate"] == 0.0
+
+def test_validate_checks_one_streamed_item():
+    parser = StructuredOutputParser()
+    assert parser.validate(job(1), JobListing, "job_finder")["company_name"] == "Company 1"
+    with pytest.raises(StructuredOutputError):
+        parser.validate({"location": "Remote"}, JobListing, "job_finder")
+
+def test_response_schema_lists_every_field_and_wraps_many_in_an_array():
+    schema = response_schema(JobListing, many=True)
+
+    assert schema["type"] == "array"
+    assert schema["items"]["required"] == list(JobListing.model_fields)
+    assert json.dumps(schema, separators=(",", ":")) in schema_instructions(JobListing, many=True)
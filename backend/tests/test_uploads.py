@@ -0,0 +1,100 @@
+import asyncio
+import hashlib
+
+import httpx
+import pytest
+from fastapi import FastAPI, File, UploadFile
+
+from uploads import FORM_OVERHEAD_BYTES, UploadSizeLimitMiddleware, UploadTooLargeError, hash_upload
+
+LIMIT = 1024
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, max_upload_bytes=LIMIT, path_limits={"/bulk": 4 * LIMIT})
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    @app.post("/bulk")
+    async def bulk(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    return app
+
+def post(path: str, **kwargs) -> httpx.Response:
+    async def send():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=make_app()), base_url="http://test") as client:
+            return await client.post(path, **kwargs)
+
+    return asyncio.run(send())
+
+def multipart_stream(size: int):
+    """A multipart upload of a size byte file, sent in chunks"""
+    async def body():
+        yield b'--boundary\r\nContent-Disposition: form-data; name="file"; filename="resume.txt"\r\n\r\n'
+        for _ in range(size // 1024):
+            yield b"x" * 1024
+        yield b"\r\n--boundary--\r\n"
+
+    return body()
+
+def test_small_upload_is_accepted():
+    response = post("/upload", files={"file": ("resume.txt", b"x" * 100)})
+    assert response.status_code == 200
+    assert response.json() == {"size": 100}
+
+def test_declared_content_length_over_the_limit_is_rejected():
+    response = post("/upload", files={"file": ("resume.txt", b"x" * (LIMIT + FORM_OVERHEAD_BYTES + 1))})
+    assert response.status_code == 413
+    assert "too large" in response.json()["detail"]
+
+def test_chunked_body_over_the_limit_is_rejected():
+    # A streamed body is sent without a Content-Length, so it is counted as it arrives
+    response = post(
+        "/upload",
+        content=multipart_stream(LIMIT + FORM_OVERHEAD_BYTES + 4096),
+        headers={"content-type": "multipart/form-data; boundary=boundary"}
+    )
+    assert "content-length" not in response.request.headers
+    assert response.status_code == 413
+
+def test_chunked_body_under_the_limit_is_accepted():
+    response = post(
+        "/upload",
+        content=multipart_stream(LIMIT),
+        headers={"content-type": "multipart/form-data; boundary=boundary"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"size": LIMIT}
+
+def test_path_limits_override_the_default():
+    body = b"x" * (2 * LIMIT + FORM_OVERHEAD_BYTES)
+    assert post("/bulk", files={"file": ("archive.zip", body)}).status_code == 200
+    assert post("/upload", files={"file": ("resume.txt", body)}).status_code == 413
+
+def test_hash_upload_streams_and_rewinds(tmp_path):
+    path = tmp_path / "resume.txt"
+    path.write_bytes(b"resume text")
+
+    async def hash_then_read():
+        with open(path, "rb") as f:
+            upload = UploadFile(f, filename="resume.txt")
+            digest = await hash_upload(upload, LIMIT)
+            return digest, await upload.read()
+
+    digest, content = asyncio.run(hash_then_read())
+    assert digest == hashlib.sha256(b"resume text").hexdigest()
+    assert content == b"resume text"
+
+def test_hash_upload_rejects_large_files(tmp_path):
+    path = tmp_path / "resume.txt"
+    path.write_bytes(b"x" * (LIMIT + 1))
+
+    async def hash_large():
+        with open(path, "rb") as f:
+            await hash_upload(UploadFile(f, filename="resume.txt"), LIMIT)
+
+    with pytest.raises(UploadTooLargeError):
+        asyncio.run(hash_large())
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import logging
+from typing import Dict, Optional
+
+from fastapi import HTTPException, UploadFile
+
+logger = logging.getLogger(__name__)
+
+# Uploaded files are read back from their spooled temp file in chunks of this size
+UPLOAD_CHUNK_BYTES = 64 * 1024
+
+# Room for the other form fields (job description, ...) on top of the file itself
+FORM_OVERHEAD_BYTES = 1024 * 1024
+
+class UploadTooLargeError(Exception):
+    """Raised when an uploaded file is over the size limit"""
+
+def _too_large(max_bytes: int) -> str:
+    return f"File is too large. The maximum upload size is {max_bytes / (1024 * 1024):g} MB."
+
+async def hash_upload(upload: UploadFile, max_bytes: int) -> str:
+    """
+    Return the SHA-256 of an uploaded file without loading it into memory.
+
+    Starlette spools uploads to a temporary file, so this streams that file in
+    chunks and leaves it rewound for a later read.
+
+    Raises:
+        UploadTooLargeError: If the file is larger than max_bytes
+    """
+    size = getattr(upload, "size", None)
+    if size is not None and size > max_bytes:
+        raise UploadTooLargeError(_too_large(max_bytes))
+
+    digest = hashlib.sha256()
+    size = 0
+    await upload.seek(0)
+    while True:
+        chunk = await upload.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            raise UploadTooLargeError(_too_large(max_bytes))
+        digest.update(chunk)
+    await upload.seek(0)
+    return digest.hexdigest()
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject request bodies over the upload limit before they are parsed.
+
+    Requests that declare a Content-Length over the limit get a 413 without the
+    body being read. Chunked requests are counted as they arrive and stopped
+    with a 413 as soon as they pass the limit. path_limits overrides the limit
+    for specific paths, such as archive uploads.
+    """
+
+    def __init__(self, app, max_upload_bytes: int, path_limits: Optional[Dict[str, int]] = None):
+        self.app = app
+        self.max_upload_bytes = max_upload_bytes
+        self.path_limits = path_limits or {}
+
+    async def __call__(self, scope, receive, send):
+        max_upload_bytes = self.path_limits.get(scope.get("path"), self.max_upload_bytes)
+        if scope["type"] != "http" or max_upload_bytes <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        max_body_bytes = max_upload_bytes + FORM_OVERHEAD_BYTES
+        content_length = self._content_length(scope)
+        if content_length is not None and content_length > max_body_bytes:
+            logger.warning(f"Rejected a {content_length} byte request to {scope.get('path')}")
+            await self._reject(send, max_upload_bytes)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_body_bytes:
+                    # Raised inside body parsing, so FastAPI turns it into the response
+                    raise HTTPException(status_code=413, detail=_too_large(max_upload_bytes))
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _content_length(self, scope) -> Optional[int]:
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        return None
+
+    async def _reject(self, send, max_upload_bytes: int):
+        body = json.dumps({"detail": _too_large(max_upload_bytes)}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,46 +1,151 @@
 import os
 import base64
 import io
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 import logging
 
+from prompt_budget import CHARS_PER_TOKEN
+
 logger = logging.getLogger(__name__)
 
-def extract_text_from_pdf(pdf_content: bytes) -> Optional[str]:
+# Appended after the text of every PDF page
+PAGE_SEPARATOR = "\n\n"
+
+class ResumeExtractionError(Exception):
+    """Raised when no text could be extracted from a resume file"""
+
+def iter_pdf_pages(pdf_content: bytes, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
     """
-    Extract text from PDF content bytes.
+    Yield the text of PDF pages one at a time.
+    
+    Pages are only parsed as they are consumed, so a caller that stops early
+    never pays for the rest of the document.
+    """
+    reader = _open_pdf(pdf_content)
+    yield from _page_texts(reader, start, end)
+
+def extract_pdf_pages(
+    pdf_content: bytes,
+    start: int = 0,
+    end: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> Tuple[int, List[str]]:
+    """
+    Extract the text of a range of PDF pages.
+    
+    This runs in PDF worker processes, so it only takes and returns picklable values.
     
     Args:
         pdf_content: The PDF file content as bytes
+        start: Index of the first page to extract
+        end: Index after the last page to extract, or None for the last page
+        max_chars: Stop after the page that brings the joined text to this length
         
     Returns:
-        The extracted text or None if extraction failed
+        The document's page count and the text of each extracted page
     """
-    try:
-        # Import here to avoid dependency issues if PyPDF2 is not installed
-        import PyPDF2
-        
-        # Create a file-like object from the bytes
-        pdf_file = io.BytesIO(pdf_content)
+    reader = _open_pdf(pdf_content)
+    return len(reader.pages), take_pdf_pages(_page_texts(reader, start, end), max_chars)
+
+def take_pdf_pages(pages: Iterable[str], max_chars: Optional[int] = None) -> List[str]:
+    """Collect page texts until their joined text reaches max_chars, or all of them if it is None"""
+    collected = []
+    length = 0
+    for page in pages:
+        collected.append(page)
+        length += len(page) + len(PAGE_SEPARATOR)
+        if max_chars and length >= max_chars:
+            break
+    return collected
+
+def join_pdf_pages(pages: List[str]) -> str:
+    """Join extracted page texts into the document text, raising ResumeExtractionError if there is none"""
+    text = "".join([page + PAGE_SEPARATOR for page in pages])
+    if not text.strip():
+        # No text layer, e.g. a scanned PDF
+        raise ResumeExtractionError("PDF content could not be extracted - possibly a scanned document")
+    return text
+
+def char_budget(max_chars: Optional[int] = None, max_tokens: Optional[int] = None) -> Optional[int]:
+    """Combine a character and a token budget into one character budget"""
+    budgets = [budget for budget in (max_chars, max_tokens * CHARS_PER_TOKEN if max_tokens else None) if budget]
+    return min(budgets) if budgets else None
+
+def _open_pdf(pdf_content: bytes):
+    # Import here to avoid dependency issues if PyPDF2 is not installed
+    import PyPDF2
+    
+    return PyPDF2.PdfReader(io.BytesIO(pdf_content))
+
+def _page_texts(reader, start: int, end: Optional[int]) -> Iterator[str]:
+    end = len(reader.pages) if end is None else min(end, len(reader.pages))
+    for i in range(start, end):
+        yield reader.pages[i].extract_text()
+
+def read_pdf_text(pdf_content: bytes, max_chars: Optional[int] = None) -> str:
+    """
+    Extract text from PDF content bytes.
+    
+    Args:
+        pdf_content: The PDF file content as bytes
+        max_chars: Stop reading pages once the text is at least this long
         
-        # Create a PDF reader object
-        reader = PyPDF2.PdfReader(pdf_file)
+    Returns:
+        The extracted text
         
-        # Extract text from all pages
-        text = ""
-        for page_num in range(len(reader.pages)):
-            page = reader.pages[page_num]
-            text += page.extract_text() + "\n\n"
-            
-        if not text.strip():
-            # If no text was extracted (e.g., scanned PDF), return a placeholder
-            return "[PDF content could not be extracted - possibly a scanned document]"
-            
-        return text
+    Raises:
+        ResumeExtractionError: If the PDF can't be read or has no text
+    """
+    try:
+        pages = take_pdf_pages(iter_pdf_pages(pdf_content), max_chars)
     except Exception as e:
         logger.error(f"Error extracting text from PDF: {str(e)}")
-        return f"[Error extracting PDF content: {str(e)}]"
+        raise ResumeExtractionError(f"Error extracting PDF content: {str(e)}") from e
+    return join_pdf_pages(pages)
+
+def extract_text_from_pdf(pdf_content: bytes, max_chars: Optional[int] = None, max_tokens: Optional[int] = None) -> Optional[str]:
+    """
+    Extract text from PDF content bytes.
+    
+    Args:
+        pdf_content: The PDF file content as bytes
+        max_chars: Stop reading pages once the text is at least this long
+        max_tokens: Same as max_chars, as an estimated token count
         
+    Returns:
+        The extracted text, or a bracketed message saying why it couldn't be extracted
+    """
+    try:
+        return read_pdf_text(pdf_content, char_budget(max_chars, max_tokens))
+    except ResumeExtractionError as e:
+        return f"[{str(e)}]"
+
+def extract_resume_text(content: bytes, filename: str, max_chars: Optional[int] = None) -> str:
+    """
+    Return the text of an uploaded resume, extracting it from PDFs.
+    
+    Args:
+        content: The uploaded file content
+        filename: The uploaded file name, used to detect PDFs
+        max_chars: Stop reading PDF pages once the text is at least this long
+        
+    Returns:
+        The resume text
+        
+    Raises:
+        ResumeExtractionError: If no text could be read from the file
+    """
+    if filename.lower().endswith('.pdf'):
+        return read_pdf_text(content, max_chars)
+    return decode_resume_text(content, filename)
+
+def decode_resume_text(content: bytes, filename: str) -> str:
+    """Return the text of a non-PDF resume, raising ResumeExtractionError if it isn't UTF-8"""
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise ResumeExtractionError(f"Could not decode file {filename}") from e
+
 def encode_file_to_base64(file_path: str) -> Optional[str]:
     """
     Encode a file to base64 string.
@@ -117,7 +117,23 @@ function applyWithAI(button) {
         });
 }
 
+// Applications shown so far and the cursor for the next page, if there is one
+let loadedApplications = [];
+let nextApplicationsCursor = null;
+
+function fetchApplicationsPage(cursor) {
+    const formData = new FormData();
+    formData.append('tool_name', 'application_status');
+    if (cursor) {
+        formData.append('cursor', cursor);
+    }
+    return callApi(`${API_BASE_URL}/tools/application_status`, 'POST', formData);
+}
+
 async function loadApplications() {
+    loadedApplications = [];
+    nextApplicationsCursor = null;
+    
     // Show loading state
     applicationsResult.innerHTML = `
         <div class="loading-container">
@@ -127,11 +143,8 @@ async function loadApplications() {
     `;
     
     try {
-        // Call the API to get applications
-        const formData = new FormData();
-        formData.append('tool_name', 'application_status');
-        
-        const data = await callApi(`${API_BASE_URL}/tools/application_status`, 'POST', formData);
+        // Call the API to get the first page of applications
+        const data = await fetchApplicationsPage(null);
         console.log('Applications data:', data);
         
         displayApplications(data);
@@ -147,6 +160,27 @@ async function loadApplications() {
     }
 }
 
+async function loadMoreApplications(button) {
+    button.disabled = true;
+    button.innerHTML = '<i class="fas fa-circle-notch fa-spin"></i> Loading...';
+    
+    try {
+        const data = await fetchApplicationsPage(nextApplicationsCursor);
+        console.log('Next applications page:', data);
+        
+        if (data.error) {
+            throw new Error(data.error);
+        }
+        displayApplications(data);
+        
+    } catch (error) {
+        console.error('Error loading more applications:', error);
+        alert(`Error loading more applications: ${error.message || 'Unknown error'}`);
+        button.disabled = false;
+        button.innerHTML = '<i class="fas fa-chevron-down"></i> Load more';
+    }
+}
+
 function displayApplications(data) {
     if (data.error) {
         applicationsResult.innerHTML = `
@@ -157,8 +191,10 @@ function displayApplications(data) {
         return;
     }
     
-    // Check if we have applications
-    const applications = data.applications || [];
+    // Each page is added to the ones already shown
+    loadedApplications = loadedApplications.concat(data.applications || []);
+    nextApplicationsCursor = data.next_cursor || null;
+    const applications = loadedApplications;
     
     if (applications.length === 0) {
         applicationsResult.innerHTML = `
@@ -173,7 +209,7 @@ function displayApplications(data) {
     // Generate HTML for applications
     let html = `
         <div class="applications-summary">
-            <p>Found ${applications.length} application${applications.length !== 1 ? 's' : ''}.</p>
+            <p>Showing ${applications.length} application${applications.length !== 1 ? 's' : ''}${nextApplicationsCursor ? ', more are available' : ''}.</p>
         </div>
         <div class="applications-list">
     `;
@@ -222,6 +258,16 @@ function displayApplications(data) {
     });
     
     html += `</div>`;
+    
+    if (nextApplicationsCursor) {
+        html += `
+            <div class="load-more-container">
+                <button class="action-btn" onclick="loadMoreApplications(this)">
+                    <i class="fas fa-chevron-down"></i> Load more
+                </button>
+            </div>
+        `;
+    }
     applicationsResult.innerHTML = html;
 }
 
@@ -254,7 +254,7 @@ atsForm.addEventListener('submit', async (e) => {
     
     try {
         const formData = new FormData();
-        formData.append('resume', atsResume.files[0]);
+        await appendResume(formData, atsResume.files[0]);
         formData.append('job_description', atsJd.value.trim());
         
         // Use the common API function
@@ -371,7 +371,7 @@ jobsForm.addEventListener('submit', async (e) => {
     
     try {
         const formData = new FormData();
-        formData.append('resume', jobsResume.files[0]);
+        await appendResume(formData, jobsResume.files[0]);
         formData.append('experience_years', jobsExperience.value);
         formData.append('location', jobsLocation.value.trim());
         
@@ -379,38 +379,30 @@ jobsForm.addEventListener('submit', async (e) => {
             formData.append('job_type', jobsType.value);
         }
         
-        // Use the common API function
-        const data = await callApi(`${API_BASE_URL}/tools/job_finder`, 'POST', formData);
-        console.log('Job finder response:', typeof data, data);
+        // Stream the results so each job is shown as soon as the model finishes it
+        const response = await fetch(`${API_BASE_URL}/tools/job_finder/stream`, {
+            method: 'POST',
+            body: formData
+        });
         
-        // Try to fix potential truncated JSON response
-        let processedData = data;
-        if (typeof data === 'string') {
-            try {
-                // Check if the string ends with a valid JSON ending
-                if (!data.trim().endsWith(']') && !data.trim().endsWith('}')) {
-                    // Try to find the last complete JSON object or array
-                    const lastValidBrace = data.lastIndexOf('}');
-                    const lastValidBracket = data.lastIndexOf(']');
-                    const lastValid = Math.max(lastValidBrace, lastValidBracket);
-                    
-                    if (lastValid > 0) {
-                        // Extract valid JSON part
-                        const fixedJson = data.substring(0, lastValid + 1);
-                        console.log('Attempting to fix truncated JSON:', fixedJson);
-                        processedData = JSON.parse(fixedJson);
-                    }
-                } else {
-                    // If it ends properly, just parse it
-                    processedData = JSON.parse(data);
-                }
-            } catch (e) {
-                console.error('Error fixing JSON:', e);
-                // Continue with original data
-            }
+        if (!response.ok || !response.body) {
+            throw new Error('Failed to search for jobs');
         }
         
-        displayJobsResult(processedData);
+        const jobs = [];
+        let streamError = null;
+        await readNdjson(response, (record) => {
+            if (record.error) {
+                streamError = record.error;
+            } else if (record.job) {
+                jobs.push(record.job);
+                displayJobsResult(jobs);
+            }
+        });
+        
+        if (jobs.length === 0) {
+            displayJobsResult({ error: streamError || 'No jobs were found. Please try again.' });
+        }
         
     } catch (error) {
         console.error('Error finding jobs:', error);
@@ -1103,20 +1095,34 @@ coverForm.addEventListener('submit', async (e) => {
     
     try {
         const formData = new FormData();
-        formData.append('resume', coverResume.files[0]);
+        await appendResume(formData, coverResume.files[0]);
         formData.append('job_description', coverJd.value.trim());
         
-        const response = await fetch(`${API_BASE_URL}/tools/cover_letter_generator`, {
+        // Stream the letter so text appears as soon as the model starts writing
+        const response = await fetch(`${API_BASE_URL}/tools/cover_letter_generator/stream`, {
             method: 'POST',
             body: formData
         });
         
-        if (!response.ok) {
+        if (!response.ok || !response.body) {
             throw new Error('Failed to generate cover letter');
         }
         
-        const data = await response.json();
-        displayCoverLetterResult(data);
+        let coverLetterText = '';
+        await readServerSentEvents(response, (event, data) => {
+            if (event === 'chunk') {
+                coverLetterText += data.text;
+                coverResult.innerHTML = `
+                    <div class="cover-letter">
+                        ${coverLetterText.replace(/\n/g, '<br>')}
+                    </div>
+                `;
+            } else if (event === 'error') {
+                displayCoverLetterResult({ error: data.error });
+            } else if (event === 'done') {
+                displayCoverLetterResult({ cover_letter: coverLetterText });
+            }
+        });
         
     } catch (error) {
         console.error('Error generating cover letter:', error);
@@ -1128,6 +1134,76 @@ coverForm.addEventListener('submit', async (e) => {
     }
 });
 
+// Resume ids from POST /resumes, so each file is uploaded and extracted only once
+const resumeIds = new Map();
+
+// Add a resume to a tool request by its stored id, uploading the file the first time it is used
+async function appendResume(formData, file) {
+    const key = `${file.name}:${file.size}:${file.lastModified}`;
+    if (!resumeIds.has(key)) {
+        const uploadData = new FormData();
+        uploadData.append('resume', file);
+        const stored = await callApi(`${API_BASE_URL}/resumes`, 'POST', uploadData);
+        resumeIds.set(key, stored.resume_id);
+    }
+    formData.append('resume_id', resumeIds.get(key));
+}
+
+// Read a newline-delimited JSON response body, calling onRecord(record) for each line
+async function readNdjson(response, onRecord) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        
+        let newline;
+        while ((newline = buffer.indexOf('\n')) !== -1) {
+            const line = buffer.slice(0, newline).trim();
+            buffer = buffer.slice(newline + 1);
+            if (line) {
+                onRecord(JSON.parse(line));
+            }
+        }
+    }
+    if (buffer.trim()) {
+        onRecord(JSON.parse(buffer));
+    }
+}
+
+// Read a Server-Sent Events response body, calling onEvent(event, data) for each message
+async function readServerSentEvents(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const message = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            
+            let event = 'message';
+            let data = '';
+            for (const line of message.split('\n')) {
+                if (line.startsWith('event: ')) {
+                    event = line.slice(7);
+                } else if (line.startsWith('data: ')) {
+                    data += line.slice(6);
+                }
+            }
+            onEvent(event, data ? JSON.parse(data) : {});
+        }
+    }
+}
+
 function displayCoverLetterResult(data) {
     if (data.error) {
         coverResult.innerHTML = `